@@ -22,7 +22,23 @@ The following functions are provided directly
    ext_thiem3D
    ext_theis3D
    diskmodel
+   superpose_wells
+   grid_solution
    stehfest
+   talbot
+   fourier
+   gaver
+
+Classes
+-------
+The following classes are provided directly
+
+.. autosummary::
+
+   Theis
+   ExtTheis2D
+   ExtTheis3D
+   DiskModel
 
 Subpackages
 -----------
@@ -41,8 +57,9 @@ from __future__ import absolute_import
 from anaflow.gwsolutions import (thiem, theis,
                                  ext_thiem2D, ext_theis2D,
                                  ext_thiem3D, ext_theis3D,
-                                 diskmodel)
-from anaflow.laplace import (stehfest)
+                                 diskmodel, superpose_wells, grid_solution,
+                                 Theis, ExtTheis2D, ExtTheis3D, DiskModel)
+from anaflow.laplace import (stehfest, talbot, fourier, gaver)
 
 __all__ = ["thiem", "theis",
            "ext_thiem2D",
@@ -50,6 +67,15 @@ __all__ = ["thiem", "theis",
            "ext_thiem3D",
            "ext_theis3D",
            "diskmodel",
-           "stehfest"]
+           "superpose_wells",
+           "grid_solution",
+           "stehfest",
+           "talbot",
+           "fourier",
+           "gaver",
+           "Theis",
+           "ExtTheis2D",
+           "ExtTheis3D",
+           "DiskModel"]
 
 __version__ = '0.2.4'
@@ -0,0 +1,239 @@
+# -*- coding: utf-8 -*-
+"""
+Anaflow subpackage providing compiled kernels for the Laplace-space solver.
+
+.. currentmodule:: anaflow._kernels
+
+If `numba <https://numba.pydata.org>`_ is installed, the kernels are
+compiled on first use, the Laplace-points are processed in parallel and the
+compiled code is cached on disk. Otherwise the pure numpy-solver of
+:mod:`anaflow.gwsolutions` is used.
+The compiled kernels can be switched off by setting ``USE_NUMBA = False``.
+
+The bessel functions can't be called from compiled code, so their values
+are evaluated by scipy beforehand (vectorized over all Laplace-points and
+radii) and passed to the kernels, that do the assembly of the equation
+systems, the elimination and the evaluation of the heads.
+
+Functions
+---------
+The following functions are provided
+
+.. autosummary::
+
+   disk_solve
+   disk_heads
+   banded_solve
+"""
+
+from __future__ import absolute_import, division, print_function
+
+import numpy as np
+
+try:
+    import numba as nb
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+__all__ = ["HAS_NUMBA", "USE_NUMBA", "disk_solve", "disk_heads",
+           "banded_solve"]
+
+# use the compiled kernels by default, if numba is present
+USE_NUMBA = HAS_NUMBA
+
+if HAS_NUMBA:
+    prange = nb.prange
+    # "numpy" error-model: singular systems result in non-finite values
+    _jit = nb.njit(parallel=True, cache=True, error_model="numpy")
+    _jit_inner = nb.njit(cache=True, error_model="numpy")
+else:
+    prange = range
+
+    def _jit(func):
+        # plain python fallback (only used for testing the kernels)
+        return func
+
+    _jit_inner = _jit
+
+
+@_jit_inner
+def _eliminate(A, b, x):
+    # solve one banded system in row-storage A[i, k] = M[i, i+k-2]
+    # (with two extra columns for the fill-in from pivoting and two extra
+    # rows to keep the elimination window in bounds) by gaussian
+    # elimination with partial pivoting, A and b are overwritten
+    size = x.shape[0]
+
+    # forward elimination on the 3x5 window of each column
+    for j in range(size):
+        # partial pivoting: swap the row with the largest entry to top
+        piv = 0
+        for d in range(1, 3):
+            if abs(A[j+d, 2-d]) > abs(A[j+piv, 2-piv]):
+                piv = d
+        if piv > 0:
+            for k in range(5):
+                tmp = A[j, 2+k]
+                A[j, 2+k] = A[j+piv, 2-piv+k]
+                A[j+piv, 2-piv+k] = tmp
+            tmp = b[j]
+            b[j] = b[j+piv]
+            b[j+piv] = tmp
+
+        # eliminate the entries below the pivot
+        for d in range(1, 3):
+            fac = A[j+d, 2-d]/A[j, 2]
+            for k in range(5):
+                A[j+d, 2-d+k] -= fac*A[j, 2+k]
+            b[j+d] -= fac*b[j]
+
+    # backward substitution with the upper bandwidth of 4
+    for j in range(size-1, -1, -1):
+        res = b[j]
+        for k in range(1, min(5, size-j)):
+            res -= A[j, 2+k]*x[j+k]
+        x[j] = res/A[j, 2]
+
+
+@_jit
+def banded_solve(Mb, V):
+    '''
+    Solve a stack of banded linear equation systems.
+
+    This is the compiled counterpart of
+    :func:`anaflow.gwsolutions._banded_solve`: each system is solved by
+    gaussian elimination with partial pivoting in its own loop-iteration,
+    which runs in parallel over all systems.
+
+    Parameters
+    ----------
+    Mb : :class:`numpy.ndarray`
+        Banded matrices with shape ``(n_sys, 5, n)``
+    V : :class:`numpy.ndarray`
+        Right hand sides with shape ``(n_sys, n)`` and the dtype of `Mb`
+
+    Returns
+    -------
+    X : :class:`numpy.ndarray`
+        Solutions with shape ``(n_sys, n)``.
+        Singular systems result in non-finite values.
+    '''
+
+    n_sys, size = V.shape
+    X = np.zeros_like(V)
+
+    for si in prange(n_sys):
+        A = np.zeros((size+2, 7), dtype=V.dtype)
+        b = np.zeros(size+2, dtype=V.dtype)
+        for i in range(size):
+            b[i] = V[si, i]
+            for k in range(5):
+                if 0 <= i+k-2 < size:
+                    A[i, k] = Mb[si, 4-k, i+k-2]
+        _eliminate(A, b, X[si])
+
+    return X
+
+
+@_jit
+def disk_solve(Bi, Bo, tmp, well, outer, Qs):
+    '''
+    Assemble and solve the equation systems of the diskmodel.
+
+    This is the compiled counterpart of
+    :func:`anaflow.gwsolutions._lap_matrix_solve` for the banded solver:
+    each Laplace-point is assembled from the given bessel values and solved
+    in its own loop-iteration, which runs in parallel over all points.
+
+    Parameters
+    ----------
+    Bi : :class:`numpy.ndarray`
+        Scaled ``i0, i1, k0, k1`` at the interfaces from the inside
+        with shape ``(n_s, 4, parts-1)``
+    Bo : :class:`numpy.ndarray`
+        Scaled ``i0, i1, k0, k1`` at the interfaces from the outside
+        with shape ``(n_s, 4, parts-1)``
+    tmp : :class:`numpy.ndarray`
+        Ratios of the consecutive fluxes with shape ``(n_s, parts-1)``
+    well : :class:`numpy.ndarray`
+        Coefficients of ``a_0, b_0`` in the condition at the well
+        with shape ``(n_s, 2)``
+    outer : :class:`numpy.ndarray`
+        Coefficients of ``a_n, b_n`` in the condition at the outer boundary
+        with shape ``(n_s, 2)``
+    Qs : :class:`numpy.ndarray`
+        Pumping-condition at the well with shape ``(n_s,)``
+
+    Returns
+    -------
+    X : :class:`numpy.ndarray`
+        Scaled coefficients ``[a_0, b_0, a_1, b_1, ...]`` in each disk
+        with shape ``(n_s, 2*parts)``
+        (see :func:`anaflow.gwsolutions._disk_unscale`).
+        Singular systems result in non-finite values.
+    '''
+
+    n_s = Qs.shape[0]
+    size = 2*(tmp.shape[1] + 1)
+    X = np.zeros((n_s, size), dtype=Bi.dtype)
+
+    for si in prange(n_s):
+        # the matrix in row-storage: A[i, k] = M[i, i+k-2]
+        A = np.zeros((size+2, 7), dtype=Bi.dtype)
+        b = np.zeros(size+2, dtype=Bi.dtype)
+        b[0] = Qs[si]
+        # condition at the well (row 0) and the outer boundary (last row)
+        A[0, 2] = well[si, 0]
+        A[0, 3] = well[si, 1]
+        A[size-1, 1] = outer[si, 0]
+        A[size-1, 2] = outer[si, 1]
+        # continuity of head (row 2j+1) and flux (row 2j+2) at interface j
+        for j in range(tmp.shape[1]):
+            A[2*j+1, 1] = Bi[si, 0, j]
+            A[2*j+1, 2] = Bi[si, 2, j]
+            A[2*j+1, 3] = -Bo[si, 0, j]
+            A[2*j+1, 4] = -Bo[si, 2, j]
+            A[2*j+2, 0] = tmp[si, j]*Bi[si, 1, j]
+            A[2*j+2, 1] = -tmp[si, j]*Bi[si, 3, j]
+            A[2*j+2, 2] = -Bo[si, 1, j]
+            A[2*j+2, 3] = Bo[si, 3, j]
+        _eliminate(A, b, X[si])
+
+    return X
+
+
+@_jit
+def disk_heads(A, B, i0_val, k0_val):
+    '''
+    Heads of the diskmodel in Laplace-space from the coefficients.
+
+    Parameters
+    ----------
+    A : :class:`numpy.ndarray`
+        Flat array of the coefficients of ``i0`` at each point
+    B : :class:`numpy.ndarray`
+        Flat array of the coefficients of ``k0`` at each point
+    i0_val : :class:`numpy.ndarray`
+        Values of ``i0`` at each point (only used for non-zero `A`)
+    k0_val : :class:`numpy.ndarray`
+        Values of ``k0`` at each point
+
+    Returns
+    -------
+    res : :class:`numpy.ndarray`
+        The heads at each point, where non-finite values are set to 0.
+    '''
+
+    res = np.zeros(A.shape[0], dtype=A.dtype)
+
+    for i in prange(A.shape[0]):
+        head = B[i]*k0_val[i]
+        # the i0-term only contributes with a non-vanishing coefficient
+        if A[i] != 0.0:
+            head += A[i]*i0_val[i]
+        # the algorithm tends to violate small values, so they are set to 0
+        if np.isfinite(head.real) and np.isfinite(head.imag):
+            res[i] = head
+
+    return res
@@ -17,24 +17,51 @@ The following functions are provided
    ext_theis2D
    ext_theis3D
    diskmodel
+   superpose_wells
+   grid_solution
    lap_transgwflow_cyl
+   lap_coeffs
+   lap_heads
+   coeff_cache_info
+   coeff_cache_clear
+   response_cache_info
+   response_cache_clear
+   partition_cache_info
+   partition_cache_clear
+
+Classes
+-------
+The following classes are provided
+
+.. autosummary::
+
+   TransientModel
+   Theis
+   ExtTheis2D
+   ExtTheis3D
+   DiskModel
 
 """
 
 from __future__ import absolute_import, division, print_function
 
 import warnings
+import threading
+from collections import OrderedDict, namedtuple
+from functools import partial, wraps
 
 import numpy as np
 import scipy.sparse as sps
-from scipy.special import (i0, i1, k0, k1, exp1, expi)
+from scipy.special import (i0, i1, k0, k1, i0e, i1e, k0e, k1e, exp1, expi,
+                           iv, kv, ive, kve)
 
-from anaflow.laplace import stehfest as sf
+from anaflow import _kernels
+from anaflow.laplace import (stehfest as sf, talbot, fourier, gaver, _pool,
+                             _unique_points, _fourier_grid)
 from anaflow.helper import (well_solution, aniso, radii,
-                            rad_hmean_func,
                             specialrange_cut,
-                            T_CG, T_CG_error,
-                            K_CG, K_CG_error)
+                            T_CG, T_CG_error, T_CG_hmean,
+                            K_CG_error, K_CG_hmean)
 
 # ignore Umpfack warnings for almost singular matrices
 try:
@@ -47,7 +74,88 @@ except ImportError:
 
 __all__ = ["thiem", "ext_thiem2D", "ext_thiem3D",
            "theis", "ext_theis2D", "ext_theis3D",
-           "diskmodel", "lap_transgwflow_cyl"]
+           "diskmodel", "lap_transgwflow_cyl", "lap_coeffs", "lap_heads",
+           "coeff_cache_info", "coeff_cache_clear",
+           "response_cache_info", "response_cache_clear",
+           "partition_cache_info", "partition_cache_clear",
+           "superpose_wells", "grid_solution",
+           "TransientModel", "Theis", "ExtTheis2D", "ExtTheis3D",
+           "DiskModel"]
+
+# maximal number of cached partitions of the extended Theis solutions
+PART_CACHE_SIZE = 256
+# maximal number of cached coefficient-tables of the Laplace-space solution
+COEFF_CACHE_SIZE = 32
+# maximal number of cached unit-responses of the transient models
+RESPONSE_CACHE_SIZE = 32
+
+_CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "maxsize",
+                                      "currsize"])
+
+
+def _lru_cache(maxsize, key=None):
+    '''
+    Thread-safe least-recently-used cache for a function.
+
+    This is used for the partitions, the coefficient-tables and the
+    unit-responses. Like :any:`functools.lru_cache` (which isn't
+    available in python 2), the decorated function gets the methods
+    ``cache_info()`` and ``cache_clear()``.
+    The function is called outside of the lock, so other threads are not
+    blocked by a long calculation.
+
+    Parameters
+    ----------
+    maxsize : :class:`int`
+        Maximal number of cached results.
+    key : :any:`callable` or :any:`None`, optional
+        Function to create a hashable key from the positional arguments.
+        Default: the tuple of the arguments
+
+    Returns
+    -------
+    :any:`callable`
+        The decorator.
+    '''
+
+    def decorator(func):
+        cache = OrderedDict()
+        stats = {"hits": 0, "misses": 0}
+        lock = threading.Lock()
+
+        @wraps(func)
+        def wrapper(*args):
+            ckey = args if key is None else key(*args)
+            with lock:
+                if ckey in cache:
+                    # mark as recently used
+                    res = cache.pop(ckey)
+                    cache[ckey] = res
+                    stats["hits"] += 1
+                    return res
+                stats["misses"] += 1
+            res = func(*args)
+            with lock:
+                cache[ckey] = res
+                while len(cache) > maxsize:
+                    cache.popitem(last=False)
+            return res
+
+        def cache_info():
+            with lock:
+                return _CacheInfo(stats["hits"], stats["misses"], maxsize,
+                                  len(cache))
+
+        def cache_clear():
+            with lock:
+                cache.clear()
+                stats.update(hits=0, misses=0)
+
+        wrapper.cache_info = cache_info
+        wrapper.cache_clear = cache_clear
+        return wrapper
+
+    return decorator
 
 
 ###############################################################################
@@ -375,7 +483,10 @@ def ext_thiem3D(rad, Rref,
 def theis(rad, time,
           T, S, Qw,
           struc_grid=True, rwell=0.0, rinf=np.inf, hinf=0.0,
-          stehfestn=12):
+          stehfestn=12, max_memory=None, stehfest_tol=None,
+          inversion="stehfest", n_jobs=None,
+          n_threads=None, exp1_tol=None, coeff_cache=False,
+          response_cache=False):
     '''
     The Theis solution for transient flow under a pumping condition
     in a confined and homogeneous aquifer.
@@ -392,8 +503,11 @@ def theis(rad, time,
         Given transmissivity of the aquifer
     S : :class:`float`
         Given storativity of the aquifer
-    Qw : :class:`float`
-        Pumpingrate at the well
+    Qw : :class:`float` or :class:`tuple`
+        Pumpingrate at the well. A variable pumpingrate can be given as a
+        schedule ``(tstart, rates)`` of piecewise-constant rates, where
+        ``rates[i]`` is pumped from ``tstart[i]`` on (e.g. the steps of a
+        step-test or a sampled series of rates).
     struc_grid : :class:`bool`, optional
         If this is set to ``False``, the `rad` and `time` array will be merged
         and interpreted as single, r-t points. In this case they need to have
@@ -410,6 +524,60 @@ def theis(rad, time,
         Laplace-space. The back-transformation is performed with the stehfest-
         algorithm. Here you can specify the number of interations within this
         algorithm. Default: ``12``
+    max_memory : :class:`int` or :any:`None`, optional
+        Approximate upper bound in bytes for the memory used within the
+        Laplace-space (if `rwell` or `rinf` are not default). If given,
+        the time- and radius-axis are split into blocks, that are inverted
+        one after another and written into the preallocated result.
+        Default: ``None``
+    stehfest_tol : :class:`float` or :any:`None`, optional
+        If `rwell` or `rinf` are not default and this is given, `stehfestn`
+        is the maximal number of interations within the stehfest-algorithm
+        and for each time-point the smallest sufficient one is used, where
+        the result changes less than this relative tolerance. Only possible
+        for ``struc_grid=True``. Default: ``None``
+    inversion : :class:`str`, optional
+        Algorithm for the numerical laplace-inversion. Either
+
+        * ``"stehfest"``: see :func:`anaflow.laplace.stehfest`
+        * ``"talbot"``: see :func:`anaflow.laplace.talbot`, which is
+          considerably more accurate for the same number of Laplace-points,
+          but needs complex Laplace-points
+        * ``"fourier"``: see :func:`anaflow.laplace.fourier`, which inverts
+          a uniformly spaced time-series at once with the FFT
+          (only for ``struc_grid=True``). For ``rwell=0`` only the deviation
+          from the theis-solution of the inner disk is inverted, otherwise
+          the time-step needs to resolve the early drawdown near the well.
+        * ``"gaver"``: see :func:`anaflow.laplace.gaver`, which uses the
+          real Laplace-points of the stehfest-algorithm, but accelerates
+          the convergence with the wynn-rho-algorithm
+          (``stehfestn >= 16`` recommended)
+
+        In all cases `stehfestn` gives the (approximate) number of
+        Laplace-points for each time-point. Default: ``"stehfest"``
+    n_jobs : :class:`int` or :any:`None`, optional
+        Number of worker-processes to evaluate the Laplace-space solution
+        in parallel. The Laplace-points (or the r-t points for
+        ``struc_grid=False``) are split into chunks, that are evaluated in a
+        process-pool. Default: ``None``
+    n_threads : :class:`int` or :any:`None`, optional
+        Number of threads to solve the equation systems in Laplace-space
+        with. This avoids the pickling overhead of `n_jobs`, since the
+        solvers release the GIL. Not possible with ``solver="sparse"``.
+        Default: ``None``
+    exp1_tol : :class:`float` or :any:`None`, optional
+        Relative tolerance for the fast approximation of the well-function,
+        if ``rwell=0`` and ``rinf=inf``.
+        See: :func:`anaflow.helper.well_function`. Default: ``None``
+    coeff_cache : :class:`bool`, optional
+        Whether to cache the coefficients in Laplace-space, so later calls
+        with new radii at the same time-points skip the equation systems.
+        See: :func:`lap_coeffs`. Default: ``False``
+    response_cache : :class:`bool`, optional
+        Whether to cache the response to a unit pumping rate at the given
+        radii and time-points, so later calls, that only differ in `Qw` or
+        `hinf`, are rescaled from it. See: :func:`response_cache_info`.
+        Default: ``False``
 
     Returns
     -------
@@ -437,72 +605,14 @@ def theis(rad, time,
            [-0.43105106, -0.32132823, -0.25778313]])
     '''
 
-    # ensure that 'rad' and 'time' are arrays
-    rad = np.squeeze(rad)
-    time = np.array(time).reshape(-1)
-
-    if not struc_grid:
-        grid_shape = rad.shape
-        rad = rad.reshape(-1)
-
-    # check the input
-    if rwell < 0.0:
-        raise ValueError(
-            "The wellradius needs to be >= 0")
-    if rinf <= rwell:
-        raise ValueError(
-            "The upper boundary needs to be greater than the wellradius")
-    if np.any(rad < rwell) or np.any(rad <= 0.0):
-        raise ValueError(
-            "The given radii need to be greater than the wellradius")
-    if np.any(time <= 0.0):
-        raise ValueError(
-            "The given times need to be > 0")
-    if not struc_grid and not rad.shape == time.shape:
-        raise ValueError(
-            "For unstructured grid the number of time- & radii-pts must equal")
-    if T <= 0.0:
-        raise ValueError(
-            "The Transmissivity needs to be positiv")
-    if S <= 0.0:
-        raise ValueError(
-            "The Storage needs to be positiv")
-    if not isinstance(stehfestn, int):
-        raise ValueError(
-            "The boundary for the Stehfest-algorithm needs to be an integer")
-    if stehfestn <= 1:
-        raise ValueError(
-            "The boundary for the Stehfest-algorithm needs to be > 1")
-    if stehfestn % 2 != 0:
-        raise ValueError(
-            "The boundary for the Stehfest-algorithm needs to be even")
-
-    if rwell == 0.0 and rinf == np.inf:
-        res = well_solution(rad, time, T, S, Qw)
-
-    else:
-        rpart = np.array([rwell, rinf])
-        Tpart = np.array([T])
-        Spart = np.array([S])
-
-        # write the paramters in kwargs to use the stehfest-algorithm
-        kwargs = {"rad": rad,
-                  "Qw": Qw,
-                  "rpart": rpart,
-                  "Spart": Spart,
-                  "Tpart": Tpart}
-
-        # call the stehfest-algorithm
-        res = sf(lap_transgwflow_cyl, time, bound=stehfestn, **kwargs)
-
-    # if the input are unstructured space-time points, return an array
-    if not struc_grid and len(grid_shape) > 0:
-        res = np.copy(np.diag(res).reshape(grid_shape))
-
-    # add the reference head
-    res += hinf
-
-    return res
+    return Theis(T, S, Qw,
+                 rwell=rwell, rinf=rinf, hinf=hinf,
+                 stehfestn=stehfestn, max_memory=max_memory,
+                 stehfest_tol=stehfest_tol, inversion=inversion,
+                 n_jobs=n_jobs, n_threads=n_threads,
+                 exp1_tol=exp1_tol,
+                 coeff_cache=coeff_cache,
+                 response_cache=response_cache)(rad, time, struc_grid)
 
 
 ###############################################################################
@@ -515,7 +625,11 @@ def ext_theis2D(rad, time,
                 struc_grid=True,
                 rwell=0.0, rinf=np.inf, hinf=0.0,
                 Twell=None, T_err=0.01,
-                prop=1.6, stehfestn=12, parts=30):
+                prop=1.6, stehfestn=12, parts=30, solver="banded",
+                max_memory=None, stehfest_tol=None,
+                inversion="stehfest", n_jobs=None,
+                n_threads=None, coeff_cache=False,
+                response_cache=False):
     '''
     The extended Theis solution for transient flow under
     a pumping condition in a confined aquifer.
@@ -537,8 +651,11 @@ def ext_theis2D(rad, time,
         corralation-length of transmissivity-distribution
     S : :class:`float`
         Given storativity of the aquifer
-    Qw : :class:`float`
-        Pumpingrate at the well
+    Qw : :class:`float` or :class:`tuple`
+        Pumpingrate at the well. A variable pumpingrate can be given as a
+        schedule ``(tstart, rates)`` of piecewise-constant rates, where
+        ``rates[i]`` is pumped from ``tstart[i]`` on (e.g. the steps of a
+        step-test or a sampled series of rates).
     struc_grid : :class:`bool`, optional
         If this is set to ``False``, the `rad` and `time` array will be merged
         and interpreted as single, r-t points. In this case they need to have
@@ -567,6 +684,59 @@ def ext_theis2D(rad, time,
         Since the solution is calculated by setting the transmissity to local
         constant values, one needs to specify the number of partitions of the
         transmissivity. Default: ``30``
+    solver : :class:`str`, optional
+        Solver for the equation system of the disks in Laplace-space.
+        One can choose between ``"banded"``, ``"sparse"`` and
+        ``"propagator"``. See: :func:`lap_transgwflow_cyl`.
+        Default: ``"banded"``
+    max_memory : :class:`int` or :any:`None`, optional
+        Approximate upper bound in bytes for the memory used within the
+        Laplace-space. If given, the time- and radius-axis are split into
+        blocks, that are inverted one after another and written into the
+        preallocated result. Default: ``None``
+    stehfest_tol : :class:`float` or :any:`None`, optional
+        If given, `stehfestn` is the maximal number of interations within the
+        stehfest-algorithm and for each time-point the smallest sufficient
+        one is used, where the result changes less than this relative
+        tolerance. Only possible for ``struc_grid=True``. Default: ``None``
+    inversion : :class:`str`, optional
+        Algorithm for the numerical laplace-inversion. Either
+
+        * ``"stehfest"``: see :func:`anaflow.laplace.stehfest`
+        * ``"talbot"``: see :func:`anaflow.laplace.talbot`, which is
+          considerably more accurate for the same number of Laplace-points,
+          but needs complex Laplace-points
+        * ``"fourier"``: see :func:`anaflow.laplace.fourier`, which inverts
+          a uniformly spaced time-series at once with the FFT
+          (only for ``struc_grid=True``). For ``rwell=0`` only the deviation
+          from the theis-solution of the inner disk is inverted, otherwise
+          the time-step needs to resolve the early drawdown near the well.
+        * ``"gaver"``: see :func:`anaflow.laplace.gaver`, which uses the
+          real Laplace-points of the stehfest-algorithm, but accelerates
+          the convergence with the wynn-rho-algorithm
+          (``stehfestn >= 16`` recommended)
+
+        In all cases `stehfestn` gives the (approximate) number of
+        Laplace-points for each time-point. Default: ``"stehfest"``
+    n_jobs : :class:`int` or :any:`None`, optional
+        Number of worker-processes to evaluate the Laplace-space solution
+        in parallel. The Laplace-points (or the r-t points for
+        ``struc_grid=False``) are split into chunks, that are evaluated in a
+        process-pool. Default: ``None``
+    n_threads : :class:`int` or :any:`None`, optional
+        Number of threads to solve the equation systems in Laplace-space
+        with. This avoids the pickling overhead of `n_jobs`, since the
+        solvers release the GIL. Not possible with ``solver="sparse"``.
+        Default: ``None``
+    coeff_cache : :class:`bool`, optional
+        Whether to cache the coefficients in Laplace-space, so later calls
+        with new radii at the same time-points skip the equation systems.
+        See: :func:`lap_coeffs`. Default: ``False``
+    response_cache : :class:`bool`, optional
+        Whether to cache the response to a unit pumping rate at the given
+        radii and time-points, so later calls, that only differ in `Qw` or
+        `hinf`, are rescaled from it. See: :func:`response_cache_info`.
+        Default: ``False``
 
     Returns
     -------
@@ -586,100 +756,19 @@ def ext_theis2D(rad, time,
     Example
     -------
     >>> ext_theis2D([1,2,3], [10,100], 0.001, 1, 10, 0.001, -0.001)
-    array([[-0.3381231 , -0.17430066, -0.09492601],
-           [-0.58557452, -0.40907021, -0.31112835]])
+    array([[-0.33737576, -0.17400123, -0.09489812],
+           [-0.58443489, -0.40847176, -0.31095166]])
     '''
 
-    # ensure that 'rad' and 'time' are arrays
-    rad = np.squeeze(rad)
-    time = np.array(time).reshape(-1)
-
-    if not struc_grid:
-        grid_shape = rad.shape
-        rad = rad.reshape(-1)
-
-    # check the input
-    if rwell < 0.0:
-        raise ValueError(
-            "The wellradius needs to be >= 0")
-    if rinf <= rwell:
-        raise ValueError(
-            "The upper boundary needs to be greater than the wellradius")
-    if np.any(rad < rwell) or np.any(rad <= 0.0):
-        raise ValueError(
-            "The given radii need to be greater than the wellradius")
-    if np.any(time <= 0.0):
-        raise ValueError(
-            "The given times need to be >= 0")
-    if not struc_grid and not rad.shape == time.shape:
-        raise ValueError(
-            "For unstructured grid the number of time- & radii-pts must equal")
-    if TG <= 0.0:
-        raise ValueError(
-            "The Transmissivity needs to be positiv")
-    if Twell is not None and Twell <= 0.0:
-        raise ValueError(
-            "The Transmissivity at the well needs to be positiv")
-    if sig2 <= 0.0:
-        raise ValueError(
-            "The variance needs to be positiv")
-    if corr <= 0.0:
-        raise ValueError(
-            "The correlationlength needs to be positiv")
-    if S <= 0.0:
-        raise ValueError(
-            "The Storage needs to be positiv")
-    if prop <= 0.0:
-        raise ValueError(
-            "The proportionalityfactor needs to be positiv")
-    if not isinstance(stehfestn, int):
-        raise ValueError(
-            "The boundary for the Stehfest-algorithm needs to be an integer")
-    if stehfestn <= 1:
-        raise ValueError(
-            "The boundary for the Stehfest-algorithm needs to be > 1")
-    if stehfestn % 2 != 0:
-        raise ValueError(
-            "The boundary for the Stehfest-algorithm needs to be even")
-    if not isinstance(parts, int):
-        raise ValueError(
-            "The numbor of partitions needs to be an integer")
-    if parts <= 1:
-        raise ValueError(
-            "The numbor of partitions needs to be at least 2")
-    if not 0.0 < T_err < 1.0:
-        raise ValueError(
-            "The relative error of Transmissivity needs to be within (0,1)")
-
-    # genearte rlast from a given relativ-error to farfield-transmissivity
-    rlast = T_CG_error(T_err, TG, sig2, corr, prop, Twell)
-
-    # generate the partition points
-    rpart = specialrange_cut(rwell, rinf, parts+1, rlast)
-
-    # calculate the harmonic mean transmissivity values within each partition
-    Tpart = rad_hmean_func(T_CG, rpart,
-                           TG=TG, sig2=sig2, corr=corr, prop=prop, Twell=Twell)
-
-    # write the paramters in kwargs to use the stehfest-algorithm
-    kwargs = {"rad": rad,
-              "Qw": Qw,
-              "rpart": rpart,
-              "Spart": S*np.ones(parts),
-              "Tpart": Tpart,
-              "Twell": T_CG(rwell, TG, sig2, corr, prop, Twell)}
-
-    # call the stehfest-algorithm
-    res = sf(lap_transgwflow_cyl, time, bound=stehfestn, **kwargs)
-
-    # if the input are unstructured space-time points, return an array
-    if not struc_grid and len(grid_shape) > 0:
-        res = np.copy(np.diag(res).reshape(grid_shape))
-
-    # add the reference head
-    res += hinf
-
-    return res
+    return ExtTheis2D(TG, sig2, corr, S, Qw,
+                      rwell=rwell, rinf=rinf, hinf=hinf,
+                      Twell=Twell, T_err=T_err,
+                      prop=prop, stehfestn=stehfestn, parts=parts,
+                      solver=solver, max_memory=max_memory,
+                      stehfest_tol=stehfest_tol, inversion=inversion,
+                      n_jobs=n_jobs, n_threads=n_threads,
+                      coeff_cache=coeff_cache,
+                      response_cache=response_cache)(rad, time, struc_grid)
 
 
 ###############################################################################
@@ -691,7 +780,11 @@ def ext_theis3D(rad, time,
                 struc_grid=True,
                 rwell=0.0, rinf=np.inf, hinf=0.0,
                 Kwell="KH", K_err=0.01,
-                prop=1.6, stehfestn=12, parts=30):
+                prop=1.6, stehfestn=12, parts=30, solver="banded",
+                max_memory=None, stehfest_tol=None,
+                inversion="stehfest", n_jobs=None,
+                n_threads=None, coeff_cache=False,
+                response_cache=False):
     '''
     The extended Theis solution for transient flow under
     a pumping condition in a confined aquifer.
@@ -716,8 +809,11 @@ def ext_theis3D(rad, time,
         Anisotropy-ratio of the vertical and horizontal corralation-lengths
     S : :class:`float`
         Given storativity of the aquifer
-    Qw : :class:`float`
-        Pumpingrate at the well
+    Qw : :class:`float` or :class:`tuple`
+        Pumpingrate at the well. A variable pumpingrate can be given as a
+        schedule ``(tstart, rates)`` of piecewise-constant rates, where
+        ``rates[i]`` is pumped from ``tstart[i]`` on (e.g. the steps of a
+        step-test or a sampled series of rates).
     L : :class:`float`
         Thickness of the aquifer
     struc_grid : :class:`bool`, optional
@@ -750,6 +846,59 @@ def ext_theis3D(rad, time,
         Since the solution is calculated by setting the transmissity to local
         constant values, one needs to specify the number of partitions of the
         transmissivity. Default: ``30``
+    solver : :class:`str`, optional
+        Solver for the equation system of the disks in Laplace-space.
+        One can choose between ``"banded"``, ``"sparse"`` and
+        ``"propagator"``. See: :func:`lap_transgwflow_cyl`.
+        Default: ``"banded"``
+    max_memory : :class:`int` or :any:`None`, optional
+        Approximate upper bound in bytes for the memory used within the
+        Laplace-space. If given, the time- and radius-axis are split into
+        blocks, that are inverted one after another and written into the
+        preallocated result. Default: ``None``
+    stehfest_tol : :class:`float` or :any:`None`, optional
+        If given, `stehfestn` is the maximal number of interations within the
+        stehfest-algorithm and for each time-point the smallest sufficient
+        one is used, where the result changes less than this relative
+        tolerance. Only possible for ``struc_grid=True``. Default: ``None``
+    inversion : :class:`str`, optional
+        Algorithm for the numerical laplace-inversion. Either
+
+        * ``"stehfest"``: see :func:`anaflow.laplace.stehfest`
+        * ``"talbot"``: see :func:`anaflow.laplace.talbot`, which is
+          considerably more accurate for the same number of Laplace-points,
+          but needs complex Laplace-points
+        * ``"fourier"``: see :func:`anaflow.laplace.fourier`, which inverts
+          a uniformly spaced time-series at once with the FFT
+          (only for ``struc_grid=True``). For ``rwell=0`` only the deviation
+          from the theis-solution of the inner disk is inverted, otherwise
+          the time-step needs to resolve the early drawdown near the well.
+        * ``"gaver"``: see :func:`anaflow.laplace.gaver`, which uses the
+          real Laplace-points of the stehfest-algorithm, but accelerates
+          the convergence with the wynn-rho-algorithm
+          (``stehfestn >= 16`` recommended)
+
+        In all cases `stehfestn` gives the (approximate) number of
+        Laplace-points for each time-point. Default: ``"stehfest"``
+    n_jobs : :class:`int` or :any:`None`, optional
+        Number of worker-processes to evaluate the Laplace-space solution
+        in parallel. The Laplace-points (or the r-t points for
+        ``struc_grid=False``) are split into chunks, that are evaluated in a
+        process-pool. Default: ``None``
+    n_threads : :class:`int` or :any:`None`, optional
+        Number of threads to solve the equation systems in Laplace-space
+        with. This avoids the pickling overhead of `n_jobs`, since the
+        solvers release the GIL. Not possible with ``solver="sparse"``.
+        Default: ``None``
+    coeff_cache : :class:`bool`, optional
+        Whether to cache the coefficients in Laplace-space, so later calls
+        with new radii at the same time-points skip the equation systems.
+        See: :func:`lap_coeffs`. Default: ``False``
+    response_cache : :class:`bool`, optional
+        Whether to cache the response to a unit pumping rate at the given
+        radii and time-points, so later calls, that only differ in `Qw` or
+        `hinf`, are rescaled from it. See: :func:`response_cache_info`.
+        Default: ``False``
 
     Returns
     -------
@@ -771,106 +920,88 @@ def ext_theis3D(rad, time,
     Example
     -------
     >>> ext_theis3D([1,2,3], [10,100], 0.001, 1, 10, 1, 0.001, -0.001, 1)
-    array([[-0.32845576, -0.16741654, -0.09134294],
-           [-0.54238241, -0.36982686, -0.27754856]])
+    array([[-0.32750933, -0.16714581, -0.09139578],
+           [-0.54154282, -0.36976076, -0.27793647]])
     '''
 
-    # ensure that 'rad' and 'time' are arrays
-    rad = np.squeeze(rad)
-    time = np.array(time).reshape(-1)
+    return ExtTheis3D(KG, sig2, corr, e, S, Qw, L,
+                      rwell=rwell, rinf=rinf, hinf=hinf,
+                      Kwell=Kwell, K_err=K_err,
+                      prop=prop, stehfestn=stehfestn, parts=parts,
+                      solver=solver, max_memory=max_memory,
+                      stehfest_tol=stehfest_tol, inversion=inversion,
+                      n_jobs=n_jobs, n_threads=n_threads,
+                      coeff_cache=coeff_cache,
+                      response_cache=response_cache)(rad, time, struc_grid)
 
-    if not struc_grid:
-        grid_shape = rad.shape
-        rad = rad.reshape(-1)
 
-    # check the input
-    if rwell < 0.0:
-        raise ValueError(
-            "The wellradius needs to be >= 0")
-    if rinf <= rwell:
-        raise ValueError(
-            "The upper boundary needs to be greater than the wellradius")
-    if np.any(rad < rwell) or np.any(rad <= 0.0):
-        raise ValueError(
-            "The given radii need to be greater than the wellradius")
-    if np.any(time <= 0.0):
-        raise ValueError(
-            "The given times need to be >= 0")
-    if not struc_grid and not rad.shape == time.shape:
-        raise ValueError(
-            "For unstructured grid the number of time- & radii-pts must equal")
-    if Kwell != "KA" and Kwell != "KH" and not isinstance(Kwell, float):
-        raise ValueError(
-            "The well-conductivity should be given as float or 'KA' resp 'KH'")
-    if isinstance(Kwell, float) and Kwell <= 0.:
-        raise ValueError(
-            "The well-conductivity needs to be positiv")
-    if KG <= 0.0:
-        raise ValueError(
-            "The conductivity needs to be positiv")
-    if sig2 <= 0.0:
-        raise ValueError(
-            "The variance needs to be positiv")
-    if corr <= 0.0:
-        raise ValueError(
-            "The correlationlength needs to be positiv")
-    if S <= 0.0:
-        raise ValueError(
-            "The Storage needs to be positiv")
-    if L <= 0.0:
-        raise ValueError(
-            "The aquifer-thickness needs to be positiv")
-    if prop <= 0.0:
-        raise ValueError(
-            "The proportionalityfactor needs to be positiv")
-    if not isinstance(stehfestn, int):
-        raise ValueError(
-            "The boundary for the Stehfest-algorithm needs to be an integer")
-    if stehfestn <= 1:
-        raise ValueError(
-            "The boundary for the Stehfest-algorithm needs to be > 1")
-    if stehfestn % 2 != 0:
-        raise ValueError(
-            "The boundary for the Stehfest-algorithm needs to be even")
-    if not isinstance(parts, int):
-        raise ValueError(
-            "The numbor of partitions needs to be an integer")
-    if parts <= 1:
-        raise ValueError(
-            "The numbor of partitions needs to be at least 2")
-    if not 0.0 < K_err < 1.0:
-        raise ValueError(
-            "The relative error of Transmissivity needs to be within (0,1)")
+###############################################################################
+# cached partitions of the extended Theis solutions
+###############################################################################
+
+def partition_cache_info():
+    '''
+    Statistics of the cached partitions of :func:`ext_theis2D` and
+    :func:`ext_theis3D`.
+
+    The partition points ``rpart`` and the mean values ``Tpart`` within
+    the partitions only depend on the aquifer parameters, the error
+    ``T_err``/``K_err``, ``parts``, ``rwell`` and ``rinf``.
+    They are stored in a least-recently-used cache with
+    ``PART_CACHE_SIZE`` entries, so repeated calls with new radii,
+    time-points or pumping rates skip the setup.
+
+    Returns
+    -------
+    :any:`collections.namedtuple`
+        The tuple ``(hits, misses, maxsize, currsize)``.
 
-    # genearte rlast from a given relativ-error to farfield-conductivity
-    rlast = K_CG_error(K_err, KG, sig2, corr, e, prop, Kwell=Kwell)
+    Example
+    -------
+    >>> partition_cache_clear()
+    >>> partition_cache_info()
+    CacheInfo(hits=0, misses=0, maxsize=256, currsize=0)
+    '''
+
+    return _cg_partition.cache_info()
 
-    # generate the partition points
-    rpart = specialrange_cut(rwell, rinf, parts+1, rlast)
 
-    # calculate the harmonic mean conductivity values within each partition
-    Tpart = rad_hmean_func(K_CG, rpart,
-                           KG=KG, sig2=sig2, corr=corr,
-                           e=e, prop=prop, Kwell=Kwell)
+def partition_cache_clear():
+    '''
+    Clear the cached partitions of :func:`ext_theis2D` and
+    :func:`ext_theis3D` and reset the statistics.
+
+    See: :func:`partition_cache_info`
+    '''
 
-    # write the paramters in kwargs to use the stehfest-algorithm
-    kwargs = {"rad": rad,
-              "Qw": Qw/L,
-              "rpart": rpart,
-              "Spart": S*np.ones(parts),
-              "Tpart": Tpart}
+    _cg_partition.cache_clear()
 
-    # call the stehfest-algorithm
-    res = sf(lap_transgwflow_cyl, time, bound=stehfestn, **kwargs)
 
-    # if the input are unstructured space-time points, return an array
-    if not struc_grid and len(grid_shape) > 0:
-        res = np.copy(np.diag(res).reshape(grid_shape))
+def _canonical(*args):
+    # hashable and unique values (floats) for the cache-keys
+    return tuple(arg if arg is None or isinstance(arg, str) else float(arg)
+                 for arg in args)
 
-    # add the reference head
-    res += hinf
 
-    return res
+@_lru_cache(PART_CACHE_SIZE)
+def _cg_partition(dim, val_g, sig2, corr, e, prop, val_well, err, parts,
+                  rwell, rinf):
+    # partitions and their harmonic means of the coarse-graining
+    # transmissivity (dim=2) or conductivity (dim=3)
+    parts = int(parts)
+    if dim == 2:
+        # genearte rlast from a given relativ-error to farfield-value
+        rlast = T_CG_error(err, val_g, sig2, corr, prop, val_well)
+        rpart = specialrange_cut(rwell, rinf, parts+1, rlast)
+        Tpart = T_CG_hmean(rpart, val_g, sig2, corr, prop, val_well)
+    else:
+        rlast = K_CG_error(err, val_g, sig2, corr, e, prop, Kwell=val_well)
+        rpart = specialrange_cut(rwell, rinf, parts+1, rlast)
+        Tpart = K_CG_hmean(rpart, val_g, sig2, corr, e, prop, val_well)
+    # the cached arrays are shared by all calls
+    rpart.flags.writeable = False
+    Tpart.flags.writeable = False
+    return rpart, Tpart
 
 
 ###############################################################################
@@ -880,7 +1011,10 @@ def ext_theis3D(rad, time,
 def diskmodel(rad, time,
               Tpart, Spart, Rpart, Qw,
               struc_grid=True, rwell=0.0, rinf=np.inf, hinf=0.0,
-              stehfestn=12):
+              stehfestn=12, solver="banded", max_memory=None,
+              stehfest_tol=None, inversion="stehfest", n_jobs=None,
+              n_threads=None, coeff_cache=False,
+              response_cache=False):
     '''
     A diskmodel for transient flow under a pumping condition
     in a confined aquifer. The solutions assumes concentric disks around the
@@ -899,8 +1033,11 @@ def diskmodel(rad, time,
         Given storativity values for each disk
     Rpart : :class:`numpy.ndarray`
         Given radii separating the disks
-    Qw : :class:`float`
-        Pumpingrate at the well
+    Qw : :class:`float` or :class:`tuple`
+        Pumpingrate at the well. A variable pumpingrate can be given as a
+        schedule ``(tstart, rates)`` of piecewise-constant rates, where
+        ``rates[i]`` is pumped from ``tstart[i]`` on (e.g. the steps of a
+        step-test or a sampled series of rates).
     struc_grid : :class:`bool`, optional
         If this is set to ``False``, the `rad` and `time` array will be merged
         and interpreted as single, r-t points. In this case they need to have
@@ -917,6 +1054,59 @@ def diskmodel(rad, time,
         back-transformation is performed with the stehfest-algorithm.
         Here you can specify the number of interations within this
         algorithm. Default: ``12``
+    solver : :class:`str`, optional
+        Solver for the equation system of the disks in Laplace-space.
+        One can choose between ``"banded"``, ``"sparse"`` and
+        ``"propagator"``. See: :func:`lap_transgwflow_cyl`.
+        Default: ``"banded"``
+    max_memory : :class:`int` or :any:`None`, optional
+        Approximate upper bound in bytes for the memory used within the
+        Laplace-space. If given, the time- and radius-axis are split into
+        blocks, that are inverted one after another and written into the
+        preallocated result. Default: ``None``
+    stehfest_tol : :class:`float` or :any:`None`, optional
+        If given, `stehfestn` is the maximal number of interations within the
+        stehfest-algorithm and for each time-point the smallest sufficient
+        one is used, where the result changes less than this relative
+        tolerance. Only possible for ``struc_grid=True``. Default: ``None``
+    inversion : :class:`str`, optional
+        Algorithm for the numerical laplace-inversion. Either
+
+        * ``"stehfest"``: see :func:`anaflow.laplace.stehfest`
+        * ``"talbot"``: see :func:`anaflow.laplace.talbot`, which is
+          considerably more accurate for the same number of Laplace-points,
+          but needs complex Laplace-points
+        * ``"fourier"``: see :func:`anaflow.laplace.fourier`, which inverts
+          a uniformly spaced time-series at once with the FFT
+          (only for ``struc_grid=True``). For ``rwell=0`` only the deviation
+          from the theis-solution of the inner disk is inverted, otherwise
+          the time-step needs to resolve the early drawdown near the well.
+        * ``"gaver"``: see :func:`anaflow.laplace.gaver`, which uses the
+          real Laplace-points of the stehfest-algorithm, but accelerates
+          the convergence with the wynn-rho-algorithm
+          (``stehfestn >= 16`` recommended)
+
+        In all cases `stehfestn` gives the (approximate) number of
+        Laplace-points for each time-point. Default: ``"stehfest"``
+    n_jobs : :class:`int` or :any:`None`, optional
+        Number of worker-processes to evaluate the Laplace-space solution
+        in parallel. The Laplace-points (or the r-t points for
+        ``struc_grid=False``) are split into chunks, that are evaluated in a
+        process-pool. Default: ``None``
+    n_threads : :class:`int` or :any:`None`, optional
+        Number of threads to solve the equation systems in Laplace-space
+        with. This avoids the pickling overhead of `n_jobs`, since the
+        solvers release the GIL. Not possible with ``solver="sparse"``.
+        Default: ``None``
+    coeff_cache : :class:`bool`, optional
+        Whether to cache the coefficients in Laplace-space, so later calls
+        with new radii at the same time-points skip the equation systems.
+        See: :func:`lap_coeffs`. Default: ``False``
+    response_cache : :class:`bool`, optional
+        Whether to cache the response to a unit pumping rate at the given
+        radii and time-points, so later calls, that only differ in `Qw` or
+        `hinf`, are rescaled from it. See: :func:`response_cache_info`.
+        Default: ``False``
 
     Returns
     -------
@@ -938,250 +1128,2024 @@ def diskmodel(rad, time,
            [-0.29785979, -0.18784251, -0.15582597]])
     '''
 
-    # ensure that input is treated as arrays
-    rad = np.squeeze(rad)
-    time = np.array(time).reshape(-1)
-    Tpart = np.array(Tpart)
-    Spart = np.array(Spart)
-    Rpart = np.array(Rpart)
-
-    if not struc_grid:
-        grid_shape = rad.shape
-        rad = rad.reshape(-1)
-
-    # check the input
-    if rwell < 0.0:
-        raise ValueError(
-            "The wellradius needs to be >= 0")
-    if rinf <= rwell:
-        raise ValueError(
-            "The upper boundary needs to be greater than the wellradius")
-    if not all(Rpart[i] < Rpart[i+1] for i in range(len(Rpart)-1)):
-        raise ValueError(
-            "The radii of the zones need to be sorted")
-    if np.any(Rpart <= rwell):
-        raise ValueError(
-            "The radii of the zones need to be greater than the wellradius")
-    if np.any(Rpart >= rinf):
-        raise ValueError(
-            "The radii of the zones need to be less than the outer radius")
-    if np.any(rad < rwell) or np.any(rad <= 0.0):
-        raise ValueError(
-            "The given radii need to be greater than the wellradius")
-    if np.any(time <= 0.0):
-        raise ValueError(
-            "The given times need to be >= 0")
-    if not struc_grid and not rad.shape == time.shape:
-        raise ValueError(
-            "For unstructured grid the number of time- & radii-pts must equal")
-    if np.any(Tpart <= 0.0):
-        raise ValueError(
-            "The Transmissivities need to be positiv")
-    if np.any(Spart <= 0.0):
-        raise ValueError(
-            "The Storages need to be positiv")
-    if not isinstance(stehfestn, int):
-        raise ValueError(
-            "The boundary for the Stehfest-algorithm needs to be an integer")
-    if stehfestn <= 1:
-        raise ValueError(
-            "The boundary for the Stehfest-algorithm needs to be > 1")
-    if stehfestn % 2 != 0:
-        raise ValueError(
-            "The boundary for the Stehfest-algorithm needs to be even")
+    return DiskModel(Tpart, Spart, Rpart, Qw,
+                     rwell=rwell, rinf=rinf, hinf=hinf,
+                     stehfestn=stehfestn, solver=solver,
+                     max_memory=max_memory, stehfest_tol=stehfest_tol,
+                     inversion=inversion, n_jobs=n_jobs,
+                     n_threads=n_threads,
+                     coeff_cache=coeff_cache,
+                     response_cache=response_cache)(rad, time, struc_grid)
 
-    rpart = np.append(np.array([rwell]), Rpart)
-    rpart = np.append(rpart, np.array([rinf]))
 
-    # write the paramters in kwargs to use the stehfest-algorithm
-    kwargs = {"rad": rad,
-              "Qw": Qw,
-              "rpart": rpart,
-              "Spart": Spart,
-              "Tpart": Tpart}
+###############################################################################
+# model classes with precomputed parameters for repeated evaluations
+###############################################################################
 
-    # call the stehfest-algorithm
-    res = sf(lap_transgwflow_cyl, time, bound=stehfestn, **kwargs)
+class TransientModel(object):
+    '''
+    Base class for transient solutions with precomputed parameters.
 
-    # if the input are unstructured space-time points, return an array
-    if not struc_grid and len(grid_shape) > 0:
-        res = np.copy(np.diag(res).reshape(grid_shape))
+    All parameters that don't depend on the radii and time-points are
+    checked and prepared once. Calling the model evaluates the solution
+    at the given radii and time-points.
+    Models only hold numpy arrays and plain values,
+    so they can be pickled and send to worker-processes.
 
-    # add the reference head
-    res += hinf
+    A pumping schedule ``Qw=(tstart, rates)`` is folded into the source term
+    in Laplace-space for the ``"fourier"`` inversion. The other algorithms
+    need smooth solutions in time, so the responses to the rate-changes are
+    superposed in time-space, where all shifted time-points are inverted at
+    once and coinciding ones (e.g. for regular sampling) only once.
 
-    return res
+    Parameters
+    ----------
+    rwell : :class:`float`, optional
+        Inner radius of the pumping-well. Default: ``0.0``
+    rinf : :class:`float`, optional
+        Radius of the outer boundary of the aquifer. Default: ``np.inf``
+    hinf : :class:`float`, optional
+        Reference head at the outer boundary ``rinf``. Default: ``0.0``
+    stehfestn : :class:`int`, optional
+        Number of Laplace-points for each time-point. Default: ``12``
+    max_memory : :class:`int` or :any:`None`, optional
+        Approximate upper bound in bytes for the memory used within the
+        Laplace-space. Default: ``None``
+    stehfest_tol : :class:`float` or :any:`None`, optional
+        Tolerance for the adaptive stehfest-algorithm. Default: ``None``
+    inversion : :class:`str`, optional
+        The inversion-algorithm. Default: ``"stehfest"``
+    n_jobs : :class:`int` or :any:`None`, optional
+        Number of worker-processes for the Laplace-space. Default: ``None``
+    n_threads : :class:`int` or :any:`None`, optional
+        Number of threads for the Laplace-space. Default: ``None``
+    coeff_cache : :class:`bool`, optional
+        Whether to cache the coefficients in Laplace-space, so new radii
+        can be evaluated at the same time-points without solving the
+        equation systems again. See: :func:`lap_coeffs`. Default: ``False``
+    response_cache : :class:`bool`, optional
+        Whether to cache the response to a unit pumping rate at the given
+        radii and time-points, so later calls, that only differ in `Qw` or
+        `hinf`, are rescaled from it. See: :func:`response_cache_info`.
+        Default: ``False``
+    '''
 
+    def __init__(self, rwell=0.0, rinf=np.inf, hinf=0.0,
+                 stehfestn=12, max_memory=None, stehfest_tol=None,
+                 inversion="stehfest", n_jobs=None, n_threads=None,
+                 coeff_cache=False, response_cache=False):
+        if rwell < 0.0:
+            raise ValueError(
+                "The wellradius needs to be >= 0")
+        if rinf <= rwell:
+            raise ValueError(
+                "The upper boundary needs to be greater than the wellradius")
+        if not isinstance(stehfestn, int):
+            raise ValueError(
+                "The boundary for the Stehfest-algorithm needs to be an "
+                "integer")
+        if stehfestn <= 1:
+            raise ValueError(
+                "The boundary for the Stehfest-algorithm needs to be > 1")
+        if stehfestn % 2 != 0:
+            raise ValueError(
+                "The boundary for the Stehfest-algorithm needs to be even")
+        if inversion not in ["stehfest", "talbot", "fourier", "gaver"]:
+            raise ValueError(
+                "The inversion needs to be 'stehfest', 'talbot', "
+                "'fourier' or 'gaver'")
+
+        self.rwell = rwell
+        self.rinf = rinf
+        self.hinf = hinf
+        self.stehfestn = stehfestn
+        self.max_memory = max_memory
+        self.stehfest_tol = stehfest_tol
+        self.inversion = inversion
+        self.n_jobs = n_jobs
+        self.response_cache = response_cache
+        # ratio of the source term in Laplace-space to the pumping rate
+        self.rate_scale = 1.0
+        # keyword-arguments for lap_transgwflow_cyl (set by the subclasses)
+        self.lap_kwargs = {"n_threads": n_threads,
+                           "coeff_cache": coeff_cache}
+
+    def __call__(self, rad, time, struc_grid=True):
+        '''
+        Evaluate the model.
+
+        Parameters
+        ----------
+        rad : :class:`numpy.ndarray`
+            Array with all radii where the function should be evaluated
+        time : :class:`numpy.ndarray`
+            Array with all time-points where the function should be evaluated
+        struc_grid : :class:`bool`, optional
+            If this is set to ``False``, the `rad` and `time` array will be
+            merged and interpreted as single, r-t points. In this case they
+            need to have the same shapes. Otherwise a structured r-t grid is
+            created. Default: ``True``
+
+        Returns
+        -------
+        :class:`numpy.ndarray`
+            Array with all heads at the given radii and time-points.
+        '''
+
+        # ensure that 'rad' and 'time' are arrays
+        rad = np.squeeze(rad)
+        time = np.array(time).reshape(-1)
+
+        if not struc_grid:
+            grid_shape = rad.shape
+            rad = rad.reshape(-1)
+
+        # check the input
+        if np.any(rad < self.rwell) or np.any(rad <= 0.0):
+            raise ValueError(
+                "The given radii need to be greater than the wellradius")
+        if np.any(time <= 0.0):
+            raise ValueError(
+                "The given times need to be > 0")
+        if not struc_grid and not rad.shape == time.shape:
+            raise ValueError(
+                "For unstructured grid the number of time- & radii-pts must "
+                "equal")
+
+        res = self._heads(rad, time, struc_grid)
+
+        # if the input are unstructured space-time points, return an array
+        if not struc_grid:
+            res = res.reshape(grid_shape)
+
+        # add the reference head
+        res += self.hinf
+
+        return res
+
+    def _heads(self, rad, time, struc_grid):
+        # heads relative to the reference head for the pumping rate
+        Qw = self.lap_kwargs["Qw"]
+        if not isinstance(Qw, tuple):
+            return self._response(rad, time, struc_grid, Qw)
+        if self._fold_schedule():
+            # the schedule is folded into the source term in Laplace-space
+            return self._solve(rad, time, struc_grid, Qw)
+        return self._superpose(rad, time, struc_grid, *Qw)
+
+    def _response(self, rad, time, struc_grid, Qw):
+        if self.response_cache:
+            # the solution is linear in the pumping rate
+            return Qw*_unit_response(self, rad, time, struc_grid)
+        return self._solve(rad, time, struc_grid, Qw)
+
+    def _superpose(self, rad, time, struc_grid, tstart, rates):
+        # superpose the unit responses of all rate-changes of a schedule,
+        # that are evaluated at once for the shifted time-points
+        changes = np.diff(np.append(0.0, rates))
+        shift = time[:, np.newaxis] - tstart
+        t_ind, k_ind = np.nonzero(shift > 0.0)
+        if not struc_grid:
+            res = np.zeros(time.shape)
+            if t_ind.size:
+                unit = self._response(rad[t_ind], shift[t_ind, k_ind],
+                                      False, 1.0)
+                np.add.at(res, t_ind, changes[k_ind]*np.reshape(unit, -1))
+            return res
+        res = np.zeros(time.shape + rad.shape)
+        if t_ind.size:
+            # coinciding shifts (e.g. for regular sampling) are solved once
+            t_uni, t_inv = _unique_points(shift[t_ind, k_ind], 1e-12)
+            unit = np.reshape(self._response(rad, t_uni, True, 1.0),
+                              t_uni.shape + rad.shape)
+            # the rate-changes are broadcasted against any shape of radii
+            dQ = changes[k_ind].reshape((-1,) + (1,)*rad.ndim)
+            np.add.at(res, t_ind, dQ*unit[t_inv])
+        return np.squeeze(res)
+
+    def _fold_schedule(self):
+        # only the fourier-series resolves the switching times of a schedule
+        # in Laplace-space, the other algorithms need smooth solutions
+        return self.inversion == "fourier"
+
+    def _solve(self, rad, time, struc_grid, Qw):
+        # call the stehfest-algorithm with the given pumping rate
+        return _lap_solution(rad, time, struc_grid, self.stehfestn,
+                             self.max_memory, self.stehfest_tol,
+                             self.inversion, self.n_jobs,
+                             **dict(self.lap_kwargs, Qw=Qw))
+
+    def _model_key(self):
+        # hashable parameters determining the response to a unit rate
+        # (without the rate, the reference head and the performance options)
+        lap = sorted((key, _array_key(val) if np.ndim(val) else val)
+                     for key, val in self.lap_kwargs.items()
+                     if key not in ["Qw", "n_threads", "coeff_cache"])
+        return (type(self).__name__, self.rwell, self.rinf, self.stehfestn,
+                self.stehfest_tol, self.inversion, tuple(lap))
+
+
+class Theis(TransientModel):
+    '''
+    The Theis solution with precomputed parameters.
 
-###############################################################################
-# The generic solver of the 2D radial transient groundwaterflow equation
-# in Laplace-space with a pumping condition and a fix zero boundary-head
-###############################################################################
+    See :func:`theis` for the parameters and :class:`TransientModel`
+    for the evaluation.
 
-def lap_transgwflow_cyl(s, rad=None, rpart=None,
-                        Spart=None, Tpart=None, Qw=None, Twell=None):
+    Example
+    -------
+    >>> model = Theis(0.001, 0.001, -0.001)
+    >>> model([1,2,3], [10,100])
+    array([[-0.24959541, -0.14506368, -0.08971485],
+           [-0.43105106, -0.32132823, -0.25778313]])
     '''
-    The solution of the diskmodel for transient flow under a pumping condition
-    in a confined aquifer in Laplace-space.
-    The solutions assumes concentric disks around the pumpingwell,
-    where each disk has its own transmissivity and storativity value.
 
-    Parameters
-    ----------
-    s : :class:`numpy.ndarray`
-        Array with all Laplace-space-points
-        where the function should be evaluated
-    rad : :class:`numpy.ndarray`
-        Array with all radii where the function should be evaluated
-    rpart : :class:`numpy.ndarray`
-        Given radii separating the disks as well as starting- and endpoints
-    Tpart : :class:`numpy.ndarray`
-        Given transmissivity values for each disk
-    Spart : :class:`numpy.ndarray`
-        Given storativity values for each disk
-    Qw : :class:`float`
-        Pumpingrate at the well
-    Twell : :class:`float`, optional
-        Transmissivity at the well. Default: ``Tpart[0]``
+    def __init__(self, T, S, Qw,
+                 rwell=0.0, rinf=np.inf, hinf=0.0,
+                 stehfestn=12, max_memory=None, stehfest_tol=None,
+                 inversion="stehfest", n_jobs=None,
+                 n_threads=None, exp1_tol=None, coeff_cache=False,
+                 response_cache=False):
+        super(Theis, self).__init__(rwell, rinf, hinf, stehfestn,
+                                    max_memory, stehfest_tol, inversion,
+                                    n_jobs, n_threads, coeff_cache,
+                                    response_cache)
+        if T <= 0.0:
+            raise ValueError(
+                "The Transmissivity needs to be positiv")
+        if S <= 0.0:
+            raise ValueError(
+                "The Storage needs to be positiv")
+
+        self.T = T
+        self.S = S
+        self.Qw = Qw
+        self.exp1_tol = exp1_tol
+        self.lap_kwargs.update({"Qw": _pumping_rate(Qw),
+                                "rpart": np.array([rwell, rinf]),
+                                "Spart": np.array([S]),
+                                "Tpart": np.array([T])})
+
+    def _solve(self, rad, time, struc_grid, Qw):
+        if self.rwell == 0.0 and self.rinf == np.inf:
+            return well_solution(rad, time, self.T, self.S, Qw,
+                                 struc_grid, exp1_tol=self.exp1_tol)
+        return super(Theis, self)._solve(rad, time, struc_grid, Qw)
+
+    def _fold_schedule(self):
+        # the closed-form solution is superposed in time-space
+        return (super(Theis, self)._fold_schedule()
+                and not (self.rwell == 0.0 and self.rinf == np.inf))
+
+    def _model_key(self):
+        return super(Theis, self)._model_key() + (self.exp1_tol,)
+
+
+class ExtTheis2D(TransientModel):
+    '''
+    The extended Theis solution in 2D with precomputed parameters.
 
-    Returns
-    -------
-    lap_transgwflow_cyl : :class:`numpy.ndarray`
-        Array with all values in laplace-space
+    The partitions and their mean transmissivities are calculated once.
+    See :func:`ext_theis2D` for the parameters and :class:`TransientModel`
+    for the evaluation.
 
     Example
     -------
-    >>> lap_transgwflow_cyl([5,10],[1,2,3],[0,2,10],[1e-3,1e-3],[1e-3,2e-3],-1)
-    array([[ -2.71359196e+00,  -1.66671965e-01,  -2.82986917e-02],
-           [ -4.58447458e-01,  -1.12056319e-02,  -9.85673855e-04]])
+    >>> model = ExtTheis2D(0.001, 1, 10, 0.001, -0.001)
+    >>> model([1,2,3], [10,100])
+    array([[-0.33737576, -0.17400123, -0.09489812],
+           [-0.58443489, -0.40847176, -0.31095166]])
     '''
 
-    # ensure that input is treated as arrays
-    s = np.squeeze(s).reshape(-1)
-    rad = np.squeeze(rad).reshape(-1)
-    rpart = np.squeeze(rpart).reshape(-1)
-    Spart = np.squeeze(Spart).reshape(-1)
-    Tpart = np.squeeze(Tpart).reshape(-1)
+    def __init__(self, TG, sig2, corr, S, Qw,
+                 rwell=0.0, rinf=np.inf, hinf=0.0,
+                 Twell=None, T_err=0.01,
+                 prop=1.6, stehfestn=12, parts=30, solver="banded",
+                 max_memory=None, stehfest_tol=None,
+                 inversion="stehfest", n_jobs=None,
+                 n_threads=None, coeff_cache=False,
+                 response_cache=False):
+        super(ExtTheis2D, self).__init__(rwell, rinf, hinf, stehfestn,
+                                         max_memory, stehfest_tol, inversion,
+                                         n_jobs, n_threads, coeff_cache,
+                                         response_cache)
+        if TG <= 0.0:
+            raise ValueError(
+                "The Transmissivity needs to be positiv")
+        if Twell is not None and Twell <= 0.0:
+            raise ValueError(
+                "The Transmissivity at the well needs to be positiv")
+        if sig2 <= 0.0:
+            raise ValueError(
+                "The variance needs to be positiv")
+        if corr <= 0.0:
+            raise ValueError(
+                "The correlationlength needs to be positiv")
+        if S <= 0.0:
+            raise ValueError(
+                "The Storage needs to be positiv")
+        if prop <= 0.0:
+            raise ValueError(
+                "The proportionalityfactor needs to be positiv")
+        if not isinstance(parts, int):
+            raise ValueError(
+                "The numbor of partitions needs to be an integer")
+        if parts <= 1:
+            raise ValueError(
+                "The numbor of partitions needs to be at least 2")
+        if not 0.0 < T_err < 1.0:
+            raise ValueError(
+                "The relative error of Transmissivity needs to be within "
+                "(0,1)")
+        if solver not in ["banded", "sparse", "propagator"]:
+            raise ValueError(
+                "The solver needs to be 'banded', 'sparse' or 'propagator'")
+
+        # generate the partition points and the harmonic mean transmissivity
+        # values within each partition (cached for repeated parameters)
+        rpart, Tpart = _cg_partition(*_canonical(2, TG, sig2, corr, None,
+                                                 prop, Twell, T_err, parts,
+                                                 rwell, rinf))
+
+        self.Qw = Qw
+        self.lap_kwargs.update({"Qw": _pumping_rate(Qw),
+                                "rpart": rpart,
+                                "Spart": S*np.ones(parts),
+                                "Tpart": Tpart,
+                                "Twell": T_CG(rwell, TG, sig2, corr, prop,
+                                              Twell),
+                                "solver": solver})
+
+
+class ExtTheis3D(TransientModel):
+    '''
+    The extended Theis solution in 3D with precomputed parameters.
 
-    # get the number of partitions
-    parts = len(Tpart)
+    The partitions and their mean conductivities are calculated once.
+    See :func:`ext_theis3D` for the parameters and :class:`TransientModel`
+    for the evaluation.
 
-    # initialize the result
-    res = np.zeros(s.shape + rad.shape)
+    Example
+    -------
+    >>> model = ExtTheis3D(0.001, 1, 10, 1, 0.001, -0.001, 1)
+    >>> model([1,2,3], [10,100])
+    array([[-0.32750933, -0.16714581, -0.09139578],
+           [-0.54154282, -0.36976076, -0.27793647]])
+    '''
 
-    # set the general pumping-condtion
-    if Twell is None:
-        Twell = Tpart[0]
-    Q = Qw/(2.0*np.pi*Twell)
+    def __init__(self, KG, sig2, corr, e, S, Qw, L,
+                 rwell=0.0, rinf=np.inf, hinf=0.0,
+                 Kwell="KH", K_err=0.01,
+                 prop=1.6, stehfestn=12, parts=30, solver="banded",
+                 max_memory=None, stehfest_tol=None,
+                 inversion="stehfest", n_jobs=None,
+                 n_threads=None, coeff_cache=False,
+                 response_cache=False):
+        super(ExtTheis3D, self).__init__(rwell, rinf, hinf, stehfestn,
+                                         max_memory, stehfest_tol, inversion,
+                                         n_jobs, n_threads, coeff_cache,
+                                         response_cache)
+        if Kwell != "KA" and Kwell != "KH" and not isinstance(Kwell, float):
+            raise ValueError(
+                "The well-conductivity should be given as float or 'KA' resp "
+                "'KH'")
+        if isinstance(Kwell, float) and Kwell <= 0.:
+            raise ValueError(
+                "The well-conductivity needs to be positiv")
+        if KG <= 0.0:
+            raise ValueError(
+                "The conductivity needs to be positiv")
+        if sig2 <= 0.0:
+            raise ValueError(
+                "The variance needs to be positiv")
+        if corr <= 0.0:
+            raise ValueError(
+                "The correlationlength needs to be positiv")
+        if S <= 0.0:
+            raise ValueError(
+                "The Storage needs to be positiv")
+        if L <= 0.0:
+            raise ValueError(
+                "The aquifer-thickness needs to be positiv")
+        if prop <= 0.0:
+            raise ValueError(
+                "The proportionalityfactor needs to be positiv")
+        if not isinstance(parts, int):
+            raise ValueError(
+                "The numbor of partitions needs to be an integer")
+        if parts <= 1:
+            raise ValueError(
+                "The numbor of partitions needs to be at least 2")
+        if not 0.0 < K_err < 1.0:
+            raise ValueError(
+                "The relative error of Transmissivity needs to be within "
+                "(0,1)")
+        if solver not in ["banded", "sparse", "propagator"]:
+            raise ValueError(
+                "The solver needs to be 'banded', 'sparse' or 'propagator'")
+
+        # generate the partition points and the harmonic mean conductivity
+        # values within each partition (cached for repeated parameters)
+        rpart, Tpart = _cg_partition(*_canonical(3, KG, sig2, corr, e, prop,
+                                                 Kwell, K_err, parts,
+                                                 rwell, rinf))
+
+        self.Qw = Qw
+        self.rate_scale = 1.0/L
+        self.lap_kwargs.update({"Qw": _pumping_rate(Qw, self.rate_scale),
+                                "rpart": rpart,
+                                "Spart": S*np.ones(parts),
+                                "Tpart": Tpart,
+                                "solver": solver})
+
+
+class DiskModel(TransientModel):
+    '''
+    The diskmodel with precomputed parameters.
 
-    # if there is a homgeneouse aquifer, compute the result by hand
-    if parts == 1:
-        # calculate the square-root of the diffusivities
-        difsr = np.sqrt(Spart[0]/Tpart[0])
+    See :func:`diskmodel` for the parameters and :class:`TransientModel`
+    for the evaluation.
 
-        for si, se in np.ndenumerate(s):
-            Cs = np.sqrt(se)*difsr
+    Example
+    -------
+    >>> model = DiskModel([1e-3, 2e-3], [1e-3, 1e-3], [2], -1e-3)
+    >>> model([1,2,3], [10,100])
+    array([[-0.20312814, -0.09605675, -0.06636862],
+           [-0.29785979, -0.18784251, -0.15582597]])
+    '''
 
-            # set the pumping-condition at the well
-            Qs = Q/se
+    def __init__(self, Tpart, Spart, Rpart, Qw,
+                 rwell=0.0, rinf=np.inf, hinf=0.0,
+                 stehfestn=12, solver="banded", max_memory=None,
+                 stehfest_tol=None, inversion="stehfest", n_jobs=None,
+                 n_threads=None, coeff_cache=False,
+                 response_cache=False):
+        super(DiskModel, self).__init__(rwell, rinf, hinf, stehfestn,
+                                        max_memory, stehfest_tol, inversion,
+                                        n_jobs, n_threads, coeff_cache,
+                                        response_cache)
+        Tpart = np.array(Tpart)
+        Spart = np.array(Spart)
+        Rpart = np.array(Rpart)
+
+        if not all(Rpart[i] < Rpart[i+1] for i in range(len(Rpart)-1)):
+            raise ValueError(
+                "The radii of the zones need to be sorted")
+        if np.any(Rpart <= rwell):
+            raise ValueError(
+                "The radii of the zones need to be greater than the "
+                "wellradius")
+        if np.any(Rpart >= rinf):
+            raise ValueError(
+                "The radii of the zones need to be less than the outer "
+                "radius")
+        if np.any(Tpart <= 0.0):
+            raise ValueError(
+                "The Transmissivities need to be positiv")
+        if np.any(Spart <= 0.0):
+            raise ValueError(
+                "The Storages need to be positiv")
+        if solver not in ["banded", "sparse", "propagator"]:
+            raise ValueError(
+                "The solver needs to be 'banded', 'sparse' or 'propagator'")
+
+        rpart = np.append(np.array([rwell]), Rpart)
+        rpart = np.append(rpart, np.array([rinf]))
+
+        self.Qw = Qw
+        self.lap_kwargs.update({"Qw": _pumping_rate(Qw),
+                                "rpart": rpart,
+                                "Spart": Spart,
+                                "Tpart": Tpart,
+                                "solver": solver})
 
-            # incorporate the boundary-conditions
-            if rpart[0] == 0.0:
-                Bs = Qs
-                if rpart[-1] == np.inf:
-                    As = 0.0
-                else:
-                    As = -Qs*k0(Cs*rpart[-1])/i0(Cs*rpart[-1])
 
-            else:
-                if rpart[-1] == np.inf:
-                    As = 0.0
-                    Bs = Qs/(Cs*rpart[0]*k1(Cs*rpart[0]))
-                else:
-                    det = i1(Cs*rpart[0])*k0(Cs*rpart[-1]) \
-                        + k1(Cs*rpart[0])*i0(Cs*rpart[-1])
-                    As = -Qs/(Cs*rpart[0])*k0(Cs*rpart[-1])/det
-                    Bs = Qs/(Cs*rpart[0])*i0(Cs*rpart[-1])/det
+###############################################################################
+# superposition of several pumping-wells
+###############################################################################
 
-            # calculate the head
-            for ri, re in np.ndenumerate(rad):
-                if re < rpart[-1]:
-                    res[si+ri] = As*i0(Cs*re) + Bs*k0(Cs*re)
+def superpose_wells(model, well_pos, obs_pos, time,
+                    rates=None, hinf=0.0, cutoff=None, kdtree=False):
+    '''
+    Superposition of the transient solutions of several pumping-wells.
 
-    # if there is more than one partition, create an equation system
+    The drawdowns of all wells at all observation-points are summed up.
+    The distances between the wells and the observation-points are computed
+    at once. Each model is only evaluated once at the unique distances
+    of its wells, so all observation-points share its Laplace-space solution.
+
+    Parameters
+    ----------
+    model : :class:`TransientModel` or :class:`list`
+        Transient model of the aquifer around the wells. Either one model
+        for all wells or a list with a model for each well.
+    well_pos : :class:`numpy.ndarray`
+        Coordinates of the wells with shape ``(n_wells, dim)``
+    obs_pos : :class:`numpy.ndarray`
+        Coordinates of the observation-points with shape ``(n_obs, dim)``
+    time : :class:`numpy.ndarray`
+        Array with all time-points where the function should be evaluated
+    rates : :class:`numpy.ndarray` or :any:`None`, optional
+        Pumpingrate of each well. If ``None``, the pumpingrates of the
+        models are used (pumping schedules are possible in this case).
+        Otherwise the models are evaluated for a unit pumpingrate, that is
+        scaled with these rates. Default: ``None``
+    hinf : :class:`float`, optional
+        Reference head, that is added to the summed drawdowns.
+        The reference heads of the models are ignored. Default: ``0.0``
+    cutoff : :class:`float` or :any:`None`, optional
+        Influence distance of the wells. Wells that are further away from
+        an observation-point are skipped. Default: ``None``
+    kdtree : :class:`bool`, optional
+        Whether to find the well-observation pairs within the `cutoff` with
+        a :any:`scipy.spatial.cKDTree`, which avoids the full distance
+        matrix for large well-fields. Needs a `cutoff`. Default: ``False``
+
+    Returns
+    -------
+    superpose_wells : :class:`numpy.ndarray`
+        Array with all heads at the given time-points and observation-points
+        with shape ``(n_time, n_obs)``.
+
+    Raises
+    ------
+    ValueError
+        If the number of models or rates doesn't match the number of wells.
+    ValueError
+        If the wells and the observation-points have different dimensions.
+    ValueError
+        If `cutoff` is not positive or missing for the `kdtree`.
+    ValueError
+        If an observation-point lies within the radius of a well.
+
+    Example
+    -------
+    >>> model = Theis(0.001, 0.001, 1.0)
+    >>> superpose_wells(model, [[0, 0], [10, 0]], [[2, 0], [5, 5]],
+    ...                 [10, 100], rates=[-0.001, -0.002])
+    array([[-0.15880008, -0.03495362],
+           [-0.54560725, -0.38756432]])
+    '''
+
+    well_pos = np.array(well_pos, dtype=float, ndmin=2)
+    obs_pos = np.array(obs_pos, dtype=float, ndmin=2)
+    time = np.array(time, dtype=float).reshape(-1)
+
+    n_wells, n_obs = well_pos.shape[0], obs_pos.shape[0]
+    if isinstance(model, TransientModel):
+        model = [model]*n_wells
+
+    # check the input
+    if len(model) != n_wells:
+        raise ValueError(
+            "The number of models needs to match the number of wells")
+    if rates is not None:
+        rates = np.array(rates, dtype=float).reshape(-1)
+        if rates.size != n_wells:
+            raise ValueError(
+                "The number of rates needs to match the number of wells")
+    if well_pos.shape[1] != obs_pos.shape[1]:
+        raise ValueError(
+            "The wells and the observation-points need the same dimension")
+    if cutoff is not None and cutoff <= 0.0:
+        raise ValueError(
+            "The influence distance needs to be positiv")
+    if kdtree and cutoff is None:
+        raise ValueError(
+            "The kd-tree needs an influence distance")
+    if np.any(time <= 0.0):
+        raise ValueError(
+            "The given times need to be > 0")
+
+    # all well-observation pairs within the influence distance
+    obs_ind, well_ind, dist = _well_pairs(well_pos, obs_pos, cutoff, kdtree)
+
+    # group the wells by their models to evaluate each model once
+    groups = {}
+    for i, mod in enumerate(model):
+        groups.setdefault(id(mod), (mod, []))[1].append(i)
+
+    res = np.zeros((time.size, n_obs))
+    for mod, wells in groups.values():
+        in_group = np.zeros(len(model), dtype=bool)
+        in_group[wells] = True
+        pair = in_group[well_ind]
+        if not np.any(pair):
+            continue
+        rad, rad_inv = np.unique(dist[pair], return_inverse=True)
+        if rad[0] <= max(mod.rwell, 0.0):
+            raise ValueError(
+                "The observation-points need to be outside of the wells")
+        if rates is None:
+            heads = mod._heads(rad, time, True)
+            weights = np.ones(rad_inv.size)
+        else:
+            heads = mod._response(rad, time, True, 1.0)
+            weights = mod.rate_scale*rates[well_ind[pair]]
+        # sum up the heads of all pairs for each observation-point
+        mat = sps.csr_matrix((weights, (rad_inv.reshape(-1), obs_ind[pair])),
+                             shape=(rad.size, n_obs))
+        res += mat.T.dot(np.reshape(heads, (time.size, rad.size)).T).T
+
+    return np.squeeze(res) + hinf
+
+
+def _well_pairs(well_pos, obs_pos, cutoff=None, kdtree=False):
+    '''
+    All pairs of observation-points and wells within the influence distance.
+
+    Parameters
+    ----------
+    well_pos : :class:`numpy.ndarray`
+        Coordinates of the wells with shape ``(n_wells, dim)``
+    obs_pos : :class:`numpy.ndarray`
+        Coordinates of the observation-points with shape ``(n_obs, dim)``
+    cutoff : :class:`float` or :any:`None`, optional
+        Influence distance of the wells. Default: ``None``
+    kdtree : :class:`bool`, optional
+        Whether to use a :any:`scipy.spatial.cKDTree`. Default: ``False``
+
+    Returns
+    -------
+    obs_ind : :class:`numpy.ndarray`
+        Indices of the observation-points
+    well_ind : :class:`numpy.ndarray`
+        Indices of the wells
+    dist : :class:`numpy.ndarray`
+        Distances between the observation-points and the wells
+    '''
+
+    if kdtree:
+        from scipy.spatial import cKDTree
+        pairs = cKDTree(obs_pos).sparse_distance_matrix(
+            cKDTree(well_pos), cutoff, output_type="ndarray")
+        return pairs["i"], pairs["j"], pairs["v"]
+
+    # full distance matrix with shape (n_obs, n_wells)
+    dist = np.zeros((obs_pos.shape[0], well_pos.shape[0]))
+    for dim in range(obs_pos.shape[1]):
+        dist += np.subtract.outer(obs_pos[:, dim], well_pos[:, dim])**2
+    dist = np.sqrt(dist)
+
+    if cutoff is None:
+        obs_ind, well_ind = np.indices(dist.shape).reshape(2, -1)
     else:
-        # initialize LHS and RHS for the linear equation system
-        # Mb is the banded matrix for the Eq-System
-        V = np.zeros(2*(parts))
-        Mb = np.zeros((5, 2*(parts)))
-        # the positions of the diagonals of the matrix set in Mb
-        diagpos = [2, 1, 0, -1, -2]
-        # set the standard boundary conditions for rwell=0.0 and rinf=np.inf
-        Mb[1, 1] = 1.0
-        Mb[-2, -2] = 1.0
-
-        # calculate the consecutive fractions of the transmissivities
-        Tfrac = Tpart[:-1]/Tpart[1:]
-
-        # calculate the square-root of the diffusivities
-        difsr = np.sqrt(Spart/Tpart)
-
-        # calculate a temporal substitution
-        tmp = Tfrac*difsr[:-1]/difsr[1:]
-
-        # match the radii to the different disks
-        pos = np.searchsorted(rpart, rad) - 1
-
-        # iterate over the laplace-variable
-        for si, se in enumerate(s):
-            Cs = np.sqrt(se)*difsr
-
-            # set the pumping-condition at the well
-            # TODO: implement other pumping conditions
-            V[0] = Q/se
-
-            # set the boundary-conditions if needed
-            if rpart[0] > 0.0:
-                Mb[1, 1] = Cs[0]*rpart[0]*k1(Cs[0]*rpart[0])
-                Mb[0, 2] = -Cs[0]*rpart[0]*i1(Cs[0]*rpart[0])
-            if rpart[-1] < np.inf:
-                Mb[-3, -1] = k0(Cs[-1]*rpart[-1])
-                Mb[-2, -2] = i0(Cs[-1]*rpart[-1])
-
-            # generate the equation system as banded matrix
-            for i in range(parts-1):
-                Mb[0, 2*i+3] = -k0(Cs[i+1]*rpart[i+1])
-                Mb[1, 2*i+2:2*i+4] = [-i0(Cs[i+1]*rpart[i+1]),
-                                      k1(Cs[i+1]*rpart[i+1])]
-                Mb[2, 2*i+1:2*i+3] = [k0(Cs[i]*rpart[i+1]),
-                                      -i1(Cs[i+1]*rpart[i+1])]
-                Mb[3, 2*i:2*i+2] = [i0(Cs[i]*rpart[i+1]),
-                                    -tmp[i]*k1(Cs[i]*rpart[i+1])]
-                Mb[4, 2*i] = tmp[i]*i1(Cs[i]*rpart[i+1])
+        obs_ind, well_ind = np.nonzero(dist <= cutoff)
+    return obs_ind, well_ind, dist[obs_ind, well_ind]
+
+
+###############################################################################
+# evaluation on cartesian grids around a pumping-well
+###############################################################################
+
+def grid_solution(model, x, y, time, x0=0.0, y0=0.0, rtol=None):
+    '''
+    Transient solution of a model on a cartesian grid around the well.
+
+    The solution only depends on the distance to the well, so it is only
+    evaluated at the unique radii of the grid, that are then scattered back
+    to the grid. The mirror symmetry along the axes, the octant symmetry and
+    the identical radii across the rows are exploited this way.
+    Optionally the solution is interpolated in log-radius from a sample,
+    that is refined until a given tolerance is met.
+
+    Parameters
+    ----------
+    model : :class:`TransientModel`
+        Transient model of the aquifer around the well
+    x : :class:`numpy.ndarray`
+        The x-axis of the grid
+    y : :class:`numpy.ndarray`
+        The y-axis of the grid
+    time : :class:`numpy.ndarray`
+        Array with all time-points where the function should be evaluated
+    x0 : :class:`float`, optional
+        x-coordinate of the well. Default: ``0.0``
+    y0 : :class:`float`, optional
+        y-coordinate of the well. Default: ``0.0``
+    rtol : :class:`float` or :any:`None`, optional
+        If given, the solution is evaluated at log-spaced radii and
+        interpolated by cubic splines in log-radius. The number of radii
+        is doubled, until the interpolation error at the new radii is below
+        `rtol` times the maximal absolute head relative to `hinf`.
+        Otherwise all unique radii are evaluated. Default: ``None``
+
+    Returns
+    -------
+    grid_solution : :class:`numpy.ndarray`
+        Array with all heads with shape ``(n_time, n_x, n_y)``.
+        Cells within the well are set to ``nan``.
+
+    Raises
+    ------
+    ValueError
+        If `rtol` is not within (0, 1).
+
+    Notes
+    -----
+    With `rtol`, the costs are independent of the size of the grid.
+    A 4000x4000 grid typically needs a few hundred radii for ``1e-6``,
+    so the costs are dominated by the interpolation and scattering.
+
+    Example
+    -------
+    >>> model = Theis(0.001, 0.001, -0.001)
+    >>> grid_solution(model, [-2, -1, 0, 1, 2], [1, 2], 100)
+    array([[-0.30376886, -0.26695916],
+           [-0.37609073, -0.30376886],
+           [-0.43105106, -0.32132823],
+           [-0.37609073, -0.30376886],
+           [-0.30376886, -0.26695916]])
+    '''
+
+    x = np.array(x, dtype=float).reshape(-1)
+    y = np.array(y, dtype=float).reshape(-1)
+    time = np.array(time, dtype=float).reshape(-1)
+
+    if rtol is not None and not 0.0 < rtol < 1.0:
+        raise ValueError(
+            "The relative tolerance needs to be within (0,1)")
+    if np.any(time <= 0.0):
+        raise ValueError(
+            "The given times need to be > 0")
+
+    # unique distances along the axes (mirror symmetry)
+    dist_x, x_inv = np.unique(np.abs(x - x0), return_inverse=True)
+    dist_y, y_inv = np.unique(np.abs(y - y0), return_inverse=True)
+    # radii of one quadrant and the cells outside of the well
+    quad = np.hypot.outer(dist_x, dist_y)
+    valid = quad > max(model.rwell, 0.0)
+
+    res = np.full(time.shape + quad.shape, np.nan)
+    if np.any(valid):
+        if rtol is None:
+            # identical radii (e.g. by octant symmetry) are evaluated once
+            rad, rad_inv = np.unique(quad[valid], return_inverse=True)
+            heads = np.reshape(model._heads(rad, time, True),
+                               (time.size, rad.size))
+            res[:, valid] = heads[:, rad_inv.reshape(-1)]
+        else:
+            res[:, valid] = _log_interpolation(model, quad[valid], time,
+                                               rtol)
+
+    # scatter the quadrant back to the grid
+    res = res[:, x_inv.reshape(-1)][:, :, y_inv.reshape(-1)]
+    return np.squeeze(res) + model.hinf
+
+
+def _log_interpolation(model, rad, time, rtol, n_start=17):
+    '''
+    Interpolated solution of a model by cubic splines in log-radius.
+
+    Parameters
+    ----------
+    model : :class:`TransientModel`
+        Transient model of the aquifer around the well
+    rad : :class:`numpy.ndarray`
+        Flat array with all radii where the function should be evaluated
+    time : :class:`numpy.ndarray`
+        Array with all time-points where the function should be evaluated
+    rtol : :class:`float`
+        Tolerance of the interpolation relative to the maximal absolute head
+    n_start : :class:`int`, optional
+        Number of the initial log-spaced radii. Default: ``17``
+
+    Returns
+    -------
+    :class:`numpy.ndarray`
+        Array with all heads relative to `hinf` with shape
+        ``(n_time, n_rad)``.
+    '''
+
+    from scipy.interpolate import CubicSpline
+
+    log_min, log_max = np.log(np.min(rad)), np.log(np.max(rad))
+    if log_max - log_min < 1e-12:
+        return np.reshape(model._heads(rad, time, True), (time.size, -1))
+
+    def heads(log_rad):
+        return np.reshape(model._heads(np.exp(log_rad), time, True),
+                          (time.size, log_rad.size))
+
+    log_rad = np.linspace(log_min, log_max, n_start)
+    val = heads(log_rad)
+    while True:
+        # the midpoints of the sample are the new radii
+        log_mid = 0.5*(log_rad[1:] + log_rad[:-1])
+        val_mid = heads(log_mid)
+        error = np.max(np.abs(CubicSpline(log_rad, val, axis=1)(log_mid)
+                              - val_mid))
+        # merge the radii with the midpoints (alternating)
+        log_rad = np.insert(log_rad, np.arange(1, log_rad.size), log_mid)
+        val = np.insert(val, np.arange(1, val.shape[1]), val_mid, axis=1)
+        if error <= rtol*np.max(np.abs(val)) or log_rad.size >= rad.size:
+            break
+
+    return CubicSpline(log_rad, val, axis=1)(np.log(rad))
+
+
+###############################################################################
+# The generic solver of the 2D radial transient groundwaterflow equation
+# in Laplace-space with a pumping condition and a fix zero boundary-head
+###############################################################################
+
+def lap_transgwflow_cyl(s, rad=None, rpart=None,
+                        Spart=None, Tpart=None, Qw=None, Twell=None,
+                        solver="banded", struc_grid=True, n_threads=None,
+                        coeff_cache=False):
+    '''
+    The solution of the diskmodel for transient flow under a pumping condition
+    in a confined aquifer in Laplace-space.
+    The solutions assumes concentric disks around the pumpingwell,
+    where each disk has its own transmissivity and storativity value.
+
+    Parameters
+    ----------
+    s : :class:`numpy.ndarray`
+        Array with all Laplace-space-points
+        where the function should be evaluated.
+        Complex Laplace-points with ``real(sqrt(s)) > 0`` are supported
+        (as needed for contour-integral inversions).
+    rad : :class:`numpy.ndarray`
+        Array with all radii where the function should be evaluated
+    rpart : :class:`numpy.ndarray`
+        Given radii separating the disks as well as starting- and endpoints
+    Tpart : :class:`numpy.ndarray`
+        Given transmissivity values for each disk
+    Spart : :class:`numpy.ndarray`
+        Given storativity values for each disk
+    Qw : :class:`float` or :class:`tuple`
+        Pumpingrate at the well or a schedule ``(tstart, rates)`` of
+        piecewise-constant rates, that is folded into the source term.
+    Twell : :class:`float`, optional
+        Transmissivity at the well. Default: ``Tpart[0]``
+    solver : :class:`str`, optional
+        Solver for the linear equation system in case of multiple disks.
+        One can choose between
+
+        * ``"banded"``: all systems are solved at once by a vectorized
+          banded gaussian elimination with partial pivoting
+          (compiled and parallel over s, if numba is installed)
+        * ``"sparse"``: one sparse system is solved for each Laplace-point
+          with :any:`scipy.sparse.linalg.spsolve` (using umfpack if present)
+        * ``"propagator"``: the continuity of head and flux at the disk
+          interfaces is expressed by 2x2 propagators, that are chained
+          through all disks without setting up a matrix
+
+        Default: ``"banded"``
+    struc_grid : :class:`bool`, optional
+        If this is set to ``False``, the `s` and `rad` array will be merged
+        and interpreted as single, s-r points. In this case they need to have
+        the same shapes. Otherwise a structured s-r grid is created.
+        Default: ``True``
+    n_threads : :class:`int` or :any:`None`, optional
+        Number of threads to evaluate chunks of Laplace-points on.
+        Not possible with ``solver="sparse"``. Default: ``None``
+    coeff_cache : :class:`bool`, optional
+        If ``True``, the coefficients of the disks are taken from the cache
+        of :func:`lap_coeffs`, so repeated calls with the same
+        Laplace-points and parameters only evaluate the bessel functions
+        at the given radii. Default: ``False``
+
+    Returns
+    -------
+    lap_transgwflow_cyl : :class:`numpy.ndarray`
+        Array with all values in laplace-space
+
+    Notes
+    -----
+    The only supported condition at the well is the given pumping rate.
+
+    For unstructured s-r points, the equation system is only solved once
+    for each unique Laplace-point and the radii are evaluated against the
+    solution of their own Laplace-point, so the memory demand is linear
+    in the number of points.
+
+    The ``"banded"`` and ``"propagator"`` solvers only use the thread-local
+    :any:`numpy.errstate` to suppress floating point warnings,
+    so they can be called from several threads at once.
+    The work is done by numpy- and scipy-ufuncs, that release the GIL,
+    so ``n_threads`` can speed up the calculation.
+    The ``"sparse"`` solver suppresses the warnings of the solver with
+    :any:`warnings.catch_warnings`, which is not thread-safe.
+
+    If `numba <https://numba.pydata.org>`_ is installed, the ``"banded"``
+    solver uses a compiled kernel, that assembles and solves the equation
+    systems in parallel over the Laplace-points, and the heads are combined
+    from the coefficients by a compiled kernel as well (the bessel functions
+    are still evaluated by scipy). The compiled code is cached on disk,
+    so only the very first call pays for the compilation.
+    It can be switched off with ``anaflow._kernels.USE_NUMBA = False``.
+
+    Example
+    -------
+    >>> lap_transgwflow_cyl([5,10],[1,2,3],[0,2,10],[1e-3,1e-3],[1e-3,2e-3],-1)
+    array([[ -2.71359196e+00,  -1.66671965e-01,  -2.82986917e-02],
+           [ -4.58447458e-01,  -1.12056319e-02,  -9.85673855e-04]])
+    '''
+
+    # ensure that input is treated as arrays
+    s = np.squeeze(s).reshape(-1)
+    rad = np.squeeze(rad).reshape(-1)
+    rpart = np.squeeze(rpart).reshape(-1)
+    Spart = np.squeeze(Spart).reshape(-1)
+    Tpart = np.squeeze(Tpart).reshape(-1)
+
+    # check the input
+    if solver not in ["banded", "sparse", "propagator"]:
+        raise ValueError(
+            "The solver needs to be 'banded', 'sparse' or 'propagator'")
+    if not struc_grid and not s.shape == rad.shape:
+        raise ValueError(
+            "For unstructured grid the number of s- & radii-pts must equal")
+    if n_threads is not None and n_threads < 1:
+        raise ValueError(
+            "The number of threads needs to be at least 1")
+    if n_threads is not None and n_threads > 1 and solver == "sparse":
+        raise ValueError(
+            "The sparse solver can't be used with multiple threads")
+
+    # a pumping schedule is folded into the source term of a unit rate
+    Qw = _pumping_rate(Qw)
+    schedule = Qw if isinstance(Qw, tuple) else None
+    if schedule is not None:
+        Qw = 1.0
+
+    coeffs = partial(lap_coeffs if coeff_cache else _lap_coeffs,
+                     rpart=rpart, Spart=Spart, Tpart=Tpart,
+                     Qw=Qw, Twell=Twell, solver=solver)
+
+    if struc_grid:
+        # the Laplace-points are independent, so they are split for threads
+        chunks = np.array_split(s, max(1, min(n_threads or 1, s.size)))
+        res = _map_threads(lambda s_part: _lap_heads(*coeffs(s_part),
+                                                     rpart=rpart, rad=rad),
+                           chunks, n_threads)
+        res = np.concatenate(res, axis=0)
+        if schedule is not None:
+            res *= _lap_rate(s, *schedule)[:, np.newaxis]
+        return res
+
+    # group the s-r points by their Laplace-point to solve each system once
+    s_uni, s_inv = np.unique(s, return_inverse=True)
+    s_inv = s_inv.reshape(-1)
+    order = np.argsort(s_inv, kind="stable")
+    # solve the systems in blocks of Laplace-points to limit the memory
+    chunk = max(16, 2**17//len(Tpart))
+    if n_threads is not None and n_threads > 1:
+        chunk = min(chunk, max(1, -(-s_uni.size//n_threads)))
+    bounds = np.searchsorted(s_inv[order], np.arange(0, s_uni.size, chunk))
+    bounds = np.append(bounds, s.size)
+
+    def block(i):
+        # heads of all points belonging to the i-th block of Laplace-points
+        pts = order[bounds[i]:bounds[i+1]]
+        Cs, X = coeffs(s_uni[i*chunk:(i+1)*chunk])
+        return _lap_heads(Cs, X, rpart, rad[pts], s_inv[pts]-i*chunk)
+
+    res = np.zeros(rad.shape, dtype=np.result_type(s, float))
+    n_blocks = len(bounds) - 1
+    for i, val in enumerate(_map_threads(block, range(n_blocks), n_threads)):
+        res[order[bounds[i]:bounds[i+1]]] = val
+
+    if schedule is not None:
+        res = res*_lap_rate(s, *schedule)
+
+    return res
+
+
+def _pumping_rate(Qw, fac=1.0):
+    '''
+    Scaled pumping rate or pumping schedule.
+
+    Parameters
+    ----------
+    Qw : :class:`float` or :class:`tuple`
+        Pumpingrate at the well or a schedule ``(tstart, rates)`` of
+        piecewise-constant rates.
+    fac : :class:`float`, optional
+        Factor for the pumping rates. Default: ``1.0``
+
+    Returns
+    -------
+    :class:`float` or :class:`tuple`
+        The scaled pumpingrate or the schedule ``(tstart, rates)`` as
+        flat float arrays with scaled rates.
+    '''
+
+    if not isinstance(Qw, (tuple, list)) and np.ndim(Qw) == 0:
+        return fac*Qw
+    if len(Qw) != 2:
+        raise ValueError(
+            "The pumping schedule needs to be given as (tstart, rates)")
+
+    tstart = np.array(Qw[0], dtype=float).reshape(-1)
+    rates = fac*np.array(Qw[1], dtype=float).reshape(-1)
+
+    if tstart.size == 0 or tstart.shape != rates.shape:
+        raise ValueError(
+            "The pumping schedule needs one rate for each starting time")
+    if np.any(tstart < 0.0):
+        raise ValueError(
+            "The starting times of the pumping rates need to be >= 0")
+    if np.any(np.diff(tstart) <= 0.0):
+        raise ValueError(
+            "The starting times of the pumping rates need to be increasing")
+
+    return tstart, rates
+
+
+def _lap_rate(s, tstart, rates):
+    # laplace-transform of the schedule relative to a unit rate: the rate
+    # changes switched on at their starting times
+    changes = np.diff(np.append(0.0, rates))
+    return np.exp(-np.multiply.outer(s, tstart)).dot(changes)
+
+
+def lap_coeffs(s, rpart, Spart, Tpart, Qw, Twell=None, solver="banded"):
+    '''
+    Cached coefficient-table of the diskmodel in Laplace-space.
+
+    Within the disk ``i`` the solution of :func:`lap_transgwflow_cyl` is
+    given by ``A_i*i0(Cs_i*r) + B_i*k0(Cs_i*r)`` with
+    ``Cs_i = sqrt(s*S_i/T_i)``. The coefficients only depend on the
+    Laplace-points and the parameters of the disks, so they are stored in a
+    least-recently-used cache with ``COEFF_CACHE_SIZE`` entries.
+    New radii can then be evaluated with :func:`lap_heads` without
+    solving any equation system again.
+
+    Parameters
+    ----------
+    s : :class:`numpy.ndarray`
+        Array with all Laplace-space-points
+    rpart : :class:`numpy.ndarray`
+        Given radii separating the disks as well as starting- and endpoints
+    Spart : :class:`numpy.ndarray`
+        Given storativity values for each disk
+    Tpart : :class:`numpy.ndarray`
+        Given transmissivity values for each disk
+    Qw : :class:`float`
+        Pumpingrate at the well
+    Twell : :class:`float`, optional
+        Transmissivity at the well. Default: ``Tpart[0]``
+    solver : :class:`str`, optional
+        Solver for the equation system. See: :func:`lap_transgwflow_cyl`.
+        Default: ``"banded"``
+
+    Returns
+    -------
+    Cs : :class:`numpy.ndarray`
+        The values ``Cs_i`` with shape ``(n_s, parts)`` (read-only)
+    X : :class:`numpy.ndarray`
+        Coefficients ``[A_0, B_0, A_1, B_1, ...]`` of ``i0`` and ``k0``
+        in each disk with shape ``(n_s, 2*parts)`` (read-only)
+
+    Example
+    -------
+    >>> Cs, X = lap_coeffs([5,10], [0,2,10], [1e-3,1e-3], [1e-3,2e-3], -1)
+    >>> lap_heads(Cs, X, [0,2,10], [1,2,3])
+    array([[ -2.71359196e+00,  -1.66671965e-01,  -2.82986917e-02],
+           [ -4.58447458e-01,  -1.12056319e-02,  -9.85673855e-04]])
+    '''
+
+    return _cached_coeffs(_array_key(np.reshape(s, -1)), _array_key(rpart),
+                          _array_key(Spart), _array_key(Tpart),
+                          float(Qw), None if Twell is None else float(Twell),
+                          solver)
+
+
+def lap_heads(Cs, X, rpart, rad):
+    '''
+    Evaluate the diskmodel in Laplace-space from a coefficient-table.
+
+    Parameters
+    ----------
+    Cs : :class:`numpy.ndarray`
+        The values ``Cs_i`` with shape ``(n_s, parts)``.
+        See: :func:`lap_coeffs`
+    X : :class:`numpy.ndarray`
+        Coefficients of ``i0`` and ``k0`` with shape ``(n_s, 2*parts)``.
+        See: :func:`lap_coeffs`
+    rpart : :class:`numpy.ndarray`
+        Given radii separating the disks as well as starting- and endpoints
+    rad : :class:`numpy.ndarray`
+        Array with all radii where the function should be evaluated
+
+    Returns
+    -------
+    :class:`numpy.ndarray`
+        Array with all values in laplace-space with shape ``(n_s, n_r)``
+    '''
+
+    rpart = np.asarray(rpart, dtype=float).reshape(-1)
+    rad = np.asarray(rad, dtype=float).reshape(-1)
+    return _lap_heads(Cs, X, rpart, rad)
+
+
+def coeff_cache_info():
+    '''
+    Statistics of the cached coefficient-tables of :func:`lap_coeffs`.
+
+    Returns
+    -------
+    :any:`collections.namedtuple`
+        The tuple ``(hits, misses, maxsize, currsize)``.
+    '''
+
+    return _cached_coeffs.cache_info()
+
+
+def coeff_cache_clear():
+    '''
+    Clear the cached coefficient-tables of :func:`lap_coeffs` and reset the
+    statistics.
+    '''
+
+    _cached_coeffs.cache_clear()
+
+
+def response_cache_info():
+    '''
+    Statistics of the cached unit-responses of the transient models.
+
+    With ``response_cache=True``, the solution for a unit pumping rate is
+    cached for each model-parametrization, radii and time-points.
+    Since the solution is linear in the pumping rate, calls, that only
+    differ in `Qw` or `hinf`, are rescaled from the cached response.
+    The cache holds the ``RESPONSE_CACHE_SIZE`` recently used responses.
+
+    Returns
+    -------
+    :any:`collections.namedtuple`
+        The tuple ``(hits, misses, maxsize, currsize)``.
+    '''
+
+    return _unit_response.cache_info()
+
+
+def response_cache_clear():
+    '''
+    Clear the cached unit-responses of the transient models and reset the
+    statistics.
+    '''
+
+    _unit_response.cache_clear()
+
 
+def _response_key(model, rad, time, struc_grid):
+    # hashable key of a unit-response
+    return (model._model_key(), _array_key(rad), _array_key(time),
+            struc_grid)
+
+
+@_lru_cache(RESPONSE_CACHE_SIZE, key=_response_key)
+def _unit_response(model, rad, time, struc_grid):
+    # the (cached) solution of a transient model for a unit pumping rate
+    res = np.asarray(model._solve(rad, time, struc_grid, 1.0), dtype=float)
+    # the cached array is shared by all calls
+    res.flags.writeable = False
+    return res
+
+
+def _array_key(arr):
+    # hashable representation of an array for the cache-keys
+    arr = np.asarray(arr)
+    arr = np.ascontiguousarray(arr, dtype=np.result_type(arr, float))
+    return arr.tobytes(), arr.dtype.str, arr.shape
+
+
+def _from_key(key):
+    # array from its hashable representation
+    return np.frombuffer(key[0], dtype=key[1]).reshape(key[2])
+
+
+@_lru_cache(COEFF_CACHE_SIZE)
+def _cached_coeffs(s_key, r_key, S_key, T_key, Qw, Twell, solver):
+    Cs, X = _lap_coeffs(_from_key(s_key), _from_key(r_key),
+                        _from_key(S_key), _from_key(T_key), Qw, Twell, solver)
+    # the cached arrays are shared by all calls
+    Cs.flags.writeable = False
+    X.flags.writeable = False
+    return Cs, X
+
+
+def _map_threads(func, args, n_threads=None):
+    # map a function on a thread-pool (or serial for a single thread)
+    if n_threads is None or n_threads < 2:
+        return list(map(func, args))
+    from concurrent.futures import ThreadPoolExecutor
+    with ThreadPoolExecutor(n_threads) as pool:
+        return list(pool.map(func, args))
+
+
+def _lap_solution(rad, time, struc_grid=True, stehfestn=12, max_memory=None,
+                  stehfest_tol=None, inversion="stehfest", n_jobs=None,
+                  **kwargs):
+    '''
+    Invert :func:`lap_transgwflow_cyl` numerically.
+
+    Parameters
+    ----------
+    rad : :class:`numpy.ndarray`
+        Array with all radii where the function should be evaluated
+    time : :class:`numpy.ndarray`
+        Array with all time-points where the function should be evaluated
+    struc_grid : :class:`bool`, optional
+        If this is set to ``False``, the `rad` and `time` array are
+        interpreted as single, r-t points. Default: ``True``
+    stehfestn : :class:`int`, optional
+        Number of Laplace-points for each time-point. Default: ``12``
+    max_memory : :class:`int` or :any:`None`, optional
+        Approximate upper bound in bytes for the memory used within the
+        Laplace-space. If given, the time- and radius-axis are split into
+        blocks, that are inverted one after another. Default: ``None``
+    stehfest_tol : :class:`float` or :any:`None`, optional
+        If given, `stehfestn` is the maximal number of interations and the
+        smallest sufficient one is selected for each time-point with this
+        relative tolerance. See: :func:`anaflow.laplace.stehfest`.
+        Only possible for structured grids. Default: ``None``
+    inversion : :class:`str`, optional
+        The inversion-algorithm: ``"stehfest"``, ``"talbot"``,
+        ``"fourier"`` or ``"gaver"``. Default: ``"stehfest"``
+    n_jobs : :class:`int` or :any:`None`, optional
+        Number of worker-processes for the Laplace-space.
+        Default: ``None``
+    **kwargs
+        Keyword-arguments that are forwarded to :func:`lap_transgwflow_cyl`
+
+    Returns
+    -------
+    :class:`numpy.ndarray`
+        Array with all heads at the given radii and time-points.
+    '''
+
+    if max_memory is not None and max_memory <= 0:
+        raise ValueError(
+            "The maximal memory needs to be positiv")
+    if inversion not in ["stehfest", "talbot", "fourier", "gaver"]:
+        raise ValueError(
+            "The inversion needs to be 'stehfest', 'talbot', "
+            "'fourier' or 'gaver'")
+
+    if stehfest_tol is not None and stehfest_tol < 0:
+        raise ValueError(
+            "The tolerance for the stehfest-algorithm needs to be positiv")
+    if stehfest_tol is not None and not struc_grid:
+        raise ValueError(
+            "The adaptive stehfest-algorithm needs a structured grid")
+    if stehfest_tol is not None and inversion != "stehfest":
+        raise ValueError(
+            "The adaptive selection is only possible for 'stehfest'")
+    if inversion == "fourier" and not struc_grid:
+        raise ValueError(
+            "The fourier-inversion needs a structured grid")
+    if n_jobs is not None and n_jobs < 1:
+        raise ValueError(
+            "The number of jobs needs to be at least 1")
+
+    rad = np.asarray(rad, dtype=float).reshape(-1)
+    time = np.asarray(time, dtype=float).reshape(-1)
+
+    if inversion == "stehfest":
+        invert = sf
+        # options for structured grids and for single r-t points
+        struc_kw = dict(adaptive=stehfest_tol is not None,
+                        tol=stehfest_tol or 0.0)
+        point_kw = dict(s_tol=None)
+        # number of floats per Laplace-value
+        n_val = 1
+    elif inversion == "gaver":
+        invert = gaver
+        struc_kw, point_kw = {}, dict(s_tol=None)
+        n_val = 1
+    else:
+        invert = talbot if inversion == "talbot" else fourier
+        struc_kw, point_kw = {}, {}
+        # the talbot-contour and the fourier-series need complex points
+        n_val = 2
+    # the fourier-series samples the period of twice the time-range
+    # with the time-step, so half the folds give the same number of points
+    bound = max(1, stehfestn//2) if inversion == "fourier" else stehfestn
+
+    # estimated memory in floats needed by the solver for one Laplace-point
+    # (equation system and coefficients) and for one radius at one point
+    lap_mem = 30*n_val*len(np.atleast_1d(kwargs["Tpart"]))
+    rad_mem = 4*n_val
+
+    lap_func = lap_transgwflow_cyl
+    rpart = np.atleast_1d(kwargs["rpart"])
+    if inversion == "fourier" and rpart[0] == 0.0:
+        # the theis-solution of the inner disk carries the early-time
+        # singularity at the well, that is not resolved by the time-step,
+        # so only the deviation from it is inverted
+        lap_func = _lap_deviation
+
+    with _pool(None, n_jobs) as executor:
+        if struc_grid:
+            return _lap_struc(invert, lap_func, rad, time, bound, stehfestn,
+                              max_memory, lap_mem, rad_mem, inversion,
+                              dict(struc_kw, executor=executor,
+                                   n_jobs=n_jobs),
+                              kwargs)
+
+        # pair each radius with the Laplace-points of its own time only
+        # (the Laplace-points are grouped within lap_transgwflow_cyl)
+        if max_memory is None:
+            chunk = rad.size
+        else:
+            chunk = max(1,
+                        int(max_memory//(8*stehfestn*(lap_mem + rad_mem))))
+        if executor is not None:
+            # distribute the r-t points on the workers
+            chunk = min(chunk, -(-rad.size//n_jobs))
+        bounds = range(0, rad.size, chunk)
+        args = ([invert]*len(bounds),
+                [time[lo:lo+chunk] for lo in bounds],
+                [rad[lo:lo+chunk] for lo in bounds],
+                [stehfestn]*len(bounds),
+                [dict(point_kw, **kwargs)]*len(bounds))
+        if executor is None:
+            res = list(map(_invert_points, *args))
+        else:
+            res = list(executor.map(_invert_points, *args))
+    return np.concatenate(res) if res else np.empty(rad.shape)
+
+
+def _lap_struc(invert, lap_func, rad, time, bound, stehfestn, max_memory,
+               lap_mem, rad_mem, inversion, inv_kw, kwargs):
+    # invert the diskmodel on a structured grid (see: _lap_solution)
+    if max_memory is None:
+        r_chunk = max(1, rad.size)
+    else:
+        if inversion == "fourier":
+            # all time-points are inverted at once with one frequency-block
+            # on the internal grid of the fourier-algorithm
+            n_lap = _fourier_grid(time)[1]
+        else:
+            n_lap = stehfestn
+        # split the radii, if one time-point doesn't fit into the memory
+        per_s = max_memory//(8*n_lap)
+        r_chunk = min(rad.size, max(1, int((per_s - lap_mem)//rad_mem)))
+        if inversion != "fourier":
+            inv_kw["chunk_size"] = max(
+                1, int(per_s//(lap_mem + rad_mem*r_chunk)))
+    res = np.empty(time.shape + rad.shape)
+    for lo in range(0, rad.size, r_chunk):
+        res[:, lo:lo+r_chunk] = np.reshape(
+            invert(lap_func, time, bound=bound,
+                   rad=rad[lo:lo+r_chunk], **dict(inv_kw, **kwargs)),
+            (time.size, -1))
+    if lap_func is _lap_deviation:
+        T_in = np.atleast_1d(kwargs["Tpart"])[0]
+        S_in = np.atleast_1d(kwargs["Spart"])[0]
+        Twell = kwargs.get("Twell")
+        Twell = T_in if Twell is None else Twell
+        Qw = _pumping_rate(kwargs["Qw"])
+        tstart, rates = Qw if isinstance(Qw, tuple) else ([0.0], [Qw])
+        # superpose the theis-solutions of all rate-changes of a schedule
+        for t_0, dQ in zip(tstart, np.diff(np.append(0.0, rates))):
+            act = time > t_0
+            if not np.any(act):
+                continue
+            res[act] += np.reshape(
+                well_solution(rad, time[act]-t_0, T_in, S_in, dQ)*T_in/Twell,
+                res[act].shape)
+    return np.squeeze(res)
+
+
+def _invert_points(invert, time, rad, bound, kwargs):
+    # invert the diskmodel at single r-t points (module-level to be
+    # picklable for process-pools)
+    return np.reshape(
+        invert(lap_transgwflow_cyl, time, bound=bound,
+               rad=np.repeat(rad, bound), struc_grid=False, **kwargs), -1)
+
+
+def _lap_deviation(s, rad=None, rpart=None,
+                   Spart=None, Tpart=None, Qw=None, Twell=None, **kwargs):
+    '''
+    Deviation of :func:`lap_transgwflow_cyl` from the homogeneous solution
+    with the parameters of the inner disk.
+
+    The homogeneous solution is the theis-solution (scaled with
+    ``Tpart[0]/Twell``), so it can be added back in time-space.
+    Only valid for ``rpart[0] == 0``.
+
+    Parameters
+    ----------
+    s : :class:`numpy.ndarray`
+        Array with all Laplace-space-points
+    rad : :class:`numpy.ndarray`
+        Array with all radii where the function should be evaluated
+    rpart : :class:`numpy.ndarray`
+        Given radii separating the disks as well as starting- and endpoints
+    Spart : :class:`numpy.ndarray`
+        Given storativity values for each disk
+    Tpart : :class:`numpy.ndarray`
+        Given transmissivity values for each disk
+    Qw : :class:`float` or :class:`tuple`
+        Pumpingrate at the well or a schedule ``(tstart, rates)`` of
+        piecewise-constant rates, that is folded into the source term.
+    Twell : :class:`float`, optional
+        Transmissivity at the well. Default: ``Tpart[0]``
+    **kwargs
+        Further keyword-arguments for :func:`lap_transgwflow_cyl`
+
+    Returns
+    -------
+    :class:`numpy.ndarray`
+        Array with all values in laplace-space
+    '''
+
+    Spart, Tpart = np.atleast_1d(Spart), np.atleast_1d(Tpart)
+    if Twell is None:
+        Twell = Tpart[0]
+    full = lap_transgwflow_cyl(s, rad, rpart, Spart, Tpart, Qw, Twell,
+                               **kwargs)
+    inner = lap_transgwflow_cyl(s, rad, [0.0, np.inf], Spart[:1], Tpart[:1],
+                                Qw, Twell, **kwargs)
+    return full - inner
+
+
+def _lap_coeffs(s, rpart, Spart, Tpart, Qw, Twell=None, solver="banded"):
+    '''
+    Coefficients of the diskmodel in Laplace-space.
+
+    Within the disk ``i`` the solution is given by
+    ``A_i*_i0(Cs_i*r) + B_i*_k0(Cs_i*r)`` with ``Cs_i = sqrt(s*S_i/T_i)``.
+
+    Parameters
+    ----------
+    s : :class:`numpy.ndarray`
+        Array with all Laplace-space-points
+    rpart : :class:`numpy.ndarray`
+        Given radii separating the disks as well as starting- and endpoints
+    Spart : :class:`numpy.ndarray`
+        Given storativity values for each disk
+    Tpart : :class:`numpy.ndarray`
+        Given transmissivity values for each disk
+    Qw : :class:`float`
+        Pumpingrate at the well
+    Twell : :class:`float`, optional
+        Transmissivity at the well. Default: ``Tpart[0]``
+    solver : :class:`str`, optional
+        Solver for the equation system. Default: ``"banded"``
+
+    Returns
+    -------
+    Cs : :class:`numpy.ndarray`
+        The values ``Cs_i`` with shape ``(n_s, parts)``
+    X : :class:`numpy.ndarray`
+        Coefficients ``[A_0, B_0, A_1, B_1, ...]`` of ``i0`` and ``k0``
+        in each disk with shape ``(n_s, 2*parts)``
+    '''
+
+    # get the number of partitions
+    parts = len(Tpart)
+
+    # set the general pumping-condtion
+    if Twell is None:
+        Twell = Tpart[0]
+    Q = Qw/(2.0*np.pi*Twell)
+
+    # calculate the Cs values for all s in all partitions (s x parts)
+    Cs = np.outer(np.sqrt(s), np.sqrt(Spart/Tpart))
+
+    # set the pumping-condition at the well
+    Qs = Q/s
+
+    # if there is a homgeneouse aquifer, compute the result by hand
+    if parts == 1:
+        C0 = Cs[:, 0]
+
+        # over- and underflows are handled below (thread-local state)
+        # the bessel functions are exponentially scaled, since the unscaled
+        # ones overflow for large arguments (especially for complex s)
+        with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+            x_w, x_o = C0*rpart[0], C0*rpart[-1]
+            # incorporate the boundary-conditions
+            if rpart[0] == 0.0:
+                Bs = Qs
+                if rpart[-1] == np.inf:
+                    As = np.zeros_like(Qs)
+                else:
+                    As = -Qs*_k0e(x_o)/_i0e(x_o)*np.exp(-2.0*x_o)
+
+            else:
+                if rpart[-1] == np.inf:
+                    As = np.zeros_like(Qs)
+                    Bs = Qs*np.exp(x_w)/(x_w*_k1e(x_w))
+                else:
+                    # the determinant scaled by exp(x_w-x_o)
+                    det = _i1e(x_w)*_k0e(x_o)*np.exp(-2.0*(x_o - x_w)) \
+                        + _k1e(x_w)*_i0e(x_o)
+                    As = -Qs/x_w*_k0e(x_o)*np.exp(x_w - 2.0*x_o)/det
+                    Bs = Qs/x_w*_i0e(x_o)*np.exp(x_w)/det
+
+        X = np.column_stack((As, Bs))
+
+    # if there is more than one partition, create an equation system
+    elif solver == "propagator":
+        # chain the 2x2 interface propagators without any matrix
+        X = _propagator_solve(Cs, rpart, Tpart, Qs)
+    else:
+        X = _lap_matrix_solve(Cs, rpart, Tpart, Qs, solver)
+
+    # to suppress numerical errors, set NAN values to 0
+    X[np.logical_not(np.isfinite(X))] = 0.0
+    # the i0-coefficient vanishes exactly in an infinite outer disk
+    if rpart[-1] == np.inf:
+        X[:, -2] = 0.0
+
+    return Cs, X
+
+
+def _lap_heads(Cs, X, rpart, rad, s_ind=None):
+    '''
+    Evaluate the diskmodel in Laplace-space from given coefficients.
+
+    Parameters
+    ----------
+    Cs : :class:`numpy.ndarray`
+        The values ``Cs_i`` with shape ``(n_s, parts)``
+    X : :class:`numpy.ndarray`
+        Coefficients of ``i0`` and ``k0`` with shape ``(n_s, 2*parts)``
+    rpart : :class:`numpy.ndarray`
+        Given radii separating the disks as well as starting- and endpoints
+    rad : :class:`numpy.ndarray`
+        Array with all radii where the function should be evaluated
+    s_ind : :class:`numpy.ndarray`, optional
+        Index of the Laplace-point for each radius. If given, the radii are
+        evaluated pointwise, otherwise on a structured s-r grid.
+        Default: ``None``
+
+    Returns
+    -------
+    res : :class:`numpy.ndarray`
+        The heads with shape ``(n_s, n_r)`` or ``(n_r,)``.
+    '''
+
+    # match the radii within the outer radius to the different disks
+    inner = rad < rpart[-1]
+    pos = np.searchsorted(rpart, rad[inner], side="right") - 1
+
+    if s_ind is None:
+        res = np.zeros(Cs.shape[:1] + rad.shape, dtype=X.dtype)
+        s_ind, r_ind = slice(None), (slice(None), inner)
+    else:
+        res = np.zeros(rad.shape, dtype=X.dtype)
+        s_ind, r_ind = s_ind[inner], inner
+
+    with np.errstate(invalid="ignore", over="ignore"):
+        Cr = Cs[s_ind, pos]*rad[inner]
+        A, B = X[s_ind, 2*pos], X[s_ind, 2*pos+1]
+        # the i0-term only contributes with a non-vanishing coefficient
+        non_zero = A != 0.0
+        if _kernels.USE_NUMBA:
+            # combine the coefficients and bessel values compiled
+            i0_val = np.zeros_like(Cr)
+            i0_val[non_zero] = _i0(Cr[non_zero])
+            head = _kernels.disk_heads(A.reshape(-1), B.reshape(-1),
+                                       i0_val.reshape(-1),
+                                       _k0(Cr).reshape(-1)).reshape(A.shape)
+        else:
+            head = B*_k0(Cr)
+            head[non_zero] += A[non_zero]*_i0(Cr[non_zero])
+        res[r_ind] = head
+
+    # set problematic values to 0
+    # --> the algorithm tends to violate small values,
+    #     therefore this approachu is suitable
+    res[np.logical_not(np.isfinite(res))] = 0.0
+
+    return res
+
+
+def _lap_matrix_solve(Cs, rpart, Tpart, Qs, solver="banded"):
+    '''
+    Coefficients of the diskmodel in Laplace-space from the full
+    equation system for the continuity of head and flux.
+
+    Parameters
+    ----------
+    Cs : :class:`numpy.ndarray`
+        Square-root of the diffusivities times ``sqrt(s)``
+        with shape ``(n_s, parts)``
+    rpart : :class:`numpy.ndarray`
+        Given radii separating the disks as well as starting- and endpoints
+    Tpart : :class:`numpy.ndarray`
+        Given transmissivity values for each disk
+    Qs : :class:`numpy.ndarray`
+        Pumping-condition at the well for each Laplace-point
+    solver : :class:`str`, optional
+        Either ``"banded"`` or ``"sparse"``. Default: ``"banded"``
+
+    Returns
+    -------
+    X : :class:`numpy.ndarray`
+        Coefficients ``[A_0, B_0, A_1, B_1, ...]`` of ``i0`` and ``k0``
+        in each disk with shape ``(n_s, 2*parts)``
+
+    Raises
+    ------
+    ValueError
+        If the solver is unknown or the pumping-condition is not given
+        as one value per Laplace-point.
+
+    Notes
+    -----
+    Only a prescribed pumping rate at the well is implemented
+    (the first row of the equation system). Other conditions at the well,
+    like a fixed head or a well-bore storage, are not supported.
+    '''
+
+    n_s, parts = Cs.shape
+    Qs = np.asarray(Qs)
+
+    if solver not in ["banded", "sparse"]:
+        raise ValueError(
+            "The solver for the equation system needs to be "
+            "'banded' or 'sparse'")
+    if Qs.shape != (n_s,):
+        raise ValueError(
+            "The pumping-condition needs to be given as a pumping rate "
+            "for each Laplace-point. Other conditions are not supported")
+
+    # every bessel-function value of the Eq-Systems is calculated once
+    # (the systems are set up for the scaled coefficients)
+    Bi, Bo, tmp, well, outer = _disk_bessel(Cs, rpart, Tpart)
+
+    if solver == "banded" and _kernels.USE_NUMBA:
+        # assemble and solve the Eq-Systems in parallel with the compiled
+        # kernel (the pumping-condition needs the dtype of the systems)
+        X = _kernels.disk_solve(Bi, Bo, tmp, well, outer,
+                                np.asarray(Qs, dtype=Bi.dtype))
+        return _disk_unscale(Cs, rpart, X)
+
+    # initialize LHS and RHS for the linear equation systems of all s
+    # Mb holds the banded matrices for the Eq-Systems (one for each s)
+    V = np.zeros((n_s, 2*parts), dtype=Cs.dtype)
+    Mb = np.zeros((n_s, 5, 2*parts), dtype=Cs.dtype)
+    # the positions of the diagonals of the matrix set in Mb
+    diagpos = [2, 1, 0, -1, -2]
+
+    # set the pumping-condition at the well (only a given pumping rate)
+    V[:, 0] = Qs
+
+    # set the boundary-conditions at the well and the outer boundary
+    Mb[:, 2, 0], Mb[:, 1, 1] = well[:, 0], well[:, 1]
+    Mb[:, -2, -2], Mb[:, -3, -1] = outer[:, 0], outer[:, 1]
+
+    # generate the equation systems as banded matrices
+    # (the interface i is coupling the columns 2i to 2i+3)
+    Mb[:, 0, 3::2] = -Bo[:, 2]
+    Mb[:, 1, 2::2] = -Bo[:, 0]
+    Mb[:, 1, 3::2] = Bo[:, 3]
+    Mb[:, 2, 1:-1:2] = Bi[:, 2]
+    Mb[:, 2, 2::2] = -Bo[:, 1]
+    Mb[:, 3, 0:-2:2] = Bi[:, 0]
+    Mb[:, 3, 1:-2:2] = -tmp*Bi[:, 3]
+    Mb[:, 4, 0:-2:2] = tmp*Bi[:, 1]
+
+    if solver == "banded":
+        # solve all Eq-Systems at once
+        return _disk_unscale(Cs, rpart, _banded_solve(Mb, V))
+
+    X = np.empty_like(V)
+    # ignore errors from the umf-pack (once for all Eq-Systems)
+    # this mutates the global warning-filters and is not thread-safe
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", SLV_WARN)
+        for si in range(n_s):
             # genearate the cooeficient matrix as a spare matrix
-            M = sps.spdiags(Mb, diagpos, 2*parts, 2*parts, format="csc")
+            M = sps.spdiags(Mb[si], diagpos, 2*parts, 2*parts, format="csc")
+            # solve the Eq-Sys
+            X[si] = sps.linalg.spsolve(M, V[si], use_umfpack=True)
+
+    return _disk_unscale(Cs, rpart, X)
+
+
+def _disk_bessel(Cs, rpart, Tpart):
+    '''
+    Bessel-function values of the equation systems of the diskmodel.
+
+    The systems are set up for the scaled coefficients of
+    :func:`_disk_unscale`, so the exponentially scaled bessel functions
+    are used and no overflow occurs for large (or complex) arguments.
+
+    Parameters
+    ----------
+    Cs : :class:`numpy.ndarray`
+        Square-root of the diffusivities times ``sqrt(s)``
+        with shape ``(n_s, parts)``
+    rpart : :class:`numpy.ndarray`
+        Given radii separating the disks as well as starting- and endpoints
+    Tpart : :class:`numpy.ndarray`
+        Given transmissivity values for each disk
+
+    Returns
+    -------
+    Bi : :class:`numpy.ndarray`
+        Scaled ``i0, i1, k0, k1`` at the interfaces from the inside
+        with shape ``(n_s, 4, parts-1)``
+    Bo : :class:`numpy.ndarray`
+        Scaled ``i0, i1, k0, k1`` at the interfaces from the outside
+        with shape ``(n_s, 4, parts-1)``
+    tmp : :class:`numpy.ndarray`
+        Ratios of the consecutive fluxes with shape ``(n_s, parts-1)``
+    well : :class:`numpy.ndarray`
+        Coefficients of ``a_0, b_0`` in the condition at the well
+        with shape ``(n_s, 2)``
+    outer : :class:`numpy.ndarray`
+        Coefficients of ``a_n, b_n`` in the condition at the outer boundary
+        with shape ``(n_s, 2)``
+    '''
 
-            # solve the Eq-Sys and ignore errors from the umf-pack
-            with warnings.catch_warnings():
-                # warnings.simplefilter("ignore")
-                warnings.simplefilter("ignore", SLV_WARN)
-                X = sps.linalg.spsolve(M, V, use_umfpack=True)
+    n_s = Cs.shape[0]
+
+    # calculate a temporal substitution from the consecutive fractions
+    # of the transmissivities and the square-root of the diffusivities
+    tmp = Tpart[:-1]*Cs[:, :-1]/(Tpart[1:]*Cs[:, 1:])
+
+    # decay of the i0-mode relative to the k0-mode within each disk
+    # (set to 1 in an infinite outer disk, where the i0-mode vanishes)
+    dec = _disk_decay(Cs, rpart)
+
+    # arguments of the bessel functions at the inner interfaces
+    # from the inside (Ci) and from the outside (Co) (s x parts-1)
+    Ci = Cs[:, :-1]*rpart[1:-1]
+    Co = Cs[:, 1:]*rpart[1:-1]
+    Bi = np.stack((_i0e(Ci), _i1e(Ci),
+                   _k0e(Ci)*dec[:, :-1], _k1e(Ci)*dec[:, :-1]), axis=1)
+    Bo = np.stack((_i0e(Co)*dec[:, 1:], _i1e(Co)*dec[:, 1:],
+                   _k0e(Co), _k1e(Co)), axis=1)
+
+    # the standard boundary conditions for rwell=0.0 and rinf=np.inf
+    # are B_0=Qs and A_n=0, otherwise the flux resp. the head are set
+    well = np.zeros((n_s, 2), dtype=Cs.dtype)
+    outer = np.zeros((n_s, 2), dtype=Cs.dtype)
+    well[:, 1] = outer[:, 0] = 1.0
+    if rpart[0] > 0.0:
+        Cw = Cs[:, 0]*rpart[0]
+        well[:, 0], well[:, 1] = -Cw*_i1e(Cw)*dec[:, 0], Cw*_k1e(Cw)
+    if rpart[-1] < np.inf:
+        Cinf = Cs[:, -1]*rpart[-1]
+        outer[:, 0], outer[:, 1] = _i0e(Cinf), _k0e(Cinf)*dec[:, -1]
+
+    return Bi, Bo, tmp, well, outer
+
+
+def _disk_decay(Cs, rpart):
+    # exp(-Cs*width) of each disk (1 for an infinite disk, since inf*z is
+    # nan for complex z)
+    width = rpart[1:] - rpart[:-1]
+    finite = np.isfinite(width)
+    return np.where(finite, np.exp(-Cs*np.where(finite, width, 0.0)), 1.0)
+
+
+def _disk_unscale(Cs, rpart, X):
+    '''
+    Coefficients of the diskmodel from the scaled solution of the
+    equation systems.
 
-            # to suppress numerical errors, set NAN values to 0
-            X[np.logical_not(np.isfinite(X))] = 0.0
+    The equation systems of :func:`_disk_bessel` are solved for the scaled
+    coefficients ``a_i = A_i*exp(Cs_i*rpart_i+1)`` and
+    ``b_i = B_i*exp(-Cs_i*rpart_i)``, so all entries are bounded.
+    In an infinite outer disk, the i0-coefficient is scaled at its
+    inner radius instead.
 
-            # calculate the head
-            res[si, :] = X[2*pos]*i0(Cs[pos]*rad) + X[2*pos+1]*k0(Cs[pos]*rad)
+    Parameters
+    ----------
+    Cs : :class:`numpy.ndarray`
+        Square-root of the diffusivities times ``sqrt(s)``
+        with shape ``(n_s, parts)``
+    rpart : :class:`numpy.ndarray`
+        Given radii separating the disks as well as starting- and endpoints
+    X : :class:`numpy.ndarray`
+        Scaled coefficients ``[a_0, b_0, a_1, b_1, ...]``
+        with shape ``(n_s, 2*parts)``
 
-        # set problematic values to 0
-        # --> the algorithm tends to violate small values,
-        #     therefore this approachu is suitable
-        res[np.logical_not(np.isfinite(res))] = 0.0
+    Returns
+    -------
+    X : :class:`numpy.ndarray`
+        Coefficients ``[A_0, B_0, A_1, B_1, ...]`` of ``i0`` and ``k0``
+        in each disk with shape ``(n_s, 2*parts)``
+    '''
 
+    r_a = np.where(np.isfinite(rpart[1:]), rpart[1:], rpart[:-1])
+    res = np.empty_like(X)
+    with np.errstate(over="ignore", invalid="ignore"):
+        res[:, 0::2] = X[:, 0::2]*np.exp(-Cs*r_a)
+        res[:, 1::2] = X[:, 1::2]*np.exp(Cs*rpart[:-1])
     return res
 
 
+def _propagator_solve(Cs, rpart, Tpart, Qs):
+    '''
+    Coefficients of the diskmodel in Laplace-space from chained propagators.
+
+    Within each disk the head is ``h = A*_i0(C*r) + B*_k0(C*r)``.
+    The continuity of head and flux at an interface is a 2x2 propagator
+    between the coefficients of neighboring disks.
+    To prevent the growing ``i0``-mode from spoiling the recursion,
+    the propagators are chained in ratio-form (``A/B``) from the outer
+    boundary inwards and the coefficients are then recovered
+    from the well outwards.
+    All bessel functions are exponentially scaled, so no overflow occurs.
+
+    The costs are linear in the number of partitions and all
+    leading dimensions of the input are broadcasted,
+    so the solver is vectorized over s and over several parameter sets.
+
+    Parameters
+    ----------
+    Cs : :class:`numpy.ndarray`
+        Square-root of the diffusivities times ``sqrt(s)``
+        with shape ``(..., parts)``
+    rpart : :class:`numpy.ndarray`
+        Given radii separating the disks as well as starting- and endpoints
+        with shape ``(..., parts+1)``
+    Tpart : :class:`numpy.ndarray`
+        Given transmissivity values for each disk with shape ``(..., parts)``
+    Qs : :class:`numpy.ndarray`
+        Pumping-condition at the well with shape ``(...)``
+
+    Returns
+    -------
+    X : :class:`numpy.ndarray`
+        Coefficients ``[A_0, B_0, A_1, B_1, ...]`` of ``i0`` and ``k0``
+        in each disk with shape ``(..., 2*parts)``
+    '''
+
+    Cs = np.asarray(Cs)
+    rpart = np.asarray(rpart, dtype=float)
+    Tpart = np.asarray(Tpart, dtype=float)
+    parts = Cs.shape[-1]
+
+    # rho[..., j] is the ratio A_j/B_j scaled by exp(2*Cs_j*rpart_j+1)
+    rho = np.zeros(np.broadcast(Cs, Tpart, rpart[..., 1:]).shape,
+                   dtype=Cs.dtype)
+
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        # exp(-2*Cs*width) is the decay of the i0-mode relative to the
+        # k0-mode within a disk (an infinite disk is set explicitly,
+        # since inf*z is nan for complex z)
+        width = rpart[..., 1:] - rpart[..., :-1]
+        finite = np.isfinite(width)
+        dec = np.where(finite, np.exp(-2.0*Cs*np.where(finite, width, 0.0)),
+                       0.0)
+
+        # fixed head at a finite outer boundary (selected per parameter set)
+        x_o = Cs[..., -1]*rpart[..., -1]
+        rho[..., -1] = np.where(rpart[..., -1] < np.inf,
+                                -_k0e(x_o)/_i0e(x_o), 0.0)
+
+        # chain the propagators from the outer boundary inwards
+        for j in range(parts-1, 0, -1):
+            # admittance T*r*dh/dr/h at the inner radius of disk j
+            x_i = Cs[..., j]*rpart[..., j]
+            adm = Tpart[..., j]*x_i*(rho[..., j]*dec[..., j]*_i1e(x_i)
+                                     - _k1e(x_i)) \
+                / (rho[..., j]*dec[..., j]*_i0e(x_i) + _k0e(x_i))
+            # continuity of head and flux determines the ratio in disk j-1
+            x_o = Cs[..., j-1]*rpart[..., j]
+            rho[..., j-1] = (adm*_k0e(x_o) + Tpart[..., j-1]*x_o*_k1e(x_o)) \
+                / (Tpart[..., j-1]*x_o*_i1e(x_o) - adm*_i0e(x_o))
+
+        # the pumping-condition at the well determines B_0
+        # (a finite well-radius is selected per parameter set)
+        B = np.zeros_like(rho)
+        x_w = Cs[..., 0]*rpart[..., 0]
+        B[..., 0] = np.where(rpart[..., 0] > 0.0,
+                             Qs/(x_w*np.exp(-x_w)*(_k1e(x_w) - rho[..., 0]
+                                                   * dec[..., 0]*_i1e(x_w))),
+                             Qs)
+
+        # recover the coefficients from the continuity of the head outwards
+        for j in range(parts-1):
+            x_o = Cs[..., j]*rpart[..., j+1]
+            x_i = Cs[..., j+1]*rpart[..., j+1]
+            B[..., j+1] = B[..., j]*np.exp(x_i - x_o) \
+                * (rho[..., j]*_i0e(x_o) + _k0e(x_o)) \
+                / (rho[..., j+1]*dec[..., j+1]*_i0e(x_i) + _k0e(x_i))
+
+        X = np.empty(rho.shape[:-1] + (2*parts,), dtype=rho.dtype)
+        X[..., 0::2] = rho*np.exp(-2.0*Cs*rpart[..., 1:])*B
+        X[..., 1::2] = B
+
+    # the i0-mode vanishes in an infinite outer disk
+    X[..., -2] = np.where(rpart[..., -1] < np.inf, X[..., -2], 0.0)
+
+    return X
+
+
+def _banded_solve(Mb, V):
+    '''
+    Solve a stack of banded linear equation systems at once.
+
+    The matrices are given in the banded storage of
+    :any:`scipy.linalg.solve_banded` with two lower and two upper diagonals.
+    The systems are solved by gaussian elimination with partial pivoting,
+    where every step is vectorized over all systems.
+
+    Parameters
+    ----------
+    Mb : :class:`numpy.ndarray`
+        Banded matrices with shape ``(n_sys, 5, n)``
+    V : :class:`numpy.ndarray`
+        Right hand sides with shape ``(n_sys, n)``
+
+    Returns
+    -------
+    X : :class:`numpy.ndarray`
+        Solutions with shape ``(n_sys, n)``.
+        Singular systems result in non-finite values.
+    '''
+
+    n_sys, _, size = Mb.shape
+    sys_id = np.arange(n_sys)
+    dtype = np.result_type(Mb, V)
+
+    # store the matrices row-wise: A[:, i, k] = M[i, i+k-2]
+    # with two extra columns for the fill-in from pivoting
+    # and two extra rows to keep the elimination window in bounds
+    A = np.zeros((n_sys, size+2, 7), dtype=dtype)
+    b = np.zeros((n_sys, size+2), dtype=dtype)
+    b[:, :size] = V
+    for k in range(5):
+        i_lo, i_hi = max(0, 2-k), min(size, size+2-k)
+        A[:, i_lo:i_hi, k] = Mb[:, 4-k, i_lo+k-2:i_hi+k-2]
+
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        # forward elimination on the 3x5 window of each column
+        for j in range(size):
+            W = np.stack([A[:, j+d, 2-d:7-d] for d in range(3)], axis=1)
+            bw = b[:, j:j+3].copy()
+
+            # partial pivoting: swap the row with the largest entry to top
+            piv = np.argmax(np.abs(W[:, :, 0]), axis=1)
+            W_top, b_top = W[sys_id, piv].copy(), bw[sys_id, piv].copy()
+            W[sys_id, piv], bw[sys_id, piv] = W[:, 0], bw[:, 0]
+            W[:, 0], bw[:, 0] = W_top, b_top
+
+            # eliminate the entries below the pivot
+            fac = W[:, 1:, 0]/W[:, :1, 0]
+            W[:, 1:] -= fac[:, :, np.newaxis]*W[:, np.newaxis, 0]
+            bw[:, 1:] -= fac*bw[:, :1]
+
+            for d in range(3):
+                A[:, j+d, 2-d:7-d] = W[:, d]
+            b[:, j:j+3] = bw
+
+        # backward substitution with the upper bandwidth of 4
+        X = np.zeros((n_sys, size+4), dtype=dtype)
+        for j in range(size-1, -1, -1):
+            X[:, j] = (b[:, j] - np.sum(A[:, j, 3:]*X[:, j+1:j+5], axis=1)) \
+                / A[:, j, 2]
+
+    return X[:, :size]
+
+
+def _i0(x):
+    # modified bessel function of first kind (order 0) for real and complex x
+    return iv(0, x) if np.iscomplexobj(x) else i0(x)
+
+
+def _i1(x):
+    # modified bessel function of first kind (order 1) for real and complex x
+    return iv(1, x) if np.iscomplexobj(x) else i1(x)
+
+
+def _k0(x):
+    # modified bessel function of second kind (order 0) for real and complex x
+    return kv(0, x) if np.iscomplexobj(x) else k0(x)
+
+
+def _k1(x):
+    # modified bessel function of second kind (order 1) for real and complex x
+    return kv(1, x) if np.iscomplexobj(x) else k1(x)
+
+
+def _i0e(x):
+    # i0(x)*exp(-x) (for real(x) >= 0, as needed in the propagators)
+    return ive(0, x)*np.exp(-1j*x.imag) if np.iscomplexobj(x) else i0e(x)
+
+
+def _i1e(x):
+    # i1(x)*exp(-x) (for real(x) >= 0, as needed in the propagators)
+    return ive(1, x)*np.exp(-1j*x.imag) if np.iscomplexobj(x) else i1e(x)
+
+
+def _k0e(x):
+    # k0(x)*exp(x) for real and complex x
+    return kve(0, x) if np.iscomplexobj(x) else k0e(x)
+
+
+def _k1e(x):
+    # k1(x)*exp(x) for real and complex x
+    return kve(1, x) if np.iscomplexobj(x) else k1e(x)
+
+
 if __name__ == "__main__":
     import doctest
     doctest.testmod()
@@ -21,17 +21,22 @@ The following functions are provided
    T_CG
    T_CG_inverse
    T_CG_error
+   T_CG_hmean
    K_CG
    K_CG_inverse
    K_CG_error
+   K_CG_hmean
    aniso
    well_solution
+   well_function
 """
 
 from __future__ import absolute_import, division, print_function
 
+from math import factorial
+
 import numpy as np
-from scipy.special import exp1
+from scipy.special import exp1, expi, hyp1f1
 from scipy.integrate import quad as integ
 
 __all__ = ["rad_amean_func",
@@ -39,9 +44,23 @@ __all__ = ["rad_amean_func",
            "rad_hmean_func",
            "rad_pmean_func",
            "radii", "specialrange", "specialrange_cut",
-           "T_CG", "T_CG_inverse", "T_CG_error",
-           "K_CG", "K_CG_inverse", "K_CG_error",
-           "aniso", "well_solution"]
+           "T_CG", "T_CG_inverse", "T_CG_error", "T_CG_hmean",
+           "K_CG", "K_CG_inverse", "K_CG_error", "K_CG_hmean",
+           "aniso", "well_solution", "well_function"]
+
+# order of the gauss-legendre quadrature for the radial means, where
+# twice the order is used to check the relative error
+_GL_ORDER = 16
+_GL_TOL = 1e-12
+_GL_LOOKUP = {}
+
+# interpolation tables of the well-function for given tolerances
+E1_LOOKUP = {}
+# range of the interpolation table, below a series is used and above
+# the well-function is set to 0 (since E1(700) < 1e-306)
+_E1_RANGE = (1e-2, 700.0)
+# degree of the interpolating polynomials
+_E1_DEG = 4
 
 
 def rad_amean_func(func, val_arr, arg_dict=None, **kwargs):
@@ -102,7 +121,6 @@ def rad_amean_func(func, val_arr, arg_dict=None, **kwargs):
     kwargs.update(arg_dict)
 
     val_arr = np.array(val_arr, dtype=float).reshape(-1)
-    parts = len(val_arr) - 1
 
     if not callable(func):
         raise ValueError(
@@ -114,32 +132,8 @@ def rad_amean_func(func, val_arr, arg_dict=None, **kwargs):
         raise ValueError(
             "The input values need to be sorted")
 
-    # dummy function defining the needed integrand
-    def _step(func, kwargs):
-        """
-        dummy function providing the integrand
-        """
-        def integrand(val):
-            '''
-            Integrand for the geometric mean ``r*log(f(r))``
-            '''
-            return 2*val*func(val, **kwargs)
-        return integrand
-
-    # creating the output array
-    func_arr = np.zeros_like(val_arr[:-1], dtype=float)
-
-    # iterating over the input values
-    for i in range(parts):
-        # if one side is infinity, the function is evaluated at infinity
-        if val_arr[i+1] == np.inf:
-            func_arr[i] = func(np.inf, **kwargs)
-        else:
-            func_arr[i] = integ(_step(func, kwargs),
-                                val_arr[i], val_arr[i+1])[0]
-            func_arr[i] = func_arr[i]/(val_arr[i+1]**2 - val_arr[i]**2)
-
-    return func_arr
+    return _rad_mean(func, val_arr, kwargs,
+                     trans=lambda val: val, back=lambda val: val)
 
 
 def rad_gmean_func(func, val_arr, arg_dict=None, **kwargs):
@@ -200,7 +194,6 @@ def rad_gmean_func(func, val_arr, arg_dict=None, **kwargs):
     kwargs.update(arg_dict)
 
     val_arr = np.array(val_arr, dtype=float).reshape(-1)
-    parts = len(val_arr) - 1
 
     if not callable(func):
         raise ValueError(
@@ -212,32 +205,7 @@ def rad_gmean_func(func, val_arr, arg_dict=None, **kwargs):
         raise ValueError(
             "The input values need to be sorted")
 
-    # dummy function defining the needed integrand
-    def _step(func, kwargs):
-        """
-        dummy function providing the integrand
-        """
-        def integrand(val):
-            '''
-            Integrand for the geometric mean ``r*log(f(r))``
-            '''
-            return 2*val*np.log(func(val, **kwargs))
-        return integrand
-
-    # creating the output array
-    func_arr = np.zeros_like(val_arr[:-1], dtype=float)
-
-    # iterating over the input values
-    for i in range(parts):
-        # if one side is infinity, the function is evaluated at infinity
-        if val_arr[i+1] == np.inf:
-            func_arr[i] = func(np.inf, **kwargs)
-        else:
-            func_arr[i] = integ(_step(func, kwargs),
-                                val_arr[i], val_arr[i+1])[0]
-            func_arr[i] = np.exp(func_arr[i]/(val_arr[i+1]**2 - val_arr[i]**2))
-
-    return func_arr
+    return _rad_mean(func, val_arr, kwargs, trans=np.log, back=np.exp)
 
 
 def rad_hmean_func(func, val_arr, arg_dict=None, **kwargs):
@@ -298,7 +266,6 @@ def rad_hmean_func(func, val_arr, arg_dict=None, **kwargs):
     kwargs.update(arg_dict)
 
     val_arr = np.array(val_arr, dtype=float).reshape(-1)
-    parts = len(val_arr) - 1
 
     if not callable(func):
         raise ValueError(
@@ -310,32 +277,8 @@ def rad_hmean_func(func, val_arr, arg_dict=None, **kwargs):
         raise ValueError(
             "The input values need to be sorted")
 
-    # dummy function defining the needed integrand
-    def _step(func, kwargs):
-        """
-        dummy function providing the integrand
-        """
-        def integrand(val):
-            '''
-            Integrand for the geometric mean ``r*log(f(r))``
-            '''
-            return 2*val/func(val, **kwargs)
-        return integrand
-
-    # creating the output array
-    func_arr = np.zeros_like(val_arr[:-1], dtype=float)
-
-    # iterating over the input values
-    for i in range(parts):
-        # if one side is infinity, the function is evaluated at infinity
-        if val_arr[i+1] == np.inf:
-            func_arr[i] = func(np.inf, **kwargs)
-        else:
-            func_arr[i] = integ(_step(func, kwargs),
-                                val_arr[i], val_arr[i+1])[0]
-            func_arr[i] = 1.0/(func_arr[i]/(val_arr[i+1]**2 - val_arr[i]**2))
-
-    return func_arr
+    return _rad_mean(func, val_arr, kwargs,
+                     trans=lambda val: 1.0/val, back=lambda val: 1.0/val)
 
 
 def rad_pmean_func(func, val_arr, p=1.0, arg_dict=None, **kwargs):
@@ -403,7 +346,6 @@ def rad_pmean_func(func, val_arr, p=1.0, arg_dict=None, **kwargs):
     kwargs.update(arg_dict)
 
     val_arr = np.array(val_arr, dtype=float).reshape(-1)
-    parts = len(val_arr) - 1
 
     if not callable(func):
         raise ValueError(
@@ -415,35 +357,88 @@ def rad_pmean_func(func, val_arr, p=1.0, arg_dict=None, **kwargs):
         raise ValueError(
             "The input values need to be sorted")
 
-    # dummy function defining the needed integrand
-    def _step(func, kwargs):
-        """
-        dummy function providing the integrand
-        """
-        def integrand(val):
-            '''
-            Integrand for the geometric mean ``r*log(f(r))``
-            '''
-            return 2*val*func(val, **kwargs)**p
-        return integrand
-
-    # creating the output array
-    func_arr = np.zeros_like(val_arr[:-1], dtype=float)
-
-    # iterating over the input values
-    for i in range(parts):
-        # if one side is infinity, the function is evaluated at infinity
-        if val_arr[i+1] == np.inf:
-            func_arr[i] = func(np.inf, **kwargs)
-        else:
-            func_arr[i] = integ(_step(func, kwargs),
-                                val_arr[i], val_arr[i+1])[0]
-            func_arr[i] = (func_arr[i] /
-                           (val_arr[i+1]**2 - val_arr[i]**2))**(1.0/p)
+    return _rad_mean(func, val_arr, kwargs,
+                     trans=lambda val: val**p, back=lambda val: val**(1.0/p))
+
+
+def _rad_mean(func, val_arr, kwargs, trans, back):
+    '''
+    Radial mean of a function within the disks given by consecutive radii.
+
+    The integrals ``2*r*trans(func(r))`` over all finite disks are
+    calculated at once by gauss-legendre quadratures of two orders,
+    so ``func`` is only called once with an array of radii.
+    Disks, where both orders disagree or where ``func`` can't handle arrays,
+    are integrated adaptively by :any:`scipy.integrate.quad`.
+
+    Parameters
+    ----------
+    func : :any:`callable`
+        function that should be used: ``func(r, **kwargs)``
+    val_arr : :class:`numpy.ndarray`
+        given radii defining the disks
+    kwargs : :class:`dict`
+        Keyword-arguments that are forwarded to ``func``
+    trans : :any:`callable`
+        Transformation of the function-values before averaging
+    back : :any:`callable`
+        Inverse of ``trans`` applied to the averaged values
+
+    Returns
+    -------
+    :class:`numpy.ndarray`
+        Array with all calculated means
+    '''
+
+    parts = len(val_arr) - 1
+    func_arr = np.zeros(parts, dtype=float)
+
+    # if one side is infinity, the function is evaluated at infinity
+    if val_arr[-1] == np.inf:
+        func_arr[-1] = func(np.inf, **kwargs)
+        parts -= 1
+
+    lower, upper = val_arr[:parts], val_arr[1:parts+1]
+    half = (upper - lower)/2.0
+    nodes, weights = _gauss_legendre()
+    rad = (lower + half)[:, np.newaxis] + half[:, np.newaxis]*nodes
+
+    # evaluate the function for all disks at once
+    try:
+        val = np.broadcast_to(func(rad.reshape(-1), **kwargs), rad.size)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            val = 2*rad*trans(val.reshape(rad.shape))
+        est = half[:, np.newaxis]*np.dot(val, weights)
+        # the higher order is used, if both orders agree
+        error = np.abs(est[:, 1] - est[:, 0])
+        adapt = np.logical_not(error <= _GL_TOL*np.abs(est[:, 1]))
+    except (TypeError, ValueError):
+        # func is not capable of taking numpy arrays
+        est = np.zeros((parts, 2))
+        adapt = np.ones(parts, dtype=bool)
+
+    for i in np.nonzero(adapt)[0]:
+        est[i, 1] = integ(lambda r: 2*r*trans(func(r, **kwargs)),
+                          lower[i], upper[i])[0]
+
+    func_arr[:parts] = back(est[:, 1]/(upper**2 - lower**2))
 
     return func_arr
 
 
+def _gauss_legendre():
+    # nodes with shape (3n,) and weights with shape (3n, 2) of the
+    # gauss-legendre rules of order n and 2n on [-1, 1]
+    if not _GL_LOOKUP:
+        nodes_lo, weights_lo = np.polynomial.legendre.leggauss(_GL_ORDER)
+        nodes_hi, weights_hi = np.polynomial.legendre.leggauss(2*_GL_ORDER)
+        weights = np.zeros((3*_GL_ORDER, 2))
+        weights[:_GL_ORDER, 0] = weights_lo
+        weights[_GL_ORDER:, 1] = weights_hi
+        _GL_LOOKUP["rule"] = (np.concatenate((nodes_lo, nodes_hi)), weights)
+    return _GL_LOOKUP["rule"]
+
+
 def radii(parts, rwell=0.0, rinf=np.inf, rlast=500.0, typ="log"):
     '''
     Calculation of specific point distributions for the diskmodel.
@@ -754,6 +749,70 @@ def T_CG_error(err, TG, sig2, corr, prop=1.6, Twell=None):
         return 1.
 
 
+def T_CG_hmean(rpart, TG, sig2, corr, prop=1.6, Twell=None):
+    '''
+    The harmonic means of the coarse-graining Transmissivity within
+    consecutive disks, calculated analytically.
+
+    This gives the same values as
+    ``rad_hmean_func(T_CG, rpart, TG=TG, sig2=sig2, corr=corr, ...)``,
+    but without numerical quadrature, using the antiderivative
+
+    .. math::
+       \\intop 2r\\cdot e^{-\\frac{\\chi}{1+a r^2}}\\, dr =
+       \\frac{1}{a}\\left(v\\cdot e^{-\\frac{\\chi}{v}} +
+       \\chi\\cdot\\mathrm{Ei}\\left(-\\frac{\\chi}{v}\\right)\\right),
+       \\quad v = 1+a r^2,\\quad a = \\left(\\frac{prop}{corr}\\right)^2
+
+    See: :func:`T_CG`
+
+    Parameters
+    ----------
+    rpart : :class:`numpy.ndarray`
+        given radii defining the disks
+    TG : :class:`float`
+        Geometric-mean of the transmissivity-distribution
+    sig2 : :class:`float`
+        log-normal-variance of the transmissivity-distribution
+    corr : :class:`float`
+        corralation-length of transmissivity-distribution
+    prop: :class:`float`, optional
+        Proportionality factor used within the upscaling procedure.
+        Default: ``1.6``
+    Twell : :class:`float`, optional
+        Explicit transmissivity value at the well. Default: ``None``
+
+    Returns
+    -------
+    T_CG_hmean : :class:`numpy.ndarray`
+        Array containing the harmonic mean transmissivity of each disk.
+
+    Raises
+    ------
+    ValueError
+        If ``rpart`` has less than 2 values.
+    ValueError
+        If ``rpart`` is not sorted in incresing order.
+
+    Notes
+    -----
+    If the last value in rpart is "inf", the farfield value ``TG`` is
+    used for the last disk.
+
+    Example
+    -------
+    >>> T_CG_hmean([0, 1, 2, 3], 0.001, 1, 10, 2)
+    array([ 0.00061246,  0.00063438,  0.00067178])
+    '''
+
+    if Twell is not None:
+        chi = np.log(Twell) - np.log(TG)
+    else:
+        chi = -sig2/2.0
+
+    return _cg_hmean(rpart, TG, chi, 1.0, (prop/corr)**2)
+
+
 def K_CG(rad, KG, sig2, corr, e, prop=1.6, Kwell="KH"):
     '''
     The coarse-graining conductivity.
@@ -928,6 +987,136 @@ def K_CG_error(err, KG, sig2, corr, e, prop=1.6, Kwell="KH"):
         return 1.
 
 
+def K_CG_hmean(rpart, KG, sig2, corr, e, prop=1.6, Kwell="KH"):
+    '''
+    The harmonic means of the coarse-graining conductivity within
+    consecutive disks, calculated analytically.
+
+    This gives the same values as
+    ``rad_hmean_func(K_CG, rpart, KG=KG, sig2=sig2, corr=corr, e=e, ...)``,
+    but without numerical quadrature, using the antiderivative
+
+    .. math::
+       \\intop 2r\\cdot e^{-\\frac{\\chi}{\\left(1+b r^2\\right)^{3/2}}}
+       \\, dr = \\frac{v}{b}\\cdot {}_1F_1\\left(-\\frac{2}{3};
+       \\frac{1}{3};-\\frac{\\chi}{v^{3/2}}\\right),
+       \\quad v = 1+b r^2,\\quad b = \\left(\\frac{prop}{corr\\cdot
+       e^{1/3}}\\right)^2
+
+    See: :func:`K_CG`
+
+    Parameters
+    ----------
+    rpart : :class:`numpy.ndarray`
+        given radii defining the disks
+    KG : :class:`float`
+        Geometric-mean conductivity-distribution
+    sig2 : :class:`float`
+        log-normal-variance of the conductivity-distribution
+    corr : :class:`float`
+        corralation-length of conductivity-distribution
+    e : :class:`float`
+        Anisotropy-ratio of the vertical and horizontal corralation-lengths
+    prop: :class:`float`, optional
+        Proportionality factor used within the upscaling procedure.
+        Default: ``1.6``
+    Kwell :  :class:`str` or  :class:`float`, optional
+        Explicit conductivity value at the well. One can choose between the
+        harmonic mean (``"KH"``),
+        the arithmetic mean (``"KA"``) or an arbitrary float
+        value. Default: ``"KH"``
+
+    Returns
+    -------
+    K_CG_hmean : :class:`numpy.ndarray`
+        Array containing the harmonic mean conductivity of each disk.
+
+    Raises
+    ------
+    ValueError
+        If ``rpart`` has less than 2 values.
+    ValueError
+        If ``rpart`` is not sorted in incresing order.
+
+    Notes
+    -----
+    If the last value in rpart is "inf", the farfield value
+    ``KG*exp(sig2*(0.5 - aniso(e)))`` is used for the last disk.
+
+    Example
+    -------
+    >>> K_CG_hmean([0, 1, 2, 3], 0.001, 1, 10, 1, 2)
+    array([ 0.00061835,  0.0006619 ,  0.00073558])
+    '''
+
+    Kefu = KG*np.exp(sig2*(0.5 - aniso(e)))
+    if Kwell == "KH":
+        chi = sig2*(aniso(e)-1.)
+    elif Kwell == "KA":
+        chi = sig2*aniso(e)
+    else:
+        chi = np.log(Kwell) - np.log(Kefu)
+
+    return _cg_hmean(rpart, Kefu, chi, 1.5, (prop/(corr*e**(1./3.)))**2)
+
+
+def _cg_hmean(rpart, val_far, chi, pot, fac):
+    # harmonic means of val_far*exp(chi*(1+fac*r**2)**(-pot)) in the disks
+    rpart = np.array(rpart, dtype=float).reshape(-1)
+
+    if len(rpart) < 2:
+        raise ValueError(
+            "To few input values in rpart. Need at least 2.")
+    if not np.all(rpart[:-1] < rpart[1:]):
+        raise ValueError(
+            "The input values need to be sorted")
+
+    # the farfield value is used for an infinite disk
+    res = np.full(len(rpart)-1, val_far, dtype=float)
+    fin = rpart[1:] < np.inf
+    # the integrals are taken with respect to v = 1+fac*r**2
+    v_0 = 1.0 + fac*rpart[:-1][fin]**2
+    v_1 = 1.0 + fac*rpart[1:][fin]**2
+    res[fin] = val_far/_exp_mean(chi, pot, v_0, v_1)
+
+    return res
+
+
+def _exp_mean(chi, pot, v_0, v_1):
+    # mean of exp(-chi*v**(-pot)) within [v_0, v_1]
+    mid, half = (v_1 + v_0)/2.0, (v_1 - v_0)/2.0
+    # narrow intervals would suffer from cancellation in the antiderivative
+    # so a taylor-expansion at the midpoint is used there
+    narrow = half < 5e-3*mid
+    wide = np.logical_not(narrow)
+    res = np.empty_like(mid)
+
+    res[wide] = (_exp_int(chi, pot, v_1[wide])
+                 - _exp_int(chi, pot, v_0[wide]))/(2.0*half[wide])
+
+    # derivatives q_k of q(v) = -chi*v**(-pot) at the midpoint
+    v_m, h_m = mid[narrow], half[narrow]
+    q_k = [-chi*v_m**(-pot)]
+    for k in range(4):
+        q_k.append(q_k[-1]*(-pot-k)/v_m)
+    # 2nd and 4th derivative of exp(q) divided by exp(q)
+    d_2 = q_k[2] + q_k[1]**2
+    d_4 = q_k[4] + 4*q_k[3]*q_k[1] + 3*q_k[2]**2 \
+        + 6*q_k[2]*q_k[1]**2 + q_k[1]**4
+    res[narrow] = np.exp(q_k[0])*(1.0 + d_2*h_m**2/6.0 + d_4*h_m**4/120.0)
+
+    return res
+
+
+def _exp_int(chi, pot, val):
+    # antiderivative of exp(-chi*v**(-pot)) in v
+    if chi == 0.0:
+        return val
+    if pot == 1.0:
+        return val*np.exp(-chi/val) + chi*expi(-chi/val)
+    return val*hyp1f1(-1.0/pot, 1.0-1.0/pot, -chi*val**(-pot))
+
+
 def aniso(e):
     '''
     The anisotropy function.
@@ -977,7 +1166,7 @@ def aniso(e):
 
 
 def well_solution(rad, time, T, S, Qw,
-                  struc_grid=True, hinf=0.0):
+                  struc_grid=True, hinf=0.0, exp1_tol=None):
     '''
     The classical Theis solution for transient flow under a pumping condition
     in a confined and homogeneous aquifer.
@@ -1003,6 +1192,10 @@ def well_solution(rad, time, T, S, Qw,
         Default: ``True``
     hinf : :class:`float`, optional
         Reference head at the outer boundary "rinf". Default: ``0.0``
+    exp1_tol : :class:`float` or :any:`None`, optional
+        Relative tolerance for the fast approximation of the well-function.
+        If ``None``, the exact :any:`scipy.special.exp1` is used.
+        See: :func:`well_function`. Default: ``None``
 
     Returns
     -------
@@ -1066,14 +1259,14 @@ def well_solution(rad, time, T, S, Qw,
         raise ValueError(
             "The Storage needs to be positiv")
 
-    res = np.zeros(time.shape + rad.shape)
-
-    for ti, te in np.ndenumerate(time):
-        for ri, re in np.ndenumerate(rad):
-            res[ti+ri] = Qw/(4.0*np.pi*T)*exp1(re**2*S/(4*T*te))
+    # evaluate the unstructured space-time points pointwise
+    if not struc_grid:
+        res = Qw/(4.0*np.pi*T)*well_function(rad**2*S/(4*T*time), exp1_tol)
+        return res.reshape(grid_shape) + hinf
 
-    if not struc_grid and grid_shape:
-        res = np.copy(np.diag(res).reshape(grid_shape))
+    # broadcast the time- and radius-axis to a structured grid
+    u_arg = np.multiply.outer(S/(4*T*time), rad**2)
+    res = Qw/(4.0*np.pi*T)*well_function(u_arg, exp1_tol)
 
     # add the reference head
     res += hinf
@@ -1081,6 +1274,127 @@ def well_solution(rad, time, T, S, Qw,
     return res
 
 
+def well_function(u, tol=None):
+    '''
+    The well-function of Theis given by the exponential integral
+
+    .. math::
+       W\\left(u\\right) = E_1\\left(u\\right) =
+       \\intop_{u}^{\\infty} \\frac{e^{-x}}{x}\\, dx
+
+    If a tolerance is given, a fast approximation is used:
+    ``log(u*exp(u)*E1(u))`` is interpolated piecewise by chebyshev-polynomials
+    in ``log(u)``, where the number of pieces is chosen to reach the given
+    relative tolerance. For small ``u`` the series
+    ``E1(u) = -gamma - log(u) - sum((-u)**k/(k*k!))`` is used.
+    The interpolation tables are calculated once for each tolerance and
+    stored in ``E1_LOOKUP``.
+
+    Parameters
+    ----------
+    u : :class:`float` or :class:`numpy.ndarray`
+        Argument of the well-function
+    tol : :class:`float` or :any:`None`, optional
+        Relative tolerance of the fast approximation.
+        If ``None`` or below ``1e-12``, which is the limit of the rounding
+        errors, :any:`scipy.special.exp1` is used. Default: ``None``
+
+    Returns
+    -------
+    well_function : :class:`float` or :class:`numpy.ndarray`
+        Values of the well-function.
+
+    Notes
+    -----
+    Values below ``1e-300`` (for ``u > 700``) are set to ``0``.
+
+    Example
+    -------
+    >>> well_function([0.001, 0.1, 10], tol=1e-8)
+    array([  6.33153936e+00,   1.82292396e+00,   4.15696893e-06])
+    '''
+
+    if tol is None or tol < 1e-12:
+        return exp1(u)
+
+    is_scal = np.isscalar(u)
+    u = np.array(u, dtype=float)
+    u_lo, u_hi = _E1_RANGE
+
+    # zero at the upper end, singularity at 0 and nan for negative u
+    res = np.where(u > u_hi, 0.0, np.nan)
+    res[u == 0.0] = np.inf
+
+    # series for small u
+    small = (u > 0.0) & (u < u_lo)
+    res[small] = _e1_series(u[small], tol)
+
+    # piecewise interpolation in between
+    inner = (u >= u_lo) & (u <= u_hi)
+    x_0, width, poly = _e1_table(tol)
+    u_in = u[inner]
+    pos = (np.log(u_in) - x_0)/width
+    ind = np.minimum(pos.astype(int), poly.shape[1]-1)
+    loc = 2.0*(pos - ind) - 1.0
+    # horner-scheme with the polynomial-coefficients of each piece
+    val = poly[-1][ind]
+    for coef in poly[-2::-1]:
+        val *= loc
+        val += coef[ind]
+    res[inner] = np.exp(val - u_in)/u_in
+
+    if is_scal:
+        res = res.item()
+
+    return res
+
+
+def _e1_series(u, tol):
+    # power-series of E1 (the terms decrease fast for u < 1e-2)
+    res = -np.euler_gamma - np.log(u)
+    term = np.ones_like(u)
+    k = 1
+    while _E1_RANGE[0]**k/(k*factorial(k)) > 1e-3*tol:
+        term *= -u/k
+        res -= term/k
+        k += 1
+    return res
+
+
+def _e1_table(tol):
+    # piecewise chebyshev-interpolation of log(u*exp(u)*E1(u)) in log(u)
+    # with monomial-coefficients (_E1_DEG+1, pieces) on [-1, 1]
+    if tol in E1_LOOKUP:
+        return E1_LOOKUP[tol]
+
+    x_0, x_1 = np.log(_E1_RANGE[0]), np.log(_E1_RANGE[1])
+    size = _E1_DEG + 1
+    theta = np.pi*(np.arange(size) + 0.5)/size
+    # monomial-coefficients of the chebyshev-polynomials (columns)
+    cheb = np.zeros((size, size))
+    for k in range(size):
+        cheb[:k+1, k] = np.polynomial.chebyshev.cheb2poly(np.eye(size)[k])
+
+    # double the number of pieces until the tolerance is reached
+    pieces = 4
+    while True:
+        width = (x_1 - x_0)/pieces
+        x_val = x_0 + (np.arange(pieces)[:, np.newaxis]
+                       + (np.cos(theta) + 1.0)/2.0)*width
+        u_val = np.exp(x_val)
+        h_val = x_val + u_val + np.log(exp1(u_val))
+        coef = 2.0/size*np.dot(h_val, np.cos(np.outer(theta,
+                                                     np.arange(size))))
+        coef[:, 0] /= 2.0
+        E1_LOOKUP[tol] = (x_0, width, np.dot(cheb, coef.T))
+        # check the relative error between the nodes
+        u_chk = np.exp(np.linspace(x_0, x_1, 8*size*pieces + 1))
+        err = np.max(np.abs(well_function(u_chk, tol)/exp1(u_chk) - 1.0))
+        if err < tol or pieces >= 2**16:
+            return E1_LOOKUP[tol]
+        pieces *= 2
+
+
 if __name__ == "__main__":
     import doctest
     doctest.testmod()
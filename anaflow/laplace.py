@@ -11,91 +11,37 @@ The following functions are provided
 .. autosummary::
 
    stehfest
+   talbot
+   fourier
+   gaver
+   c_array
+   save_c_lookup
+   load_c_lookup
 """
 
 from __future__ import absolute_import, division, print_function
 
-from math import floor, factorial
+from contextlib import contextmanager
+from fractions import Fraction
+from functools import partial
+from math import factorial
+from multiprocessing import cpu_count
 import numpy as np
 
-__all__ = ["stehfest"]
-
-
-C_LOOKUP = {2: np.array([2.000000000000000000e+00,
-                         -2.000000000000000000e+00]),
-            4: np.array([-2.000000000000000000e+00,
-                         2.600000000000000000e+01,
-                         -4.800000000000000000e+01,
-                         2.400000000000000000e+01]),
-            6: np.array([1.000000000000000000e+00,
-                         -4.900000000000000000e+01,
-                         3.660000000000000000e+02,
-                         -8.580000000000000000e+02,
-                         8.100000000000000000e+02,
-                         -2.700000000000000000e+02]),
-            8: np.array([-3.333333333333333148e-01,
-                         4.833333333333333570e+01,
-                         -9.060000000000000000e+02,
-                         5.464666666666666060e+03,
-                         -1.437666666666666606e+04,
-                         1.873000000000000000e+04,
-                         -1.194666666666666606e+04,
-                         2.986666666666666515e+03]),
-            10: np.array([8.333333333333332871e-02,
-                          -3.208333333333333570e+01,
-                          1.279000000000000000e+03,
-                          -1.562366666666666606e+04,
-                          8.424416666666665697e+04,
-                          -2.369575000000000000e+05,
-                          3.759116666666666861e+05,
-                          -3.400716666666666861e+05,
-                          1.640625000000000000e+05,
-                          -3.281250000000000000e+04]),
-            12: np.array([-1.666666666666666644e-02,
-                          1.601666666666666572e+01,
-                          -1.247000000000000000e+03,
-                          2.755433333333333212e+04,
-                          -2.632808333333333139e+05,
-                          1.324138699999999953e+06,
-                          -3.891705533333333209e+06,
-                          7.053286333333333023e+06,
-                          -8.005336500000000000e+06,
-                          5.552830500000000000e+06,
-                          -2.155507200000000186e+06,
-                          3.592512000000000116e+05]),
-            14: np.array([2.777777777777777884e-03,
-                          -6.402777777777778567e+00,
-                          9.240499999999999545e+02,
-                          -3.459792777777777519e+04,
-                          5.403211111111111240e+05,
-                          -4.398346366666667163e+06,
-                          2.108759177777777612e+07,
-                          -6.394491304444444180e+07,
-                          1.275975795499999970e+08,
-                          -1.701371880833333433e+08,
-                          1.503274670333333313e+08,
-                          -8.459216150000000000e+07,
-                          2.747888476666666567e+07,
-                          -3.925554966666666791e+06]),
-            16: np.array([-3.968253968253968251e-04,
-                          2.133730158730158699e+00,
-                          -5.510166666666666515e+02,
-                          3.350016111111111240e+04,
-                          -8.126651111111111240e+05,
-                          1.007618376666666567e+07,
-                          -7.324138297777777910e+07,
-                          3.390596320730158687e+08,
-                          -1.052539536278571367e+09,
-                          2.259013328583333492e+09,
-                          -3.399701984433333397e+09,
-                          3.582450461699999809e+09,
-                          -2.591494081366666794e+09,
-                          1.227049828766666651e+09,
-                          -3.427345554285714030e+08,
-                          4.284181942857142538e+07])}
-
-
-def stehfest(func, time, bound=12, arg_dict=None, **kwargs):
+__all__ = ["stehfest", "talbot", "fourier", "gaver",
+           "c_array", "save_c_lookup", "load_c_lookup"]
+
+
+# process-wide cache for the stehfest coefficients (bound -> array)
+C_LOOKUP = {}
+# process-wide cache for the weights of the gaver-functionals
+_G_LOOKUP = {}
+
+
+def stehfest(func, time, bound=12, arg_dict=None, s_tol=1e-12,
+             chunk_size=None, max_memory=None, adaptive=False,
+             return_error=False, tol=1e-8, executor=None, n_jobs=None,
+             **kwargs):
     '''
     The stehfest-algorithm for numerical laplace inversion.
 
@@ -137,14 +83,58 @@ def stehfest(func, time, bound=12, arg_dict=None, **kwargs):
         function given in ``func``. Will be merged with ``**kwargs``
         This is designed for overlapping keywords in ``stehfest`` and
         ``func``.Default: ``None``
+    s_tol : :class:`float` or :any:`None`, optional
+        Relative tolerance to identify coinciding Laplace-points
+        (like they occur for time-points ``t, 2t, 4t, ...``).
+        ``func`` is only evaluated once for each unique Laplace-point.
+        If ``None``, ``func`` is evaluated at every Laplace-point, which is
+        needed if the keyword-arguments are bound to the single points.
+        Default: ``1e-12``
+    chunk_size : :class:`int` or :any:`None`, optional
+        Number of time-points that are inverted at once. If given, the
+        time-points are processed in blocks and the results are written
+        into a preallocated output. Default: ``None``
+    max_memory : :class:`int` or :any:`None`, optional
+        Upper bound in bytes for the Laplace-space values held at once.
+        The size of the blocks of time-points is derived from the output of
+        ``func`` for the first time-point. Ignored if ``chunk_size``
+        is given. Default: ``None``
+    adaptive : :class:`bool`, optional
+        If ``True``, ``bound`` is the maximal number of interations and
+        for each time-point the smallest even bound is used, where the
+        results for this bound and the previous one differ less than
+        ``tol`` (relative to the maximal absolute value of the result).
+        If the tolerance is never met, the bound with the smallest
+        difference is used. Default: ``False``
+    return_error : :class:`bool`, optional
+        If ``True``, an estimate of the absolute error is returned as well.
+        It is the difference to the result with the previous bound, that
+        uses a subset of the same Laplace-points and thus comes for free.
+        Default: ``False``
+    tol : :class:`float`, optional
+        Relative tolerance for the adaptive bound selection.
+        Default: ``1e-8``
+    executor : :class:`concurrent.futures.Executor` or :any:`None`, optional
+        Executor (like a process-pool) to evaluate ``func`` on. The
+        Laplace-points are split into chunks, that are evaluated in parallel
+        and reassembled afterwards, so ``func`` and the keyword-arguments
+        need to be picklable for a process-pool. Default: ``None``
+    n_jobs : :class:`int` or :any:`None`, optional
+        Number of chunks for the ``executor``
+        (default: the number of CPUs). If no ``executor`` is given,
+        a process-pool with ``n_jobs`` workers is used for this call.
+        Default: ``None``
     **kwargs
         Keyword-arguments that are forwarded to the function given in ``func``.
         Will be merged with ``arg_dict``
 
     Returns
     -------
-    :class:`numpy.ndarray`
+    res : :class:`numpy.ndarray`
         Array with all evaluations in Time-space.
+    err : :class:`numpy.ndarray`
+        Estimated absolute error of ``res`` (``nan`` for ``bound=2``).
+        Only given if ``return_error=True``.
 
     Raises
     ------
@@ -169,6 +159,11 @@ def stehfest(func, time, bound=12, arg_dict=None, **kwargs):
 
     The algorithm gets unstable for ``bound`` values above 20.
 
+    The blockwise evaluation (``chunk_size`` or ``max_memory``), the
+    adaptive mode and the parallel evaluation (``executor`` or ``n_jobs``)
+    assume, that the keyword-arguments are not bound to the single
+    Laplace-points.
+
     Example
     -------
     >>> f = lambda x: x**-1
@@ -200,33 +195,877 @@ def stehfest(func, time, bound=12, arg_dict=None, **kwargs):
         raise ValueError(
             "The boundary needs to be even for the stehfest-algorithm")
 
-    # get all coefficient factors at once
-    c_fac = c_array(bound)
-    t_fac = np.log(2.0)/time
+    if chunk_size is not None and chunk_size < 1:
+        raise ValueError(
+            "The chunk-size needs to be at least 1")
+    if max_memory is not None and max_memory <= 0:
+        raise ValueError(
+            "The maximal memory needs to be positiv")
+    if n_jobs is not None and n_jobs < 1:
+        raise ValueError(
+            "The number of jobs needs to be at least 1")
 
-    # store every function-argument needed in one array
-    fargs = np.outer(t_fac, np.arange(1, bound+1))
+    with _pool(executor, n_jobs) as pool:
+        if pool is not None:
+            func = partial(_parallel, func, pool, n_jobs)
+        # the error is only estimated if needed
+        res = _blockwise(
+            lambda t: _stehfest_block(func, t, bound, s_tol, kwargs,
+                                      adaptive, tol, return_error),
+            time, chunk_size, max_memory, bound)
 
-    # get every function-value needed with one call of 'func'
-    lap_val = func(fargs.reshape(-1), **kwargs)
-    lap_val = lap_val.reshape(fargs.shape + lap_val.shape[1:])
+    # reformat the result according to the input
+    res = [np.squeeze(val) for val in res]
+    if np.ndim(res[0]) == 0 and is_scal:
+        res = [val.item() for val in res]
+
+    if return_error:
+        return res[0], res[1]
+    return res[0]
+
+
+def talbot(func, time, bound=16, arg_dict=None, chunk_size=None,
+           max_memory=None, executor=None, n_jobs=None, **kwargs):
+    '''
+    The fixed-talbot-algorithm for numerical laplace inversion.
+
+    The Bromwich-integral is evaluated along the deformed contour of
+    ''Talbot 1979''[R2]_ with the fixed parameters of
+    ''Abate, Valko 2004''[R3]_:
+
+    .. math::
+       f\\left(t\\right) &\\approx\\frac{r}{N}\\left[\\frac{1}{2}
+       \\tilde{f}\\left(r\\right)e^{rt}+\\sum_{k=1}^{N-1}
+       \\mathrm{Re}\\left(e^{t s_{k}}\\tilde{f}\\left(s_{k}\\right)
+       \\left(1+i\\sigma_{k}\\right)\\right)\\right]\\\\
+       s_{k} &=r\\theta_{k}\\left(\\cot\\theta_{k}+i\\right),\\quad
+       \\sigma_{k}=\\theta_{k}+\\left(\\theta_{k}\\cot\\theta_{k}-1\\right)
+       \\cot\\theta_{k},\\quad
+       \\theta_{k}=\\frac{k\\pi}{N},\\quad r=\\frac{2N}{5t}
+
+    In the algorithm
+    :math:`N` corresponds to ``bound``,
+    :math:`\\tilde{f}` to ``func`` and
+    :math:`t` to ``time``.
+
+    Parameters
+    ----------
+    func : :any:`callable`
+        function in laplace-space that shall be inverted.
+        The first argument needs to be the laplace-variable:
+        ``func(s, **kwargs)``
+
+        `func` needs to be capable of taking complex numpy arrays as input
+        for `s` and the first shape component of the output of `func`
+        should match the shape of `s`.
+    time : :class:`float` or :class:`numpy.ndarray`
+        time-points to evaluate the function at
+    bound : :class:`int`, optional
+        Number of Laplace-points on the contour for each time-point.
+        Default: ``16``
+    arg_dict : :class:`dict` or :any:`None`, optional
+        Keyword-arguments given as a dictionary that are forwarded to the
+        function given in ``func``. Will be merged with ``**kwargs``
+        This is designed for overlapping keywords in ``talbot`` and
+        ``func``. Default: ``None``
+    chunk_size : :class:`int` or :any:`None`, optional
+        Number of time-points that are inverted at once. Default: ``None``
+    max_memory : :class:`int` or :any:`None`, optional
+        Upper bound in bytes for the Laplace-space values held at once.
+        Ignored if ``chunk_size`` is given. Default: ``None``
+    executor : :class:`concurrent.futures.Executor` or :any:`None`, optional
+        Executor (like a process-pool) to evaluate ``func`` on. The
+        Laplace-points are split into chunks, that are evaluated in parallel
+        and reassembled afterwards, so ``func`` and the keyword-arguments
+        need to be picklable for a process-pool. Default: ``None``
+    n_jobs : :class:`int` or :any:`None`, optional
+        Number of chunks for the ``executor``
+        (default: the number of CPUs). If no ``executor`` is given,
+        a process-pool with ``n_jobs`` workers is used for this call.
+        Default: ``None``
+    **kwargs
+        Keyword-arguments that are forwarded to the function given in ``func``.
+        Will be merged with ``arg_dict``
+
+    Returns
+    -------
+    :class:`numpy.ndarray`
+        Array with all evaluations in Time-space.
+
+    Raises
+    ------
+    ValueError
+        If `func` is not callable.
+    ValueError
+        If `time` is not positive.
+    ValueError
+        If `bound` is less than 2.
+
+    References
+    ----------
+    .. [R2] Talbot, A., ''The accurate numerical inversion of
+       Laplace transforms.''
+       IMA Journal of Applied Mathematics, 23(1):97–120, 1979
+    .. [R3] Abate, J., Valko, P., ''Multi-precision Laplace transform
+       inversion.''
+       International Journal for Numerical Methods in Engineering,
+       60(5):979–993, 2004
+
+    Notes
+    -----
+    The parameter ``time`` needs to be strictly positiv.
+
+    In double precision, the error decreases rapidly up to ``bound``
+    values of about 20 (``16`` Laplace-points give around 10 digits for
+    smooth functions, whereas the stehfest-algorithm gives around 5 with
+    ``12``). For larger values, rounding errors of ``exp(2*bound/5)``
+    start to dominate.
+
+    The function in Laplace-space needs to be analytic left of the
+    contour, which is the case for the diffusion-type solutions
+    in this package.
+
+    Example
+    -------
+    >>> f = lambda x: x**-1
+    >>> talbot(f, [1,10,100])
+    array([ 1.,  1.,  1.])
+    '''
+
+    if arg_dict is None:
+        arg_dict = {}
+    kwargs.update(arg_dict)
+
+    # check and save if 't' is scalar
+    is_scal = np.isscalar(time)
+
+    # ensure that t is handled as an 1d-array
+    time = np.array(time, dtype=float).reshape(-1)
+
+    # check the input
+    if not callable(func):
+        raise ValueError(
+            "The given function needs to be callable")
+    if not np.all(time > 0.0):
+        raise ValueError(
+            "The time-values need to be positiv for the talbot-algorithm")
+    if bound < 2:
+        raise ValueError(
+            "The boundary needs to be >1 for the talbot-algorithm")
+
+    if chunk_size is not None and chunk_size < 1:
+        raise ValueError(
+            "The chunk-size needs to be at least 1")
+    if max_memory is not None and max_memory <= 0:
+        raise ValueError(
+            "The maximal memory needs to be positiv")
+    if n_jobs is not None and n_jobs < 1:
+        raise ValueError(
+            "The number of jobs needs to be at least 1")
+
+    with _pool(executor, n_jobs) as pool:
+        if pool is not None:
+            func = partial(_parallel, func, pool, n_jobs)
+        res, = _blockwise(lambda t: (_talbot_block(func, t, bound, kwargs),),
+                          time, chunk_size, max_memory, 2*bound)
+
+    # reformat the result according to the input
+    res = np.squeeze(res)
+    if np.ndim(res) == 0 and is_scal:
+        res = res.item()
+
+    return res
+
+
+def fourier(func, time, bound=4, arg_dict=None, oversample=2.0, tol=1e-8,
+            min_steps=128, executor=None, n_jobs=None, **kwargs):
+    '''
+    Fourier-series algorithm for numerical laplace inversion with the FFT.
+
+    The Bromwich-integral along the line :math:`\\mathrm{Re}(s)=a` is
+    approximated by the trapezoidal rule, which results in the
+    Fourier-series of ''Dubner, Abate 1968''[R4]_ and ''Durbin 1974''[R5]_
+
+    .. math::
+       f\\left(t\\right) \\approx\\frac{e^{at}}{T}\\left[
+       \\frac{1}{2}\\tilde{f}\\left(a\\right)+\\sum_{k=1}^{KN-1}
+       \\mathrm{Re}\\left(\\tilde{f}\\left(a+\\frac{ik\\pi}{T}\\right)
+       e^{\\frac{ik\\pi t}{T}}\\right)\\right],\\quad
+       a=-\\frac{\\ln\\left(\\varepsilon\\right)}{2T}
 
-    # do all the sumation with fancy indexing in numpy
-    res = np.tensordot(lap_val, c_fac, axes=(1, 0))
-    res = np.rollaxis(np.multiply(np.rollaxis(res, 0, res.ndim), t_fac), -1, 0)
+    For a uniform time-grid with step :math:`\\Delta t` and period
+    :math:`2T=N\\Delta t`, the sum is evaluated for all time-points at once
+    with one FFT of length :math:`N`, where the :math:`K` blocks of
+    :math:`N` frequencies are folded onto each other beforehand.
+
+    In the algorithm
+    :math:`K` corresponds to ``bound``,
+    :math:`\\varepsilon` to ``tol``,
+    :math:`\\tilde{f}` to ``func`` and
+    :math:`t` to ``time``.
+
+    Parameters
+    ----------
+    func : :any:`callable`
+        function in laplace-space that shall be inverted.
+        The first argument needs to be the laplace-variable:
+        ``func(s, **kwargs)``
+
+        `func` needs to be capable of taking complex numpy arrays as input
+        for `s` and the first shape component of the output of `func`
+        should match the shape of `s`.
+    time : :class:`float` or :class:`numpy.ndarray`
+        Uniformly spaced and increasing time-points to evaluate
+        the function at.
+    bound : :class:`int`, optional
+        Number of folded frequency-blocks ``K``. The Laplace-points are
+        ``K*N``, so the truncation error of the series decreases with it.
+        Default: ``4``
+    arg_dict : :class:`dict` or :any:`None`, optional
+        Keyword-arguments given as a dictionary that are forwarded to the
+        function given in ``func``. Will be merged with ``**kwargs``
+        This is designed for overlapping keywords in ``fourier`` and
+        ``func``. Default: ``None``
+    oversample : :class:`float`, optional
+        Ratio of the period ``2T`` to the last time-point. Default: ``2.0``
+    tol : :class:`float`, optional
+        Aimed relative discretization error, which determines the damping
+        ``a``. Smaller values amplify rounding- and truncation-errors
+        with ``exp(a*t)``. Default: ``1e-8``
+    min_steps : :class:`int`, optional
+        Minimal number of time-steps from ``0`` to the last time-point.
+        Coarser time-grids (like a single time-point) are inverted on an
+        internal grid, that refines the time-step by an integer factor,
+        and the given time-points are selected from it. Default: ``128``
+    executor : :class:`concurrent.futures.Executor` or :any:`None`, optional
+        Executor (like a process-pool) to evaluate ``func`` on. The
+        Laplace-points are split into chunks, that are evaluated in parallel
+        and reassembled afterwards, so ``func`` and the keyword-arguments
+        need to be picklable for a process-pool. Default: ``None``
+    n_jobs : :class:`int` or :any:`None`, optional
+        Number of chunks for the ``executor``
+        (default: the number of CPUs). If no ``executor`` is given,
+        a process-pool with ``n_jobs`` workers is used for this call.
+        Default: ``None``
+    **kwargs
+        Keyword-arguments that are forwarded to the function given in ``func``.
+        Will be merged with ``arg_dict``
+
+    Returns
+    -------
+    :class:`numpy.ndarray`
+        Array with all evaluations in Time-space.
+
+    Raises
+    ------
+    ValueError
+        If `func` is not callable.
+    ValueError
+        If `time` is not positive.
+    ValueError
+        If `time` is not uniformly spaced and increasing.
+    ValueError
+        If `bound` is less than 1.
+    ValueError
+        If `oversample` is not greater than 1.
+    ValueError
+        If `tol` is not within (0, 1).
+    ValueError
+        If `min_steps` is less than 1.
+
+    References
+    ----------
+    .. [R4] Dubner, H., Abate, J., ''Numerical inversion of Laplace
+       transforms by relating them to the finite Fourier cosine transform.''
+       Journal of the ACM, 15(1):115–123, 1968
+    .. [R5] Durbin, F., ''Numerical inversion of Laplace transforms:
+       an efficient improvement to Dubner and Abate's method.''
+       The Computer Journal, 17(4):371–376, 1974
+
+    Notes
+    -----
+    The series covers the interval from ``0`` to the last time-point,
+    so the number of Laplace-points is about
+    ``bound*oversample*max(min_steps, time[-1]/(time[1]-time[0]))``,
+    independent of the number of time-points.
+    This pays off for long and dense time-series.
+
+    The internal time-step needs to resolve the early-time behavior of the
+    function, since the highest frequency is about ``2*bound*pi`` over the
+    internal time-step. Functions with a jump or kink at ``t=0`` converge
+    slowly, so `min_steps` needs to be increased for them.
+
+    Example
+    -------
+    >>> from scipy.special import erfc
+    >>> t = np.linspace(0.1, 1.0, 10)
+    >>> f = lambda x: np.exp(-2*np.sqrt(x))/x
+    >>> np.allclose(fourier(f, t), erfc(1/np.sqrt(t)))
+    True
+    '''
+
+    if arg_dict is None:
+        arg_dict = {}
+    kwargs.update(arg_dict)
+
+    # check and save if 't' is scalar
+    is_scal = np.isscalar(time)
+
+    # ensure that t is handled as an 1d-array
+    time = np.array(time, dtype=float).reshape(-1)
+
+    # get the time-step (only needed to check a grid of several time-points)
+    t_step = time[1] - time[0] if time.size > 1 else 1.0
+
+    # check the input
+    if not callable(func):
+        raise ValueError(
+            "The given function needs to be callable")
+    if not np.all(time > 0.0):
+        raise ValueError(
+            "The time-values need to be positiv for the fourier-algorithm")
+    if t_step <= 0.0 or not np.allclose(np.diff(time), t_step,
+                                        rtol=1e-8, atol=0.0):
+        raise ValueError(
+            "The time-values need to be uniformly spaced and increasing")
+    if bound < 1:
+        raise ValueError(
+            "The boundary needs to be >0 for the fourier-algorithm")
+    if oversample <= 1.0:
+        raise ValueError(
+            "The oversampling needs to be >1 for the fourier-algorithm")
+    if not 0.0 < tol < 1.0:
+        raise ValueError(
+            "The tolerance needs to be within (0,1)")
+    if min_steps < 1:
+        raise ValueError(
+            "The minimal number of time-steps needs to be at least 1")
+    if n_jobs is not None and n_jobs < 1:
+        raise ValueError(
+            "The number of jobs needs to be at least 1")
+
+    # the internal grid refines the time-step by an integer factor
+    refine, size = _fourier_grid(time, oversample, min_steps)
+    # the period 2T holds N internal time-steps and covers all time-points
+    period = size*_fourier_step(time)/refine
+    damp = -np.log(tol)/period
+
+    # sum up the folded frequency-blocks in turn to limit the memory
+    lap_sum = 0.0
+    with _pool(executor, n_jobs) as pool:
+        if pool is not None:
+            func = partial(_parallel, func, pool, n_jobs)
+        for fold in range(bound):
+            freq = 2.0*np.pi*np.arange(fold*size, (fold+1)*size)/period
+            lap_val = np.asarray(func(damp + 1j*freq, **kwargs))
+            # shift the grid to the first time-point
+            shift = np.exp(1j*freq*time[0])
+            if fold == 0:
+                shift[0] *= 0.5
+            lap_sum = lap_sum + \
+                lap_val*shift.reshape((-1,) + (1,)*(lap_val.ndim-1))
+
+    # select the given time-points from the internal grid
+    res = np.real(np.fft.ifft(lap_sum, axis=0)[:time.size*refine:refine])
+    res *= size
+    res *= (2.0*np.exp(damp*time)/period).reshape((-1,) + (1,)*(res.ndim-1))
 
     # reformat the result according to the input
     res = np.squeeze(res)
     if np.ndim(res) == 0 and is_scal:
-        res = np.asscalar(res)
+        res = res.item()
 
     return res
 
 
+def gaver(func, time, bound=16, arg_dict=None, s_tol=1e-12,
+          chunk_size=None, max_memory=None, executor=None, n_jobs=None,
+          **kwargs):
+    '''
+    The gaver-wynn-rho-algorithm for numerical laplace inversion.
+
+    The Gaver-functionals ''Gaver 1966''[R6]_
+
+    .. math::
+       f_{n}\\left(t\\right) =\\frac{n\\ln2}{t}\\binom{2n}{n}
+       \\sum_{i=0}^{n}\\left(-1\\right)^{i}\\binom{n}{i}\\cdot\\tilde{f}
+       \\left(\\left(n+i\\right)\\cdot\\frac{\\ln2}{t}\\right),
+       \\quad n=1,\\ldots,M
+
+    converge slowly to :math:`f\\left(t\\right)`, so the sequence is
+    accelerated by the Wynn-rho-algorithm as proposed by
+    ''Valko, Abate 2004''[R7]_:
+
+    .. math::
+       \\rho_{-1}^{\\left(n\\right)}=0,\\quad
+       \\rho_{0}^{\\left(n\\right)}=f_{n},\\quad
+       \\rho_{k}^{\\left(n\\right)}=\\rho_{k-2}^{\\left(n+1\\right)}+
+       \\frac{k}{\\rho_{k-1}^{\\left(n+1\\right)}-
+       \\rho_{k-1}^{\\left(n\\right)}}
+
+    In the algorithm
+    :math:`2M` corresponds to ``bound``,
+    :math:`\\tilde{f}` to ``func`` and
+    :math:`t` to ``time``.
+    Only real Laplace-points are used, which are the same as in
+    :func:`stehfest` for the same ``bound``.
+
+    Parameters
+    ----------
+    func : :any:`callable`
+        function in laplace-space that shall be inverted.
+        The first argument needs to be the laplace-variable:
+        ``func(s, **kwargs)``
+
+        `func` should be capable of taking numpy arrays as input for `s` and
+        the first shape component of the output of `func` should match the
+        shape of `s`.
+    time : :class:`float` or :class:`numpy.ndarray`
+        time-points to evaluate the function at
+    bound : :class:`int`, optional
+        Number of Laplace-points for each time-point. Default: ``16``
+    arg_dict : :class:`dict` or :any:`None`, optional
+        Keyword-arguments given as a dictionary that are forwarded to the
+        function given in ``func``. Will be merged with ``**kwargs``
+        This is designed for overlapping keywords in ``gaver`` and
+        ``func``. Default: ``None``
+    s_tol : :class:`float` or :any:`None`, optional
+        Relative tolerance to identify coinciding Laplace-points.
+        See: :func:`stehfest`. Default: ``1e-12``
+    chunk_size : :class:`int` or :any:`None`, optional
+        Number of time-points that are inverted at once. Default: ``None``
+    max_memory : :class:`int` or :any:`None`, optional
+        Upper bound in bytes for the Laplace-space values held at once.
+        Ignored if ``chunk_size`` is given. Default: ``None``
+    executor : :class:`concurrent.futures.Executor` or :any:`None`, optional
+        Executor (like a process-pool) to evaluate ``func`` on. The
+        Laplace-points are split into chunks, that are evaluated in parallel
+        and reassembled afterwards, so ``func`` and the keyword-arguments
+        need to be picklable for a process-pool. Default: ``None``
+    n_jobs : :class:`int` or :any:`None`, optional
+        Number of chunks for the ``executor``
+        (default: the number of CPUs). If no ``executor`` is given,
+        a process-pool with ``n_jobs`` workers is used for this call.
+        Default: ``None``
+    **kwargs
+        Keyword-arguments that are forwarded to the function given in ``func``.
+        Will be merged with ``arg_dict``
+
+    Returns
+    -------
+    :class:`numpy.ndarray`
+        Array with all evaluations in Time-space.
+
+    Raises
+    ------
+    ValueError
+        If `func` is not callable.
+    ValueError
+        If `time` is not positive.
+    ValueError
+        If `bound` is not positive.
+    ValueError
+        If `bound` is not even.
+
+    References
+    ----------
+    .. [R6] Gaver, D. P., ''Observing stochastic processes and approximate
+       transform inversion.''
+       Operations Research, 14(3):444–459, 1966
+    .. [R7] Valko, P., Abate, J., ''Comparison of sequence accelerators for
+       the Gaver method of numerical Laplace transform inversion.''
+       Computers & Mathematics with Applications, 48(3):629–636, 2004
+
+    Notes
+    -----
+    The parameter ``time`` needs to be strictly positiv.
+
+    In double precision, the cancellation within the Gaver-functionals
+    limits the useful ``bound`` to about 20. With ``16`` Laplace-points
+    the relative error is about ``1e-7`` for smooth solutions like the
+    diskmodel, but up to ``1e-4`` for steep or oscillating functions.
+
+    Example
+    -------
+    >>> f = lambda x: x**-1
+    >>> gaver(f, [1,10,100])
+    array([ 1.,  1.,  1.])
+    '''
+
+    if arg_dict is None:
+        arg_dict = {}
+    kwargs.update(arg_dict)
+
+    # check and save if 't' is scalar
+    is_scal = np.isscalar(time)
+
+    # ensure that t is handled as an 1d-array
+    time = np.array(time, dtype=float).reshape(-1)
+
+    # check the input
+    if not callable(func):
+        raise ValueError(
+            "The given function needs to be callable")
+    if not np.all(time > 0.0):
+        raise ValueError(
+            "The time-values need to be positiv for the gaver-algorithm")
+    if bound <= 1:
+        raise ValueError(
+            "The boundary needs to be >1 for the gaver-algorithm")
+    if bound % 2 != 0:
+        raise ValueError(
+            "The boundary needs to be even for the gaver-algorithm")
+
+    if chunk_size is not None and chunk_size < 1:
+        raise ValueError(
+            "The chunk-size needs to be at least 1")
+    if max_memory is not None and max_memory <= 0:
+        raise ValueError(
+            "The maximal memory needs to be positiv")
+    if n_jobs is not None and n_jobs < 1:
+        raise ValueError(
+            "The number of jobs needs to be at least 1")
+
+    with _pool(executor, n_jobs) as pool:
+        if pool is not None:
+            func = partial(_parallel, func, pool, n_jobs)
+        res, = _blockwise(lambda t: (_gaver_block(func, t, bound, s_tol,
+                                                  kwargs),),
+                          time, chunk_size, max_memory, bound)
+
+    # reformat the result according to the input
+    res = np.squeeze(res)
+    if np.ndim(res) == 0 and is_scal:
+        res = res.item()
+
+    return res
+
+
+def _gaver_block(func, time, bound, s_tol, kwargs):
+    t_fac = np.log(2.0)/time
+    lap_val = _lap_values(func, t_fac, np.arange(1, bound+1), s_tol, kwargs)
+
+    # all gaver-functionals at once with shape (bound/2, n_t, ...)
+    g_0 = np.tensordot(_g_array(bound), lap_val, axes=(1, 1))
+    g_0 *= t_fac.reshape((1, -1) + (1,)*(g_0.ndim-2))
+
+    # the wynn-rho-algorithm, where the even columns are the estimates
+    # (the last entry of a column holds the latest gaver-functionals, so
+    # for an even number of functionals, the last one is used as well)
+    res = g_0[-1].copy()
+    g_m = np.zeros((g_0.shape[0]+1,) + g_0.shape[1:])
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        for k in range(g_0.shape[0]-1):
+            g_p = g_m[1:-1] + (k+1)/(g_0[1:] - g_0[:-1])
+            if k % 2 == 1:
+                # converged sequences result in divisions by zero
+                valid = np.isfinite(g_p[-1])
+                res[valid] = g_p[-1][valid]
+            g_m, g_0 = g_0, g_p
+
+    return res
+
+
+def _g_array(bound):
+    # weights of the Laplace-values n*ln(2)/t in the gaver-functionals
+    if bound not in _G_LOOKUP:
+        res = np.zeros((bound//2, bound))
+        for n in range(1, bound//2+1):
+            fac = n*_binom(2*n, n)
+            for i in range(n+1):
+                res[n-1, n+i-1] = (-1)**i*fac*_binom(n, i)
+        res.flags.writeable = False
+        _G_LOOKUP[bound] = res
+    return _G_LOOKUP[bound]
+
+
+def _binom(n, k):
+    # exact binomial coefficient
+    return factorial(n)//(factorial(k)*factorial(n-k))
+
+
+def _talbot_block(func, time, bound, kwargs):
+    # contour-points and weights for t=2*bound/5 (so r=1)
+    theta = np.pi*np.arange(1, bound)/bound
+    cot = 1.0/np.tan(theta)
+    nodes = np.concatenate(([1.0], theta*(cot + 1j)))
+    gamma = np.concatenate(([0.5], 1.0 + 1j*(theta + (theta*cot - 1.0)*cot)))
+    weights = gamma*np.exp(0.4*bound*nodes)
+
+    # the contour is scaled with r=2*bound/(5*t)
+    r_fac = 0.4*bound/time
+    fargs = np.outer(r_fac, nodes)
+    lap_val = np.asarray(func(fargs.reshape(-1), **kwargs))
+    lap_val = lap_val.reshape(fargs.shape + lap_val.shape[1:])
+
+    res = np.real(np.tensordot(lap_val, weights, axes=(1, 0)))
+    return res*(r_fac/bound).reshape((-1,) + (1,)*(res.ndim-1))
+
+
+@contextmanager
+def _pool(executor=None, n_jobs=None):
+    # provide the given executor or a temporary process-pool with n_jobs
+    if executor is not None or n_jobs is None or n_jobs < 2:
+        yield executor
+    else:
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor(n_jobs) as pool:
+            yield pool
+
+
+def _parallel(func, executor, n_parts, s, **kwargs):
+    '''
+    Evaluate a function in Laplace-space in parallel.
+
+    Parameters
+    ----------
+    func : :any:`callable`
+        function in laplace-space: ``func(s, **kwargs)``
+    executor : :class:`concurrent.futures.Executor`
+        Executor to evaluate ``func`` on.
+    n_parts : :class:`int` or :any:`None`
+        Number of chunks of Laplace-points. If ``None``,
+        the number of CPUs is used.
+    s : :class:`numpy.ndarray`
+        1D-array of Laplace-points
+    **kwargs
+        Keyword-arguments that are forwarded to ``func``.
+
+    Returns
+    -------
+    :class:`numpy.ndarray`
+        The reassembled output of ``func``.
+    '''
+
+    if n_parts is None:
+        n_parts = cpu_count()
+    chunks = np.array_split(s, max(1, min(n_parts, s.size)))
+    lap_val = executor.map(_evaluate, [func]*len(chunks), chunks,
+                           [kwargs]*len(chunks))
+    return np.concatenate([np.asarray(val) for val in lap_val], axis=0)
+
+
+def _evaluate(func, s, kwargs):
+    # module-level function to be picklable for process-pools
+    return func(s, **kwargs)
+
+
+def _fourier_step(time):
+    # time-step of a uniform grid (a single time-point is its own step)
+    return time[1] - time[0] if time.size > 1 else time[0]
+
+
+def _fourier_grid(time, oversample=2.0, min_steps=128):
+    '''
+    Internal time-grid of the fourier-algorithm.
+
+    Parameters
+    ----------
+    time : :class:`numpy.ndarray`
+        Uniformly spaced and increasing time-points
+    oversample : :class:`float`, optional
+        Ratio of the period ``2T`` to the last time-point. Default: ``2.0``
+    min_steps : :class:`int`, optional
+        Minimal number of internal time-steps up to the last time-point.
+        Default: ``128``
+
+    Returns
+    -------
+    refine : :class:`int`
+        Number of internal time-steps within one given time-step
+    size : :class:`int`
+        Number of internal time-steps within the period ``2T``, which is
+        the number of Laplace-points for each frequency-block
+    '''
+
+    t_step = _fourier_step(time)
+    refine = max(1, int(np.ceil(min_steps*t_step/time[-1])))
+    size = int(np.ceil(oversample*time[-1]*refine/t_step))
+    return refine, size
+
+
+def _blockwise(block, time, chunk_size=None, max_memory=None, n_lap=1):
+    '''
+    Apply an inversion-algorithm blockwise to the time-points.
+
+    Parameters
+    ----------
+    block : :any:`callable`
+        Inversion for a 1D-array of time-points returning a tuple of arrays,
+        where the first axis belongs to the time-points.
+    time : :class:`numpy.ndarray`
+        1D-array of time-points
+    chunk_size : :class:`int` or :any:`None`, optional
+        Number of time-points that are inverted at once. Default: ``None``
+    max_memory : :class:`int` or :any:`None`, optional
+        Upper bound in bytes for the Laplace-space values held at once.
+        Default: ``None``
+    n_lap : :class:`int`, optional
+        Number of Laplace-values per time-point (in floats),
+        to derive the size of the blocks from `max_memory`. Default: ``1``
+
+    Returns
+    -------
+    :class:`tuple` of :class:`numpy.ndarray`
+        The results of `block` for all time-points.
+    '''
+
+    if chunk_size is None and max_memory is None:
+        return block(time)
+
+    # the first time-point determines the size of the result
+    first = block(time[:1])
+    if chunk_size is None:
+        chunk_size = max(1, int(max_memory//((n_lap+1)*first[0].nbytes)))
+    res = tuple(np.empty(time.shape + fir.shape[1:], dtype=fir.dtype)
+                for fir in first)
+    for out, fir in zip(res, first):
+        out[:1] = fir
+    for lo in range(1, time.size, chunk_size):
+        for out, val in zip(res, block(time[lo:lo+chunk_size])):
+            out[lo:lo+chunk_size] = val
+    return res
+
+
+def _stehfest_block(func, time, bound, s_tol, kwargs, adaptive=False,
+                    tol=0.0, error=True):
+    '''
+    The stehfest-algorithm for a block of time-points.
+
+    Parameters
+    ----------
+    func : :any:`callable`
+        function in laplace-space that shall be inverted.
+    time : :class:`numpy.ndarray`
+        1D-array of time-points to evaluate the function at
+    bound : :class:`int`
+        The number of interations (the maximal one if adaptive).
+    s_tol : :class:`float` or :any:`None`
+        Relative tolerance to identify coinciding Laplace-points.
+    kwargs : :class:`dict`
+        Keyword-arguments that are forwarded to the function ``func``.
+    adaptive : :class:`bool`, optional
+        Select the smallest bound that meets ``tol`` for each time-point.
+        Default: ``False``
+    tol : :class:`float`, optional
+        Relative tolerance for the adaptive selection. Default: ``0.0``
+    error : :class:`bool`, optional
+        Whether to estimate the error, which needs a second stehfest-sum
+        if not adaptive. Default: ``True``
+
+    Returns
+    -------
+    res : :class:`numpy.ndarray`
+        Array with all evaluations in Time-space, where the first axis
+        belongs to the time-points.
+    err : :class:`numpy.ndarray`
+        Estimated absolute error of ``res``.
+        Only given if ``error=True`` or ``adaptive=True``.
+    '''
+
+    t_fac = np.log(2.0)/time
+
+    if not adaptive:
+        lap_val = _lap_values(func, t_fac, np.arange(1, bound+1), s_tol,
+                              kwargs)
+        res = _stehfest_sum(lap_val, t_fac, bound)
+        if not error:
+            return (res,)
+        if bound < 4:
+            return res, np.full(res.shape, np.nan)
+        # the Laplace-points for 'bound-2' are the first ones of 'bound'
+        return res, np.abs(res - _stehfest_sum(lap_val, t_fac, bound-2))
+
+    # start with the smallest bound and add two Laplace-points per step
+    first = _lap_values(func, t_fac, np.arange(1, 3), s_tol, kwargs)
+    lap_val = np.empty((time.size, bound) + first.shape[2:], dtype=first.dtype)
+    lap_val[:, :2] = first
+    prev = _stehfest_sum(lap_val, t_fac, 2)
+    res = prev.copy()
+    err = np.full(res.shape, np.nan if bound < 4 else np.inf)
+    best = np.full(time.size, np.inf)
+    # indices of the time-points, that didn't meet the tolerance yet
+    act = np.arange(time.size)
+
+    for n_bound in range(4, bound+1, 2):
+        if act.size == 0:
+            break
+        lap_val[act, n_bound-2:n_bound] = _lap_values(
+            func, t_fac[act], np.arange(n_bound-1, n_bound+1), s_tol, kwargs)
+        cur = _stehfest_sum(lap_val[act], t_fac[act], n_bound)
+        diff = np.abs(cur - prev[act])
+        diff_max = diff.reshape(act.size, -1).max(axis=1)
+        conv = diff_max <= tol*np.abs(cur).reshape(act.size, -1).max(axis=1)
+        # keep the most stable result, if the tolerance is never met
+        upd = conv | (diff_max < best[act])
+        res[act[upd]] = cur[upd]
+        err[act[upd]] = diff[upd]
+        best[act[upd]] = diff_max[upd]
+        prev[act] = cur
+        act = act[~conv]
+
+    return res, err
+
+
+def _lap_values(func, t_fac, n_ind, s_tol, kwargs):
+    # evaluate 'func' at the Laplace-points n*ln(2)/t in one call
+    fargs = np.outer(t_fac, n_ind)
+    if s_tol is None:
+        lap_val = np.asarray(func(fargs.reshape(-1), **kwargs))
+    else:
+        # evaluate 'func' only once for each unique Laplace-point
+        s_uni, s_inv = _unique_points(fargs.reshape(-1), s_tol)
+        lap_val = np.asarray(func(s_uni, **kwargs))[s_inv]
+    return lap_val.reshape(fargs.shape + lap_val.shape[1:])
+
+
+def _stehfest_sum(lap_val, t_fac, bound):
+    # the stehfest-sum over the first 'bound' Laplace-points
+    res = np.tensordot(lap_val[:, :bound], c_array(bound), axes=(1, 0))
+    return res*t_fac.reshape((-1,) + (1,)*(res.ndim-1))
+
+
+def _unique_points(points, rtol=0.0):
+    '''
+    Unique positive points with a relative tolerance.
+
+    Parameters
+    ----------
+    points : :class:`numpy.ndarray`
+        Flat array of positive points.
+    rtol : :class:`float`, optional
+        Relative tolerance to identify two consecutive points.
+        Default: ``0.0``
+
+    Returns
+    -------
+    uni : :class:`numpy.ndarray`
+        The unique points in increasing order.
+    inv : :class:`numpy.ndarray`
+        The indices to reconstruct the given points from the unique ones.
+    '''
+
+    order = np.argsort(points, kind="stable")
+    srt = points[order]
+
+    # a new group starts, if the gap to the predecessor exceeds the tolerance
+    new = np.ones(srt.shape, dtype=bool)
+    new[1:] = srt[1:] > srt[:-1]*(1.0 + rtol)
+
+    inv = np.empty(srt.shape, dtype=int)
+    inv[order] = np.cumsum(new) - 1
+
+    return srt[new], inv
+
+
 def c_array(bound=12):
     '''
     Array of coefficients for the stehfest-algorithm.
 
+    The coefficients are calculated with exact rational arithmetic and
+    rounded to float once. They are cached for the whole process, so
+    repeated calls with the same bound don't recompute them.
+
     Parameters
     ----------
     bound : :class:`int`, optional
@@ -235,34 +1074,60 @@ def c_array(bound=12):
     Returns
     -------
     :class:`numpy.ndarray`
-        Array with all coefficinets needed.
+        Array with all coefficinets needed (read-only).
     '''
 
-    if bound in C_LOOKUP:
-        return C_LOOKUP[bound]
+    bound = int(bound)
+    if bound not in C_LOOKUP:
+        res = np.array([float(c_i) for c_i in _c_exact(bound)])
+        res.flags.writeable = False
+        C_LOOKUP[bound] = res
 
-    return _carr(bound)
+    return C_LOOKUP[bound]
 
 
-def _carr(bound):
-    res = np.zeros(bound)
-    for i in range(1, bound+1):
-        res[i-1] = _c(i, bound)
-    return res
+def save_c_lookup(filename):
+    '''
+    Save all cached stehfest coefficients to a file.
+
+    Parameters
+    ----------
+    filename : :class:`str`
+        Path of the file. It is saved with :func:`numpy.savez`, so the
+        ending ``.npz`` is appended if not present.
+    '''
 
+    np.savez(filename, **{str(bound): C_LOOKUP[bound] for bound in C_LOOKUP})
 
-def _c(i, bound):
-    res = 0.0
-    for k in range(int(floor((i+1)/2.0)), min(i, bound//2)+1):
-        res += _d(k, i, bound)
-    res *= (-1)**(i+bound/2)
-    return res
 
+def load_c_lookup(filename):
+    '''
+    Load stehfest coefficients from a file into the cache.
+
+    Parameters
+    ----------
+    filename : :class:`str`
+        Path of a file created with :func:`save_c_lookup`.
+    '''
 
-def _d(k, i, bound):
-    res = ((float(k))**(bound/2+1))*(factorial(2*k))
-    res /= (factorial(bound/2-k))*(factorial(i-k))*(factorial(2*k-i))
-    res /= (factorial(k)**2)
+    with np.load(filename) as data:
+        for key in data.files:
+            res = np.array(data[key], dtype=float)
+            res.flags.writeable = False
+            C_LOOKUP[int(key)] = res
+
+
+def _c_exact(bound):
+    # exact rational stehfest coefficients as list of fractions
+    half = bound//2
+    res = []
+    for i in range(1, bound+1):
+        c_i = Fraction(0)
+        for k in range((i+1)//2, min(i, half)+1):
+            c_i += Fraction(k**(half+1)*factorial(2*k),
+                            factorial(half-k)*factorial(i-k) *
+                            factorial(2*k-i)*factorial(k)**2)
+        res.append((-1)**(i+half)*c_i)
     return res
 
 
@@ -0,0 +1,215 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for the solutions of the groundwater flow equation.
+"""
+from __future__ import absolute_import, division, print_function
+
+import unittest
+
+import numpy as np
+from scipy.special import kv
+
+from anaflow import gwsolutions as gws
+
+
+class TestDiskSolvers(unittest.TestCase):
+    def setUp(self):
+        self.rad = np.array([1.0, 5.0, 20.0, 200.0])
+        self.time = np.array([10.0, 20.0, 30.0])
+        self.kwargs = dict(Tpart=[1e-4, 2e-4, 5e-5],
+                           Spart=[1e-3, 1e-3, 1e-3],
+                           Rpart=[1.0, 5.0], Qw=-1e-4, rinf=1000.0)
+
+    def test_finite_outer_boundary(self):
+        # large |Cs*rinf| overflow the unscaled bessel functions
+        for inversion in ["talbot", "fourier"]:
+            ref = gws.diskmodel(self.rad, self.time, solver="propagator",
+                                inversion=inversion, **self.kwargs)
+            for solver in ["banded", "sparse"]:
+                res = gws.diskmodel(self.rad, self.time, solver=solver,
+                                    inversion=inversion, **self.kwargs)
+                np.testing.assert_allclose(res, ref, rtol=1e-8, atol=1e-12)
+
+    def test_homogeneous_coefficients(self):
+        # the closed form for a single disk against the propagators
+        s = np.array([1e-2, 1.0, 10.0, 0.1+5.0j, 2.0-30.0j])
+        for rpart in ([0.0, 1000.0], [0.1, np.inf], [0.1, 1000.0]):
+            rpart = np.array(rpart)
+            Cs, X = gws._lap_coeffs(s, rpart, np.array([1e-3]),
+                                    np.array([1e-4]), -1e-4)
+            Qs = -1e-4/(2.0*np.pi*1e-4)/s
+            X_ref = gws._propagator_solve(Cs, rpart, np.array([1e-4]), Qs)
+            np.testing.assert_allclose(X, X_ref, rtol=1e-10, atol=1e-300)
+
+    def test_unsupported_conditions(self):
+        s = np.array([1e-2, 1.0])
+        rpart = np.array([0.0, 1.0, 5.0, np.inf])
+        Tpart = np.array(self.kwargs["Tpart"])
+        Cs = np.outer(np.sqrt(s), np.sqrt(1e-3/Tpart))
+        Qs = -1.0/s
+        self.assertRaises(ValueError, gws._lap_matrix_solve,
+                          Cs, rpart, Tpart, Qs, "propagator")
+        # only a pumping rate for each Laplace-point is supported
+        self.assertRaises(ValueError, gws._lap_matrix_solve,
+                          Cs, rpart, Tpart, np.stack((Qs, Qs), axis=1))
+        self.assertRaises(ValueError, gws.lap_transgwflow_cyl, s, [1.0],
+                          rpart, [1e-3]*3, Tpart, -1.0, solver="dense")
+
+
+class TestTalbot(unittest.TestCase):
+    def setUp(self):
+        self.rad = np.array([1.0, 5.0, 20.0])
+        self.time = np.array([10.0, 100.0, 1000.0])
+
+    def test_complex_laplace(self):
+        # the homogeneous solution in Laplace-space for complex points
+        s = np.array([1e-2+1e-1j, 1.0-2.0j, 10.0+50.0j])
+        res = gws.lap_transgwflow_cyl(s, self.rad, [0.0, np.inf], [1e-3],
+                                      [1e-4], -1e-4)
+        ref = -1.0/(2.0*np.pi*s[:, np.newaxis]) \
+            * kv(0, np.outer(np.sqrt(10.0*s), self.rad))
+        np.testing.assert_allclose(res, ref, rtol=1e-12)
+
+    def test_theis(self):
+        ref = gws.theis(self.rad, self.time, 1e-4, 1e-3, -1e-4)
+        res = gws.diskmodel(self.rad, self.time, [1e-4], [1e-3], [], -1e-4,
+                            inversion="talbot")
+        np.testing.assert_allclose(res, ref, rtol=1e-7, atol=1e-10)
+
+    def test_diskmodel(self):
+        kwargs = dict(Tpart=[1e-4, 2e-4], Spart=[1e-3, 1e-3], Rpart=[2.0],
+                      Qw=-1e-4, rwell=0.1)
+        ref = gws.diskmodel(self.rad, self.time, stehfestn=16, **kwargs)
+        res = gws.diskmodel(self.rad, self.time, inversion="talbot",
+                            **kwargs)
+        # the stehfest-algorithm is the less accurate one
+        np.testing.assert_allclose(res, ref, rtol=1e-5, atol=1e-6)
+
+
+class TestFourier(unittest.TestCase):
+    def test_theis(self):
+        rad = np.array([1.0, 5.0, 20.0])
+        time = np.linspace(10.0, 1000.0, 100)
+        ref = gws.theis(rad, time, 1e-4, 1e-3, -1e-4)
+        res = gws.diskmodel(rad, time, [1e-4], [1e-3], [], -1e-4,
+                            inversion="fourier")
+        np.testing.assert_allclose(res, ref, rtol=1e-7, atol=1e-10)
+        # the series needs a structured time-grid
+        self.assertRaises(ValueError, gws.diskmodel, np.full_like(time, 5.0),
+                          time, [1e-4], [1e-3], [], -1e-4, struc_grid=False,
+                          inversion="fourier")
+
+
+class TestGaver(unittest.TestCase):
+    def test_theis(self):
+        rad = np.array([1.0, 5.0, 20.0])
+        time = np.array([10.0, 100.0, 1000.0])
+        ref = gws.theis(rad, time, 1e-4, 1e-3, -1e-4)
+        res = gws.diskmodel(rad, time, [1e-4], [1e-3], [], -1e-4,
+                            inversion="gaver")
+        np.testing.assert_allclose(res, ref, rtol=1e-4, atol=1e-5)
+
+
+class TestParallel(unittest.TestCase):
+    def setUp(self):
+        self.rad = np.array([1.0, 5.0, 20.0])
+        self.time = np.array([10.0, 100.0, 1000.0])
+        self.kwargs = dict(Tpart=[1e-4, 2e-4], Spart=[1e-3, 1e-3],
+                           Rpart=[2.0], Qw=-1e-4)
+
+    def test_n_jobs(self):
+        ref = gws.diskmodel(self.rad, self.time, **self.kwargs)
+        res = gws.diskmodel(self.rad, self.time, n_jobs=2, **self.kwargs)
+        np.testing.assert_allclose(res, ref, rtol=1e-14)
+        res = gws.diskmodel(self.rad, self.time, n_jobs=2, struc_grid=False,
+                            **self.kwargs)
+        np.testing.assert_allclose(res, np.diag(ref), rtol=1e-14)
+
+
+class TestPropagator(unittest.TestCase):
+    def setUp(self):
+        self.s = np.array([1e-4, 1e-2, 1.0, 10.0])
+        self.Tpart = np.array([1e-4, 2e-4, 5e-5])
+        self.Spart = np.array([1e-3, 1e-3, 2e-3])
+        self.rparts = [np.array([0.0, 1.0, 5.0, np.inf]),
+                       np.array([0.1, 1.0, 5.0, np.inf]),
+                       np.array([0.0, 1.0, 5.0, 50.0]),
+                       np.array([0.1, 1.0, 5.0, 50.0])]
+
+    def test_banded(self):
+        rad = np.array([0.5, 1.0, 3.0, 10.0, 40.0])
+        for rpart in self.rparts:
+            ref = gws.lap_transgwflow_cyl(self.s, rad, rpart, self.Spart,
+                                          self.Tpart, -1e-4)
+            res = gws.lap_transgwflow_cyl(self.s, rad, rpart, self.Spart,
+                                          self.Tpart, -1e-4,
+                                          solver="propagator")
+            np.testing.assert_allclose(res, ref, rtol=1e-10, atol=1e-14)
+
+    def test_parameter_sets(self):
+        # the boundary conditions are selected per parameter set
+        Cs = np.outer(np.sqrt(self.s), np.sqrt(self.Spart/self.Tpart))
+        Qs = -1e-4/(2.0*np.pi*self.Tpart[0])/self.s
+        rpart = np.array(self.rparts)[:, np.newaxis]
+        X = gws._propagator_solve(Cs, rpart, self.Tpart, Qs)
+        self.assertEqual(X.shape, (4, self.s.size, 6))
+        for i, rpart in enumerate(self.rparts):
+            X_ref = gws._propagator_solve(Cs, rpart, self.Tpart, Qs)
+            np.testing.assert_allclose(X[i], X_ref, rtol=1e-14)
+
+    def test_diskmodel(self):
+        rad, time = [1.0, 5.0, 20.0], [10.0, 100.0, 1000.0]
+        kwargs = dict(Tpart=self.Tpart, Spart=self.Spart, Rpart=[1.0, 5.0],
+                      Qw=-1e-4, rwell=0.1, rinf=50.0)
+        ref = gws.diskmodel(rad, time, **kwargs)
+        res = gws.diskmodel(rad, time, solver="propagator", **kwargs)
+        np.testing.assert_allclose(res, ref, rtol=1e-8, atol=1e-12)
+
+
+class TestSchedules(unittest.TestCase):
+    def setUp(self):
+        self.time = np.linspace(10.0, 200.0, 20)
+        self.tstart = [0.0, 50.0]
+        self.rates = [-1e-4, -3e-4]
+        self.disk = dict(Tpart=[1e-4, 2e-4], Spart=[1e-3, 1e-3],
+                         Rpart=[2.0])
+
+    def superpose(self, func, rad, **kwargs):
+        # manually superposed solutions for constant rates
+        ref = func(rad, self.time, Qw=self.rates[0], **kwargs)
+        late = self.time > self.tstart[1]
+        ref[late] += func(rad, self.time[late] - self.tstart[1],
+                          Qw=self.rates[1] - self.rates[0], **kwargs)
+        return ref
+
+    def compare(self, func, rtol, atol=1e-12, **kwargs):
+        schedule = (self.tstart, self.rates)
+        for rad in [1.0, np.array([1.0, 5.0])]:
+            res = func(rad, self.time, Qw=schedule, **kwargs)
+            ref = self.superpose(func, rad, **kwargs)
+            self.assertEqual(res.shape, ref.shape)
+            np.testing.assert_allclose(res, ref, rtol=rtol, atol=atol)
+
+    def test_theis(self):
+        self.compare(gws.theis, 1e-12, T=1e-4, S=1e-3)
+
+    def test_diskmodel(self):
+        # superposition of the shifted unit-responses
+        self.compare(gws.diskmodel, 1e-8, **self.disk)
+
+    def test_fourier(self):
+        # the schedule is folded into the source term in Laplace-space
+        self.compare(gws.diskmodel, 1e-6, atol=1e-8, inversion="fourier",
+                     **self.disk)
+
+    def test_unstructured(self):
+        rad = np.full_like(self.time, 2.0)
+        res = gws.theis(rad, self.time, 1e-4, 1e-3,
+                        (self.tstart, self.rates), struc_grid=False)
+        ref = gws.theis(2.0, self.time, 1e-4, 1e-3,
+                        (self.tstart, self.rates))
+        np.testing.assert_allclose(res, ref, rtol=1e-12)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for the compiled kernels of the Laplace-space solver.
+
+The compiled kernels are only tested if numba is installed.
+The plain python versions of the kernels are always compared to the
+vectorized numpy solver.
+"""
+from __future__ import absolute_import, division, print_function
+
+import unittest
+
+import numpy as np
+
+from anaflow import gwsolutions as gws
+from anaflow import _kernels
+
+
+def _py_func(func):
+    # plain python version of a (possibly) compiled kernel
+    return getattr(func, "py_func", func)
+
+
+class KernelCase(unittest.TestCase):
+    def setUp(self):
+        self.use_numba = _kernels.USE_NUMBA
+        self.rad = np.array([0.05, 0.5, 2.0, 4.0, 10.0, 40.0])
+        self.Tpart = np.array([1e-3, 2e-3, 5e-4, 1e-3])
+        self.Spart = np.array([1e-3, 1e-3, 2e-3, 1e-3])
+        self.rparts = [np.array([0.0, 1.0, 3.0, 5.0, np.inf]),
+                       np.array([0.1, 1.0, 3.0, 5.0, 50.0])]
+        self.points = [np.array([1e-4, 1e-2, 1.0, 10.0]),
+                       np.array([1e-3+1e-3j, 0.1-0.2j, 2.0+5.0j])]
+
+    def tearDown(self):
+        _kernels.USE_NUMBA = self.use_numba
+
+    def compare(self, disk_solve, disk_heads):
+        for s in self.points:
+            Cs = np.outer(np.sqrt(s), np.sqrt(self.Spart/self.Tpart))
+            Qs = -1.0/(2.0*np.pi*self.Tpart[0])/s
+            for rpart in self.rparts:
+                # the coefficients of the equation systems
+                args = gws._disk_bessel(Cs, rpart, self.Tpart)
+                X = disk_solve(*(args + (Qs,)))
+                X = gws._disk_unscale(Cs, rpart, X)
+                _kernels.USE_NUMBA = False
+                X_np = gws._lap_matrix_solve(Cs, rpart, self.Tpart, Qs)
+                np.testing.assert_allclose(
+                    X, X_np, rtol=1e-10, atol=1e-12*np.max(np.abs(X_np)))
+                # the heads from the coefficients
+                pos = np.searchsorted(rpart, self.rad, side="right") - 1
+                Cr = Cs[:, pos]*self.rad
+                A, B = X_np[:, 2*pos], X_np[:, 2*pos+1]
+                i0_val = np.where(A != 0.0, gws._i0(Cr), 0.0)
+                heads = disk_heads(A.reshape(-1), B.reshape(-1),
+                                   i0_val.reshape(-1),
+                                   gws._k0(Cr).reshape(-1))
+                heads_np = gws._lap_heads(Cs, X_np, rpart, self.rad)
+                np.testing.assert_allclose(
+                    heads.reshape(A.shape), heads_np, rtol=1e-12,
+                    atol=1e-12*np.max(np.abs(heads_np)))
+
+
+class TestPythonKernels(KernelCase):
+    def test_python_kernels(self):
+        self.compare(_py_func(_kernels.disk_solve),
+                     _py_func(_kernels.disk_heads))
+
+
+@unittest.skipUnless(_kernels.HAS_NUMBA, "numba is not installed")
+class TestCompiledKernels(KernelCase):
+    def test_compiled(self):
+        # the kernels need to be compiled, not the python fallback
+        for func in [_kernels.disk_solve, _kernels.disk_heads,
+                     _kernels.banded_solve]:
+            self.assertTrue(hasattr(func, "py_func"))
+
+    def test_compiled_kernels(self):
+        self.compare(_kernels.disk_solve, _kernels.disk_heads)
+
+    def test_compiled_solution(self):
+        time = np.logspace(1, 4, 8)
+        kwargs = dict(Tpart=self.Tpart, Spart=self.Spart,
+                      Rpart=self.rparts[0][1:-1], Qw=-1e-3)
+        _kernels.USE_NUMBA = True
+        res = gws.diskmodel(self.rad, time, **kwargs)
+        _kernels.USE_NUMBA = False
+        res_np = gws.diskmodel(self.rad, time, **kwargs)
+        np.testing.assert_allclose(res, res_np, rtol=1e-8, atol=1e-12)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,226 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for the numerical Laplace-inversions.
+"""
+from __future__ import absolute_import, division, print_function
+
+import os
+import shutil
+import tempfile
+import unittest
+
+import numpy as np
+from scipy.special import erfc
+
+from anaflow import laplace
+
+try:
+    from concurrent.futures import ThreadPoolExecutor
+    HAS_FUTURES = True
+except ImportError:  # python 2 without the backport "futures"
+    HAS_FUTURES = False
+
+
+def lap_exp(s):
+    # laplace-transform of exp(-t)
+    return 1.0/(s + 1.0)
+
+
+def lap_erfc(s):
+    # laplace-transform of erfc(1/sqrt(t))
+    return np.exp(-2.0*np.sqrt(s))/s
+
+
+class Counter(object):
+    # laplace-function recording the evaluated points
+    def __init__(self, func):
+        self.func = func
+        self.points = []
+
+    def __call__(self, s):
+        self.points.append(np.array(s, copy=True))
+        return self.func(s)
+
+
+class TestStehfest(unittest.TestCase):
+    def setUp(self):
+        self.time = np.array([0.5, 1.0, 2.0, 4.0, 8.0])
+
+    def test_unique_points(self):
+        # coinciding Laplace-points of t, 2t, 4t, ... are evaluated once
+        func = Counter(lap_exp)
+        res = laplace.stehfest(func, self.time)
+        s_all = np.concatenate(func.points)
+        self.assertEqual(s_all.size, np.unique(s_all).size)
+        self.assertLess(s_all.size, 12*self.time.size)
+        ref = laplace.stehfest(lap_exp, self.time, s_tol=None)
+        np.testing.assert_allclose(res, ref, rtol=1e-12)
+        np.testing.assert_allclose(res, np.exp(-self.time), atol=1e-4)
+
+    def test_error_estimate(self):
+        res, err = laplace.stehfest(lap_exp, self.time, bound=12,
+                                    return_error=True)
+        prev = laplace.stehfest(lap_exp, self.time, bound=10)
+        np.testing.assert_allclose(err, np.abs(res - prev), rtol=1e-8)
+        self.assertTrue(np.all(np.abs(res - np.exp(-self.time)) < 10*err))
+        res, err = laplace.stehfest(lap_exp, 1.0, bound=2, return_error=True)
+        self.assertTrue(np.isnan(err))
+
+    def test_adaptive(self):
+        tol = 1e-6
+        func = Counter(lap_exp)
+        res, err = laplace.stehfest(func, self.time, bound=18, adaptive=True,
+                                    tol=tol, return_error=True)
+        fixed = {n: laplace.stehfest(lap_exp, self.time, bound=n)
+                 for n in range(2, 20, 2)}
+        for i in range(self.time.size):
+            diff = {n: abs(fixed[n][i] - fixed[n-2][i])
+                    for n in range(4, 20, 2)}
+            conv = [n for n in diff if diff[n] <= tol*abs(fixed[n][i])]
+            # the smallest bound meeting the tolerance is selected,
+            # otherwise the one with the smallest difference
+            bound = min(conv) if conv else min(diff, key=diff.get)
+            self.assertAlmostEqual(res[i], fixed[bound][i], places=12)
+            self.assertAlmostEqual(
+                err[i], abs(fixed[bound][i] - fixed[bound-2][i]), places=12)
+        np.testing.assert_allclose(res, np.exp(-self.time), atol=1e-4)
+        # converged time-points are not evaluated with the maximal bound
+        self.assertLess(np.concatenate(func.points).size,
+                        18*self.time.size)
+
+
+class TestTalbot(unittest.TestCase):
+    def setUp(self):
+        self.time = np.linspace(0.1, 5.0, 8)
+
+    def test_inversion(self):
+        np.testing.assert_allclose(laplace.talbot(lap_exp, self.time),
+                                   np.exp(-self.time), atol=1e-11)
+        np.testing.assert_allclose(laplace.talbot(lap_erfc, self.time),
+                                   erfc(1.0/np.sqrt(self.time)), atol=1e-11)
+
+    def test_complex_points(self):
+        # the Laplace-points lie on a contour in the complex plane
+        func = Counter(lap_exp)
+        laplace.talbot(func, self.time)
+        s_all = np.concatenate(func.points)
+        self.assertTrue(np.iscomplexobj(s_all))
+        self.assertTrue(np.all(s_all.real[np.abs(s_all.imag) < 1e-12] > 0))
+
+    def test_blockwise(self):
+        ref = laplace.talbot(lap_erfc, self.time)
+        res = laplace.talbot(lap_erfc, self.time, chunk_size=3)
+        np.testing.assert_allclose(res, ref, rtol=1e-14)
+        self.assertIsInstance(laplace.talbot(lap_exp, 1.0), float)
+
+
+class TestFourier(unittest.TestCase):
+    def test_inversion(self):
+        for time in [np.linspace(0.1, 1.0, 10), np.linspace(0.01, 10.0, 1000),
+                     np.array([1.0, 2.0, 3.0]), np.array([2.0])]:
+            # coarse time-grids are inverted on a refined internal grid
+            res = laplace.fourier(lap_erfc, time)
+            np.testing.assert_allclose(res, erfc(1.0/np.sqrt(time)),
+                                       atol=1e-8)
+
+    def test_laplace_points(self):
+        # one series for all time-points with about 2*bound*oversample
+        # points per internal time-step
+        func = Counter(lap_erfc)
+        laplace.fourier(func, np.linspace(0.01, 10.0, 1000))
+        s_all = np.concatenate(func.points)
+        self.assertLessEqual(s_all.size, 4*2*1000 + 1)
+        self.assertTrue(np.allclose(s_all.real, s_all.real[0]))
+
+    def test_grid(self):
+        self.assertRaises(ValueError, laplace.fourier, lap_erfc,
+                          [1.0, 2.0, 4.0])
+        self.assertRaises(ValueError, laplace.fourier, lap_erfc,
+                          [2.0, 1.0])
+
+
+class TestGaver(unittest.TestCase):
+    def setUp(self):
+        self.time = np.array([0.5, 1.0, 2.0, 4.0, 8.0])
+
+    def test_inversion(self):
+        # an odd (18) and an even (16) number of gaver-functionals
+        for bound, atol in [(16, 1e-4), (18, 1e-6)]:
+            res = laplace.gaver(lap_exp, self.time, bound=bound)
+            np.testing.assert_allclose(res, np.exp(-self.time), atol=atol)
+            res = laplace.gaver(lap_erfc, self.time, bound=bound)
+            np.testing.assert_allclose(res, erfc(1.0/np.sqrt(self.time)),
+                                       atol=atol)
+        self.assertRaises(ValueError, laplace.gaver, lap_exp, 1.0, bound=15)
+
+    def test_laplace_points(self):
+        # only real Laplace-points, the same as for stehfest
+        gav, steh = Counter(lap_exp), Counter(lap_exp)
+        laplace.gaver(gav, self.time, bound=16)
+        laplace.stehfest(steh, self.time, bound=16)
+        s_gav = np.sort(np.concatenate(gav.points))
+        self.assertFalse(np.iscomplexobj(s_gav))
+        np.testing.assert_allclose(
+            s_gav, np.sort(np.concatenate(steh.points)), rtol=1e-14)
+
+
+@unittest.skipUnless(HAS_FUTURES, "concurrent.futures is not available")
+class TestParallel(unittest.TestCase):
+    def setUp(self):
+        self.time = np.linspace(0.1, 5.0, 20)
+
+    def test_executor(self):
+        for invert in [laplace.stehfest, laplace.talbot, laplace.gaver]:
+            ref = invert(lap_erfc, self.time)
+            func = Counter(lap_erfc)
+            with ThreadPoolExecutor(2) as executor:
+                res = invert(func, self.time, executor=executor, n_jobs=3)
+            np.testing.assert_allclose(res, ref, rtol=1e-14)
+            # the Laplace-points are split into n_jobs chunks
+            self.assertEqual(len(func.points), 3)
+
+    def test_process_pool(self):
+        ref = laplace.stehfest(lap_erfc, self.time)
+        res = laplace.stehfest(lap_erfc, self.time, n_jobs=2)
+        np.testing.assert_allclose(res, ref, rtol=1e-14)
+        ref = laplace.fourier(lap_erfc, self.time)
+        res = laplace.fourier(lap_erfc, self.time, n_jobs=2)
+        np.testing.assert_allclose(res, ref, rtol=1e-12, atol=1e-15)
+        self.assertRaises(ValueError, laplace.stehfest, lap_erfc, self.time,
+                          n_jobs=0)
+
+
+class TestStehfestCoefficients(unittest.TestCase):
+    def setUp(self):
+        self.lookup = dict(laplace.C_LOOKUP)
+        self.tmp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        laplace.C_LOOKUP.clear()
+        laplace.C_LOOKUP.update(self.lookup)
+        shutil.rmtree(self.tmp_dir)
+
+    def test_exact(self):
+        np.testing.assert_array_equal(laplace.c_array(2), [2, -2])
+        np.testing.assert_array_equal(laplace.c_array(4), [-2, 26, -48, 24])
+        # the exact coefficients sum up to zero for every bound
+        for bound in [12, 24, 40]:
+            self.assertEqual(sum(laplace._c_exact(bound)), 0)
+        # the cached arrays are shared, so they are read-only
+        self.assertIs(laplace.c_array(12), laplace.c_array(12))
+        self.assertFalse(laplace.c_array(12).flags.writeable)
+
+    def test_lookup_file(self):
+        ref = {bound: laplace.c_array(bound) for bound in [8, 12, 18]}
+        filename = os.path.join(self.tmp_dir, "c_lookup.npz")
+        laplace.save_c_lookup(filename)
+        laplace.C_LOOKUP.clear()
+        laplace.load_c_lookup(filename)
+        for bound in ref:
+            self.assertIn(bound, laplace.C_LOOKUP)
+            np.testing.assert_array_equal(laplace.C_LOOKUP[bound], ref[bound])
+            self.assertFalse(laplace.C_LOOKUP[bound].flags.writeable)
+
+
+if __name__ == "__main__":
+    unittest.main()